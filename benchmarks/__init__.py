@@ -0,0 +1 @@
+"""Performance benchmarks for NaijaCare (synthetic data only)."""
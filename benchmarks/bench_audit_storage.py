@@ -0,0 +1,86 @@
+"""
+Benchmark: retained memory per audit entry for each AuditLog storage layout.
+
+Logs a synthetic corpus into a list of pydantic AuditEntry models (the
+original layout), the default ListStorage of slotted AuditRecords, and the
+columnar ColumnarStorage, then reports bytes retained per entry and the time
+taken by a decision/emergency aggregation over the stored log.
+
+Usage:
+    python benchmarks/bench_audit_storage.py [--entries 200000] [--clinics 500]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add repo root to path for importing naijacare and benchmarks
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import generate_messages
+from src.naijacare.audit import AuditLog, ColumnarStorage, ListStorage
+from src.naijacare.routing import route_message_compact
+
+
+def build(messages, make_storage):
+    audit_log = AuditLog(make_storage())
+    for msg in messages:
+        decision = route_message_compact(msg.text)
+        audit_log.log(
+            msg.sender, decision.decision, msg.text, decision.decision == "ESCALATE_IMMEDIATELY"
+        )
+    return audit_log
+
+
+def retained(fn):
+    gc.collect()
+    tracemalloc.start()
+    kept = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, size
+
+
+def aggregate(records):
+    decisions = {}
+    emergencies = 0
+    for r in records:
+        decisions[r.decision] = decisions.get(r.decision, 0) + 1
+        emergencies += r.has_emergency_flag
+    return decisions, emergencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AuditLog storage memory benchmark")
+    parser.add_argument("--entries", type=int, default=200_000, help="Entries to log")
+    parser.add_argument("--clinics", type=int, default=500, help="Distinct clinics")
+    args = parser.parse_args()
+
+    messages = generate_messages(args.entries, clinics=args.clinics, seed=13)
+    # Warm the routing caches so they are not attributed to the first layout.
+    build(messages[:1000], ListStorage)
+
+    list_log, list_bytes = retained(lambda: build(messages, ListStorage))
+    pydantic_entries, pydantic_bytes = retained(lambda: list_log.entries())
+    columnar_log, columnar_bytes = retained(lambda: build(messages, ColumnarStorage))
+
+    start = time.perf_counter()
+    aggregate(list_log)
+    list_agg = time.perf_counter() - start
+    start = time.perf_counter()
+    storage = columnar_log.storage
+    storage.decision_counts(), storage.emergency_count()
+    columnar_agg = time.perf_counter() - start
+
+    n = len(messages)
+    print(f"{'layout':<26} {'bytes/entry':>12} {'aggregate ms':>13}")
+    print(f"{'pydantic AuditEntry list':<26} {pydantic_bytes / n:>12.1f} {'-':>13}")
+    print(f"{'ListStorage (AuditRecord)':<26} {list_bytes / n:>12.1f} {list_agg * 1e3:>13.1f}")
+    print(f"{'ColumnarStorage':<26} {columnar_bytes / n:>12.1f} {columnar_agg * 1e3:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: pydantic models vs. compact slotted records on the routing hot path.
+
+Routes and audits a synthetic corpus twice -- once building pydantic
+RoutingDecision/AuditEntry objects, once with shared CompactDecision instances
+and slotted AuditRecords -- and reports time and retained memory scaled to one
+million messages.
+
+Usage:
+    python benchmarks/bench_compact.py [--messages 200000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add repo root to path for importing naijacare and benchmarks
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import generate_messages
+from src.naijacare.models import AuditEntry
+from src.naijacare.models.compact import AuditRecord
+from src.naijacare.privacy import hash_clinic_id
+from src.naijacare.routing import route_message, route_message_compact
+
+
+def run_pydantic(messages):
+    kept = []
+    for msg in messages:
+        decision = route_message(msg)
+        entry = AuditEntry(
+            clinic_id_hash=hash_clinic_id(msg.sender),
+            decision=decision.decision,
+            timestamp=datetime.now(),
+            message_length=len(msg.text),
+            has_emergency_flag=decision.decision == "ESCALATE_IMMEDIATELY",
+        )
+        kept.append((decision, entry))
+    return kept
+
+
+def run_compact(messages):
+    kept = []
+    for msg in messages:
+        decision = route_message_compact(msg.text)
+        entry = AuditRecord(
+            hash_clinic_id(msg.sender),
+            decision.decision,
+            datetime.now(),
+            len(msg.text),
+            decision.decision == "ESCALATE_IMMEDIATELY",
+        )
+        kept.append((decision, entry))
+    return kept
+
+
+def measure(fn, messages):
+    gc.collect()
+    start = time.perf_counter()
+    fn(messages)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    kept = fn(messages)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact hot-path representation benchmark")
+    parser.add_argument("--messages", type=int, default=200_000, help="Messages to route")
+    args = parser.parse_args()
+
+    messages = generate_messages(args.messages, seed=11)
+    scale = 1_000_000 / len(messages)
+
+    print(f"{'representation':<16} {'s / 1M msgs':>12} {'MiB / 1M msgs':>14}")
+    results = {}
+    for name, fn in (("pydantic", run_pydantic), ("compact", run_compact)):
+        elapsed, retained = measure(fn, messages)
+        results[name] = (elapsed * scale, retained * scale / 2**20)
+        print(f"{name:<16} {results[name][0]:>12.2f} {results[name][1]:>14.1f}")
+
+    saved_s = results["pydantic"][0] - results["compact"][0]
+    saved_mib = results["pydantic"][1] - results["compact"][1]
+    print(f"\nSaved per 1M messages: {saved_s:.2f} s, {saved_mib:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
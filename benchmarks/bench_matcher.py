@@ -0,0 +1,63 @@
+"""
+Benchmark: compiled keyword matcher vs. per-keyword substring scans.
+
+Shows that the automaton's cost stays flat as the rule list grows, while the
+naive ``any(k in text for k in keywords)`` approach grows linearly.
+
+Usage:
+    python benchmarks/bench_matcher.py [--messages 2000] [--sizes 10,100,500,1000]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+# Add src/ to path for importing naijacare
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.naijacare.matcher import KeywordMatcher
+
+BASE_TEXT = [
+    "patient reports fever and weakness since yesterday",
+    "general follow-up question about clinic hours",
+    "unconscious patient after fall, bleeding from head",
+    "child has cough and mild pain in chest",
+]
+
+
+def synthetic_keywords(count, rng):
+    """Random lowercase keywords that rarely occur in the sample texts."""
+    return ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+            for _ in range(count)]
+
+
+def time_it(fn, texts):
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword matcher scaling benchmark")
+    parser.add_argument("--messages", type=int, default=2000, help="Messages per run")
+    parser.add_argument("--sizes", default="10,100,500,1000", help="Keyword counts to test")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    texts = [rng.choice(BASE_TEXT) for _ in range(args.messages)]
+
+    print(f"{'keywords':>9} {'naive µs/msg':>14} {'automaton µs/msg':>17}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        keywords = synthetic_keywords(size, rng)
+        matcher = KeywordMatcher(keywords)
+        naive = time_it(lambda t, keywords=keywords: [k for k in keywords if k in t], texts)
+        compiled = time_it(matcher.scan, texts)
+        print(f"{size:>9} {naive / len(texts) * 1e6:>14.2f} {compiled / len(texts) * 1e6:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: single-lock vs. lock-striped consent store under threads.
+
+Each thread runs a 90/10 mix of ``check`` and ``grant`` calls against random
+subjects. ``shards=1`` is the single global lock baseline. On a GIL build,
+pure-Python work does not run in parallel, so the striped store mainly avoids
+lock convoying; throughput scales with threads on free-threaded builds.
+
+Usage:
+    python benchmarks/bench_striped.py [--subjects 10000] [--ops 50000]
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add repo root to path for importing naijacare and benchmarks
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import generate_consent_records
+from src.naijacare.consent.striped import StripedConsentStore
+
+SCOPES = {"data_collection", "ai_processing"}
+
+
+def run(store, subject_ids, threads, ops_per_thread):
+    barrier = threading.Barrier(threads + 1)
+    now = datetime.utcnow()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        picks = [rng.choice(subject_ids) for _ in range(ops_per_thread)]
+        barrier.wait()
+        for i, subject_id in enumerate(picks):
+            if i % 10:
+                store.check(subject_id, SCOPES, now)
+            else:
+                store.grant(subject_id, SCOPES, now)
+
+    pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * ops_per_thread / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Striped consent store thread benchmark")
+    parser.add_argument("--subjects", type=int, default=10_000, help="Stored subjects")
+    parser.add_argument("--ops", type=int, default=50_000, help="Operations per thread")
+    args = parser.parse_args()
+
+    records = generate_consent_records(args.subjects, seed=5)
+    subject_ids = [r.subject_id for r in records]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    print(f"{'threads':>7} {'1 lock ops/s':>14} {'16 shards ops/s':>16}")
+    for threads in (1, 2, 4, 8):
+        results = []
+        for shards in (1, 16):
+            store = StripedConsentStore(shards)
+            for record in records:
+                store.upsert(record)
+            results.append(run(store, subject_ids, threads, args.ops))
+        print(f"{threads:>7} {results[0]:>14,.0f} {results[1]:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Synthetic corpus generators for benchmarks (no real patient data)."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+from src.naijacare.consent import ConsentRecord
+from src.naijacare.models import Message
+from src.naijacare.rulesets import GENERAL_KEYWORDS, RED_FLAGS
+
+FILLER = [
+    "patient", "reports", "since", "yesterday", "clinic", "follow-up", "question",
+    "about", "visit", "child", "mother", "after", "fall", "in", "the", "morning",
+]
+
+
+def generate_messages(
+    count: int,
+    red_flag_density: float = 0.1,
+    general_density: float = 0.4,
+    words: tuple[int, int] = (4, 14),
+    clinics: int = 20,
+    seed: int = 0,
+) -> list[Message]:
+    """Messages where roughly ``red_flag_density`` contain a red flag and
+    ``general_density`` a general-symptom keyword (the rest are non-clinical)."""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        text = [rng.choice(FILLER) for _ in range(rng.randint(*words))]
+        roll = rng.random()
+        if roll < red_flag_density:
+            text.insert(rng.randrange(len(text) + 1), rng.choice(RED_FLAGS))
+        elif roll < red_flag_density + general_density:
+            text.insert(rng.randrange(len(text) + 1), rng.choice(GENERAL_KEYWORDS))
+        messages.append(Message(sender=f"clinic_{rng.randrange(clinics)}", text=" ".join(text)))
+    return messages
+
+
+def generate_consent_records(
+    count: int,
+    invalid_fraction: float = 0.2,
+    now: datetime | None = None,
+    seed: int = 0,
+) -> list[ConsentRecord]:
+    """Consent records; ``invalid_fraction`` fail validation for a mix of reasons."""
+    rng = random.Random(seed)
+    now = now or datetime.utcnow()
+    records = []
+    for i in range(count):
+        record = ConsentRecord(subject_id=f"subject-{i}", age_years=rng.randint(16, 80))
+        record.grant({"data_collection", "ai_processing"}, now - timedelta(days=rng.randint(0, 80)))
+        if rng.random() < invalid_fraction:
+            failure = rng.randrange(4)
+            if failure == 0:
+                record.age_years = rng.randint(10, 15)
+            elif failure == 1:
+                record.withdraw(now)
+            elif failure == 2:
+                record.last_reconsent_at = now - timedelta(days=rng.randint(91, 400))
+            else:
+                record.granted_scopes = {"data_collection"}
+        records.append(record)
+    return records
@@ -0,0 +1,203 @@
+"""
+Routing and consent benchmark suite.
+
+Measures throughput, p50/p99 latency and peak traced memory for the hot-path
+functions on a synthetic corpus, saves baselines to JSON and fails when a run
+regresses past a threshold.
+
+Usage:
+    python -m benchmarks.suite --messages 20000 --save-baseline .bench/baseline.json
+    python -m benchmarks.suite --messages 20000 --baseline .bench/baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+# Add repo root to path when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import generate_consent_records, generate_messages
+from src.naijacare.audit import AuditLog
+from src.naijacare.consent import ConsentValidationError, validate_consent
+from src.naijacare.routing import (
+    ROUTING_CONSENT_SCOPES,
+    route_message,
+    route_message_with_consent,
+)
+
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class BenchResult:
+    """Timing and memory figures for one benchmark."""
+
+    name: str
+    ops: int
+    seconds: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["ops_per_sec"] = self.ops_per_sec
+        return data
+
+
+def _percentile(sorted_values: Sequence[int], pct: float) -> int:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(name: str, make_op: Callable[[], Callable], items: Sequence) -> BenchResult:
+    """Time ``op(item)`` for every item, then re-run under tracemalloc for peak memory.
+
+    ``make_op`` is called once per pass so stateful targets (e.g. an AuditLog)
+    start empty each time.
+    """
+    op = make_op()
+    clock = time.perf_counter_ns
+    latencies = []
+    for item in items:
+        start = clock()
+        op(item)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    op = make_op()
+    tracemalloc.start()
+    try:
+        for item in items:
+            op(item)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        ops=len(items),
+        seconds=sum(latencies) / 1e9,
+        p50_us=_percentile(latencies, 50) / 1e3,
+        p99_us=_percentile(latencies, 99) / 1e3,
+        peak_kib=peak / 1024,
+    )
+
+
+def _validate(record) -> None:
+    try:
+        validate_consent(record, ROUTING_CONSENT_SCOPES)
+    except ConsentValidationError:
+        pass
+
+
+def _audit_op():
+    audit_log = AuditLog()
+
+    def op(msg):
+        audit_log.log(msg.sender, "ROUTE_GENERAL", msg.text, False)
+
+    return op
+
+
+def run_suite(
+    messages: int = 10_000,
+    records: int = 10_000,
+    red_flag_density: float = 0.1,
+    seed: int = 0,
+) -> list[BenchResult]:
+    """Run every benchmark on freshly generated synthetic data."""
+    corpus = generate_messages(messages, red_flag_density=red_flag_density, seed=seed)
+    consents = generate_consent_records(records, seed=seed)
+    paired = [(msg, consents[i % len(consents)]) for i, msg in enumerate(corpus)]
+
+    return [
+        measure("route_message", lambda: route_message, corpus),
+        measure(
+            "route_message_with_consent",
+            lambda: lambda pair: route_message_with_consent(*pair),
+            paired,
+        ),
+        measure("validate_consent", lambda: _validate, consents),
+        measure("AuditLog.log", _audit_op, corpus),
+    ]
+
+
+def save_baseline(results: Sequence[BenchResult], path: str | Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({r.name: r.as_dict() for r in results}, indent=2))
+
+
+def find_regressions(
+    results: Sequence[BenchResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """Describe every benchmark whose throughput dropped, or p99 latency grew,
+    by more than ``threshold`` (a fraction) relative to ``baseline``."""
+    problems = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.ops_per_sec < base["ops_per_sec"] * (1 - threshold):
+            problems.append(
+                f"{result.name}: throughput {result.ops_per_sec:,.0f} ops/s "
+                f"< baseline {base['ops_per_sec']:,.0f} ops/s"
+            )
+        if result.p99_us > base["p99_us"] * (1 + threshold):
+            problems.append(
+                f"{result.name}: p99 {result.p99_us:.1f} µs > baseline {base['p99_us']:.1f} µs"
+            )
+    return problems
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="NaijaCare routing/consent benchmarks")
+    parser.add_argument("--messages", type=int, default=10_000, help="Synthetic messages")
+    parser.add_argument("--records", type=int, default=10_000, help="Synthetic consent records")
+    parser.add_argument("--red-flag-density", type=float, default=0.1,
+                        help="Fraction of messages containing a red flag")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed regression as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.messages, args.records, args.red_flag_density, args.seed)
+
+    print(f"{'benchmark':<28} {'ops/s':>12} {'p50 µs':>9} {'p99 µs':>9} {'peak KiB':>10}")
+    for r in results:
+        print(f"{r.name:<28} {r.ops_per_sec:>12,.0f} {r.p50_us:>9.1f} "
+              f"{r.p99_us:>9.1f} {r.peak_kib:>10.1f}")
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"\nBaseline saved to: {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        problems = find_regressions(results, baseline, args.threshold)
+        if problems:
+            print("\nRegressions:")
+            for problem in problems:
+                print(f"  {problem}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
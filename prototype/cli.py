@@ -5,76 +5,156 @@ Simulates WhatsApp-style messages using fixtures.
 No real messaging, no patient data.
 """
 
-import json
-import csv
 import sys
+import tempfile
 from pathlib import Path
 import argparse
 
 # Add src/ to path for importing naijacare
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.naijacare.models import Message
-from src.naijacare.routing import route_message
-from src.naijacare.audit import AuditLog
+from src.naijacare.audit import (
+    AuditExporter,
+    AuditLedger,
+    AuditLog,
+    SpillingStorage,
+    read_export,
+    verify_records,
+)
+from src.naijacare.audit.export import FORMATS, detect_format
+from src.naijacare.audit.ledger import load_checkpoints, save_checkpoints
+from src.naijacare import instrumentation
+from src.naijacare.cache import DecisionCache
+from src.naijacare.pipeline import DEFAULT_CHUNK_SIZE, iter_message_chunks, run_pipeline
 from src.naijacare.privacy import hash_clinic_id
+from src.naijacare.replay import ReplayStats, iter_replay
 
 FIXTURES = Path(__file__).parent / "fixtures" / "sample_messages.jsonl"
 
 
-def load_fixtures(path):
-    """Load sample messages from JSONL."""
-    messages = []
-    with open(path) as f:
-        for line in f:
-            data = json.loads(line)
-            messages.append(Message(**data))
-    return messages
+def print_chunk(messages, batch):
+    """Sink: display each routed message of a chunk as soon as it is decided."""
+    for i, msg in enumerate(messages):
+        print(f"[{msg.sender}] {msg.text}")
+        print(f"  → {batch.decision_name(i)} | Reason: {batch.reason(i)}")
+        flags = batch.flags(i)
+        if flags:
+            print(f"  → Flags: {', '.join(flags)}")
+        for keyword, token, _ in batch.fuzzy(i):
+            print(f"  → Fuzzy: '{token}' read as '{keyword}'")
+        print()
+
+
+def route_parallel(path, audit_log, workers, chunk_size, sink=print_chunk):
+    """Stream chunks across a process pool, merging audit logs in input order."""
+    stats = ReplayStats()
+    chunks = iter_message_chunks(path, chunk_size)
+    for messages, batch, chunk_log in iter_replay(chunks, workers, stats=stats):
+        audit_log.merge(chunk_log)
+        sink(messages, batch)
+    
+    print(f"Replayed {stats.messages} messages in {stats.elapsed:.2f}s "
+          f"({stats.messages_per_sec:,.0f} msg/s) on {workers} workers")
+    for pid, share in sorted(stats.utilisation().items()):
+        print(f"  worker {pid}: {share:.0%} busy")
+    print()
+
+
+def open_exporter(path, export_format, gzip_output):
+    """Exporter for --export-audit; unknown suffixes fall back to CSV as before."""
+    try:
+        detected, compressed = detect_format(path)
+    except ValueError:
+        detected, compressed = "csv", False
+    return AuditExporter(path, export_format or detected, gzip_output or compressed)
 
 
 def main():
     parser = argparse.ArgumentParser(description="NaijaCare routing CLI demo")
     parser.add_argument("--fixtures", default=str(FIXTURES), help="Path to JSONL fixtures")
-    parser.add_argument("--export-audit", help="Export audit log to CSV")
+    parser.add_argument("--export-audit",
+                        help="Stream the audit log to this file while routing "
+                             "(.csv, .jsonl or .ncol, optionally .gz)")
+    parser.add_argument("--export-format", choices=FORMATS,
+                        help="Audit export format (default: from the file name, else csv)")
+    parser.add_argument("--export-gzip", action="store_true", help="Gzip the audit export")
+    parser.add_argument("--checkpoints",
+                        help="Merkle checkpoint file: written alongside --export-audit, "
+                             "read by --verify-audit")
+    parser.add_argument("--verify-audit", metavar="EXPORT",
+                        help="Verify an exported audit file against --checkpoints and exit")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Route across N worker processes (default: 1, sequential)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Messages read, validated and routed per chunk")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="Cache routing outcomes for N distinct texts (sequential mode)")
+    parser.add_argument("--timings", help="Record per-stage latency histograms to this JSON file")
     args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    
+    if args.verify_audit:
+        if not args.checkpoints:
+            parser.error("--verify-audit needs --checkpoints")
+        result = verify_records(read_export(args.verify_audit), load_checkpoints(args.checkpoints))
+        print(f"{'OK' if result.ok else 'TAMPERED'}: {args.verify_audit}: {result.message}")
+        if result.suspect_range:
+            start, end = result.suspect_range
+            print(f"  first mismatch lies in entries {start}..{end - 1}")
+        sys.exit(0 if result.ok else 1)
+    if args.checkpoints and not args.export_audit:
+        parser.error("--checkpoints needs --export-audit (or --verify-audit)")
+    
+    if args.timings:
+        instrumentation.enable()
 
-    audit_log = AuditLog()
+    # Hash-chain the entries so the export can be verified later. Only the latest
+    # chunk of entries is kept in memory; older ones spill to a scratch directory.
+    audit_dir = tempfile.TemporaryDirectory(prefix="naijacare-audit-")
+    audit_log = AuditLog(
+        SpillingStorage(audit_dir.name, ring_size=args.chunk_size),
+        ledger=AuditLedger() if args.checkpoints else None,
+    )
+    
+    # Audit entries are exported chunk by chunk as they are logged
+    exporter = None
+    exported = 0
+    if args.export_audit:
+        exporter = open_exporter(args.export_audit, args.export_format, args.export_gzip)
+    
+    def sink(messages, batch):
+        nonlocal exported
+        print_chunk(messages, batch)
+        if exporter is not None:
+            exported += exporter.write(audit_log.since(exported))
     
     print("NaijaCare prototype (simulation)\n")
-    messages = load_fixtures(args.fixtures)
+    if args.workers > 1:
+        route_parallel(args.fixtures, audit_log, args.workers, args.chunk_size, sink)
+    else:
+        cache = DecisionCache(args.cache_size) if args.cache_size else None
+        run_pipeline(args.fixtures, sink, audit_log, args.chunk_size, cache=cache)
+        if cache is not None:
+            print(f"Decision cache: {cache.stats()}\n")
     
-    for msg in messages:
-        decision = route_message(msg)
-        is_emergency = decision.decision == "ESCALATE_IMMEDIATELY"
-        
-        # Log to audit (privacy-preserving)
-        audit_log.log(
-            clinic_id=msg.sender,
-            decision=decision.decision,
-            message_text=msg.text,
-            has_emergency=is_emergency
+    if exporter is not None:
+        exporter.close()
+        print(
+            f"Audit log exported to: {exporter.path} "
+            f"({exporter.rows} entries, {exporter.format})"
         )
-        
-        # Display output
-        print(f"[{msg.sender}] {msg.text}")
-        print(f"  → {decision.decision} | Reason: {decision.reason}")
-        if decision.flags:
-            print(f"  → Flags: {', '.join(decision.flags)}")
-        print()
     
-    # Export audit if requested
-    if args.export_audit:
-        export_path = Path(args.export_audit)
-        export_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(export_path, 'w', newline='') as f:
-            fieldnames = ["clinic_id_hash", "decision", "timestamp", "message_length", "has_emergency_flag"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for entry in audit_log.entries:
-                writer.writerow(entry.model_dump())
-        
-        print(f"Audit log exported to: {export_path}")
+    if audit_log.ledger is not None:
+        audit_log.ledger.checkpoint()
+        save_checkpoints(args.checkpoints, audit_log.ledger.checkpoints)
+        print(f"Checkpoints written to: {args.checkpoints} (root {audit_log.ledger.root().hex()})")
+    
+    audit_dir.cleanup()
+    
+    if args.timings:
+        instrumentation.export_json(args.timings)
+        print(f"Stage timings exported to: {args.timings}")
 
 
 if __name__ == "__main__":
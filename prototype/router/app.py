@@ -5,76 +5,69 @@ Simulates WhatsApp-style messages using fixtures.
 No real messaging, no patient data.
 """
 
-import json
 import csv
 import sys
+import tempfile
 from pathlib import Path
 import argparse
 
 # Add src/ to path for importing naijacare
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.naijacare.models import Message
-from src.naijacare.routing import route_message
-from src.naijacare.audit import AuditLog
+from src.naijacare.audit import AuditLog, SpillingStorage
+from src.naijacare.pipeline import DEFAULT_CHUNK_SIZE, run_pipeline
 from src.naijacare.privacy import hash_clinic_id
 
 FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_messages.jsonl"
 
 
-def load_fixtures(path):
-    """Load sample messages from JSONL."""
-    messages = []
-    with open(path) as f:
-        for line in f:
-            data = json.loads(line)
-            messages.append(Message(**data))
-    return messages
+def print_chunk(messages, batch):
+    """Sink: display each routed message of a chunk as soon as it is decided."""
+    for i, msg in enumerate(messages):
+        print(f"[{msg.sender}] {msg.text}")
+        print(f"  → {batch.decision_name(i)} | Reason: {batch.reason(i)}")
+        flags = batch.flags(i)
+        if flags:
+            print(f"  → Flags: {', '.join(flags)}")
+        for keyword, token, _ in batch.fuzzy(i):
+            print(f"  → Fuzzy: '{token}' read as '{keyword}'")
+        print()
+
+
+def export_audit(audit_log, path):
+    """Write the audit log to CSV at ``path`` (if given)."""
+    if not path:
+        return
+    export_path = Path(path)
+    export_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(export_path, 'w', newline='') as f:
+        fieldnames = ["clinic_id_hash", "decision", "timestamp", "message_length", "has_emergency_flag"]
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for entry in audit_log:
+            writer.writerow(entry.as_dict())
+    
+    print(f"Audit log exported to: {export_path}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="NaijaCare routing CLI demo")
     parser.add_argument("--fixtures", default=str(FIXTURES), help="Path to JSONL fixtures")
     parser.add_argument("--export-audit", help="Export audit log to CSV")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Messages read, validated and routed per chunk")
     args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
 
-    audit_log = AuditLog()
-    
-    print("NaijaCare prototype (simulation)\n")
-    messages = load_fixtures(args.fixtures)
-    
-    for msg in messages:
-        decision = route_message(msg)
-        is_emergency = decision.decision == "ESCALATE_IMMEDIATELY"
-        
-        # Log to audit (privacy-preserving)
-        audit_log.log(
-            clinic_id=msg.sender,
-            decision=decision.decision,
-            message_text=msg.text,
-            has_emergency=is_emergency
-        )
-        
-        # Display output
-        print(f"[{msg.sender}] {msg.text}")
-        print(f"  → {decision.decision} | Reason: {decision.reason}")
-        if decision.flags:
-            print(f"  → Flags: {', '.join(decision.flags)}")
-        print()
-    
-    # Export audit if requested
-    if args.export_audit:
-        export_path = Path(args.export_audit)
-        export_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(export_path, 'w', newline='') as f:
-            fieldnames = ["clinic_id_hash", "decision", "timestamp", "message_length", "has_emergency_flag"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for entry in audit_log.entries:
-                writer.writerow(entry.model_dump())
-        
-        print(f"Audit log exported to: {export_path}")
+    # Only the latest chunk of audit entries is kept in memory; older ones
+    # spill to a scratch directory until they are exported
+    with tempfile.TemporaryDirectory(prefix="naijacare-audit-") as audit_dir:
+        audit_log = AuditLog(SpillingStorage(audit_dir, ring_size=args.chunk_size))
+        print("NaijaCare prototype (simulation)\n")
+        run_pipeline(args.fixtures, print_chunk, audit_log, args.chunk_size)
+        export_audit(audit_log, args.export_audit)
 
 
 if __name__ == "__main__":
@@ -4,27 +4,162 @@ NaijaCare Web UI (Flask) — Non-clinical prototype demo
 Provides a minimal interface to route simulated messages.
 """
 
+import atexit
+import os
 import sys
 import json
+from dataclasses import asdict
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
+from threading import Lock
+from datetime import datetime, timedelta
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 
 # Add src/ to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.naijacare.models import Message
-from src.naijacare.routing import route_message
-from src.naijacare.audit import AuditLog
+from src.naijacare import instrumentation
+from src.naijacare.audit import (
+    AuditAggregates,
+    AuditIndex,
+    AuditLedger,
+    AuditLog,
+    SQLiteAuditSink,
+    SpillingStorage,
+    iter_export,
+)
+from src.naijacare.audit.aggregates import parse_window
+from src.naijacare.audit.export import FORMATS
+from src.naijacare.audit.ledger import load_checkpoints, save_checkpoints
+from src.naijacare.cache import DecisionCache
+from src.naijacare.ingestion import IngestionService, ThreadedIngestion
 from src.naijacare.privacy import hash_clinic_id
+from src.naijacare.rulesets import RuleSetError, get_active_ruleset, reload_ruleset
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
-audit_log = AuditLog()
+
+# Per-stage latency histograms are opt-in (no-op hooks otherwise)
+if os.environ.get("NAIJACARE_TIMINGS"):
+    instrumentation.enable()
+AUDIT_DIR = os.environ.get("NAIJACARE_AUDIT_DIR") or str(
+    Path(__file__).parent.parent / "data" / "audit"
+)
+AUDIT_RING_SIZE = int(os.environ.get("NAIJACARE_AUDIT_RING", "10000"))
+AUDIT_DB = os.environ.get("NAIJACARE_AUDIT_DB") or os.path.join(AUDIT_DIR, "audit.sqlite3")
+AUDIT_CHECKPOINTS = Path(
+    os.environ.get("NAIJACARE_AUDIT_CHECKPOINTS") or Path(AUDIT_DIR) / "checkpoints.jsonl"
+)
+# Written when the reloaded log stops matching the saved checkpoints; the failed
+# state stays until an operator has investigated and removed this file.
+AUDIT_MISMATCH = AUDIT_CHECKPOINTS.with_name(AUDIT_CHECKPOINTS.name + ".mismatch")
+# The index (~40 B/entry) stays in memory, so unlike the stored records its
+# footprint grows with the log; filtered /api/audit queries need it.
+AUDIT_INDEX = os.environ.get("NAIJACARE_AUDIT_INDEX") == "1"
+# Likewise the Merkle ledger (~64 B/entry) behind checkpoints and proofs
+AUDIT_LEDGER = os.environ.get("NAIJACARE_AUDIT_LEDGER") == "1"
+AUDIT_PAGE_SIZE = 100
+AUDIT_MAX_PAGE_SIZE = 1000
+decision_cache = DecisionCache()
+
+# Audit storage, sink, ledger and ingestion own files and threads under
+# AUDIT_DIR, so they are started once, in the process that serves requests
+# (not the Werkzeug reloader's watcher process), on the first request.
+audit_storage = audit_sink = audit_log = ingestion = None
+audit_ledger_status = None
+_services_lock = Lock()
+
+
+def start_services():
+    """Open the audit log and start ingestion (idempotent)."""
+    global audit_storage, audit_sink, audit_log, ingestion, audit_ledger_status
+    with _services_lock:
+        if ingestion is not None:
+            return
+        # Bounded audit log: recent entries in memory, older ones spilled to gzip
+        # segments. The directory is fixed so history survives restarts; the ring
+        # is written out at exit.
+        audit_storage = SpillingStorage(AUDIT_DIR, ring_size=AUDIT_RING_SIZE)
+        atexit.register(audit_storage.close)
+        # Durable copy: entries are queued and batch-written to SQLite by a background
+        # thread. A full queue holds up the logging lane thread for at most the timeout.
+        audit_sink = SQLiteAuditSink(
+            AUDIT_DB,
+            backpressure=os.environ.get("NAIJACARE_AUDIT_BACKPRESSURE", "block"),
+            block_timeout=float(os.environ.get("NAIJACARE_AUDIT_BLOCK_TIMEOUT", "1")),
+        )
+        # Registered before ingestion.stop so it runs after it: entries still in
+        # flight get written
+        atexit.register(audit_sink.close)
+        # Stats, and the index and ledger when enabled, are kept up to date as
+        # entries are logged, and seeded from any reloaded segments in one pass
+        audit_log = AuditLog(
+            audit_storage,
+            AuditAggregates(),
+            audit_sink,
+            AuditIndex() if AUDIT_INDEX else None,
+            AuditLedger() if AUDIT_LEDGER else None,
+        )
+        audit_log.reindex()
+        if AUDIT_LEDGER:
+            audit_ledger_status = _check_saved_checkpoints()
+            # Also registered before ingestion.stop, so the final checkpoint covers every entry
+            atexit.register(_save_audit_checkpoints)
+        # Emergencies skip the routine backlog via the ingestion service's priority lane
+        ingestion = ThreadedIngestion(IngestionService(audit_log=audit_log, cache=decision_cache))
+        ingestion.start()
+        atexit.register(ingestion.stop)
+
+
+def _check_saved_checkpoints():
+    """Adopt the saved Merkle checkpoints if the reloaded log still matches them.
+
+    A mismatch leaves the checkpoint file untouched as evidence and records a
+    sticky failed state in ``AUDIT_MISMATCH``.
+    """
+    if AUDIT_MISMATCH.exists():
+        return {"ok": False, **json.loads(AUDIT_MISMATCH.read_text())}
+    if not AUDIT_CHECKPOINTS.exists():
+        return {"ok": True, "message": "no saved checkpoints"}
+    saved_checkpoints = load_checkpoints(AUDIT_CHECKPOINTS)
+    if audit_log.ledger.adopt_checkpoints(saved_checkpoints):
+        return {"ok": True, "message": f"log matches {len(saved_checkpoints)} saved checkpoint(s)"}
+    failure = {
+        "message": (
+            f"audit log does not match the saved checkpoints in {AUDIT_CHECKPOINTS.name}; "
+            f"remove {AUDIT_MISMATCH.name} once investigated"
+        ),
+        "detected_at": datetime.now().isoformat(),
+    }
+    AUDIT_MISMATCH.write_text(json.dumps(failure))
+    print(f"WARNING: {failure['message']}", file=sys.stderr)
+    return {"ok": False, **failure}
+
+
+def _save_audit_checkpoints():
+    # After a mismatch the saved checkpoints are kept as they are
+    if not audit_ledger_status["ok"]:
+        return
+    audit_log.ledger.checkpoint()
+    save_checkpoints(AUDIT_CHECKPOINTS, audit_log.ledger.checkpoints)
+
+
+@app.before_request
+def _ensure_services():
+    start_services()
+
 
 # Load fixtures
 FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_messages.jsonl"
 
+# Rule set compiled at startup; POST /api/rules/reload swaps in edits without a restart
+RULES_PATH = Path(os.environ.get(
+    "NAIJACARE_RULES", Path(__file__).parent.parent / "rules" / "default.json"
+))
+if RULES_PATH.exists():
+    reload_ruleset(RULES_PATH)
+
 def load_fixtures():
     """Load sample messages."""
     messages = []
@@ -52,44 +187,204 @@ def api_route():
         timestamp=datetime.now()
     )
     
-    decision = route_message(msg)
-    is_emergency = decision.decision == "ESCALATE_IMMEDIATELY"
-    
-    # Log to audit
-    audit_log.log(
-        clinic_id=msg.sender,
-        decision=decision.decision,
-        message_text=msg.text,
-        has_emergency=is_emergency
-    )
+    # Routed and audited by the ingestion workers
+    decision = ingestion.route(msg)
     
     return jsonify({
         "decision": decision.decision,
         "reason": decision.reason,
-        "flags": decision.flags
+        "flags": decision.flags,
+        "ruleset_version": decision.ruleset_version,
+        "fuzzy_matches": [m.model_dump() for m in decision.fuzzy_matches]
     })
 
 
+@app.route("/api/rules")
+def api_rules():
+    """Return the active rule-set version and sizes."""
+    ruleset = get_active_ruleset()
+    return jsonify({
+        "version": ruleset.version,
+        "red_flags": len(ruleset.red_flags),
+        "general_keywords": len(ruleset.general_keywords)
+    })
+
+
+@app.route("/api/rules/reload", methods=["POST"])
+def api_rules_reload():
+    """Recompile the rule-set file and swap it in atomically."""
+    try:
+        ruleset = reload_ruleset(RULES_PATH)
+    except RuleSetError as exc:
+        return jsonify({"error": str(exc)}), 400
+    decision_cache.invalidate()
+    return jsonify({"version": ruleset.version})
+
+
+@app.route("/api/audit/sink")
+def api_audit_sink():
+    """Return SQLite audit writer metrics (queue depth, drops, flush latency)."""
+    return jsonify(audit_sink.stats())
+
+
+@app.route("/api/cache")
+def api_cache():
+    """Return routing decision cache counters."""
+    return jsonify(decision_cache.stats())
+
+
+@app.route("/api/queue")
+def api_queue():
+    """Return ingestion queue depth and per-lane wait times."""
+    return jsonify(ingestion.metrics())
+
+
+@app.route("/api/metrics/timings")
+def api_timings():
+    """Return per-stage latency histograms (empty unless NAIJACARE_TIMINGS is set)."""
+    return jsonify({
+        "enabled": instrumentation.recorder.enabled,
+        "stages": instrumentation.recorder.snapshot()
+    })
+
+
+def _parse_time(name):
+    """ISO timestamp query arg as a naive local datetime (how entries are stamped)."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
 @app.route("/api/audit")
 def api_audit():
-    """Return audit log (privacy-preserving)."""
-    return jsonify(audit_log.to_list())
+    """Return one page of the audit log (privacy-preserving), optionally filtered.
 
+    Filters: ``clinic`` (raw id, hashed here) or ``clinic_hash``, ``decision``,
+    ``start``/``end`` (ISO timestamps; offsets are converted to server local
+    time) or ``window`` (e.g. 15m, 24h), ``emergency=1``. Pages hold ``limit``
+    entries (default 100, max 1000) in log order, or newest first with
+    ``order=desc``; pass ``next_cursor`` back as ``cursor`` for the next page.
+    Filters need the index (``NAIJACARE_AUDIT_INDEX=1``); without it only
+    unfiltered pages are served.
+    """
+    clinic = request.args.get("clinic")
+    try:
+        start, end = _parse_time("start"), _parse_time("end")
+        window = request.args.get("window")
+        if window:
+            start = datetime.now() - timedelta(seconds=parse_window(window))
+        filters = {
+            "clinic_id_hash": hash_clinic_id(clinic) if clinic else request.args.get("clinic_hash"),
+            "decision": request.args.get("decision"),
+            "start": start,
+            "end": end,
+            "emergency_only": request.args.get("emergency") == "1",
+        }
+        paging = {
+            "cursor": request.args.get("cursor", type=int),
+            "limit": min(max(request.args.get("limit", AUDIT_PAGE_SIZE, type=int), 1),
+                         AUDIT_MAX_PAGE_SIZE),
+            "descending": request.args.get("order") == "desc",
+        }
+        if audit_log.index is not None:
+            page = audit_log.query(**filters, **paging)
+        elif any(filters.values()):
+            return jsonify({
+                "error": "audit filters need the index; restart with NAIJACARE_AUDIT_INDEX=1"
+            }), 400
+        else:
+            page = audit_log.page(**paging)
+    except (ValueError, TypeError) as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify({"entries": page.to_list(), "next_cursor": page.next_cursor})
 
-@app.route("/api/stats")
-def api_stats():
-    """Return session statistics."""
-    decisions = {}
-    for entry in audit_log.entries:
-        decisions[entry.decision] = decisions.get(entry.decision, 0) + 1
-    
+
+def _ledger_disabled():
+    return jsonify({"error": "audit ledger is off; restart with NAIJACARE_AUDIT_LEDGER=1"}), 404
+
+
+@app.route("/api/audit/checkpoints")
+def api_audit_checkpoints():
+    """Return Merkle checkpoints of the audit log, the current root and the startup check."""
+    ledger = audit_log.ledger
+    if ledger is None:
+        return _ledger_disabled()
+    return jsonify({
+        "size": len(ledger),
+        "root": ledger.root().hex(),
+        "chain": ledger.chain_head,
+        "checkpoints": [asdict(c) for c in ledger.checkpoints],
+        "startup_check": audit_ledger_status,
+    })
+
+
+@app.route("/api/audit/proof")
+def api_audit_proof():
+    """Return the inclusion proof of entry ``?index=`` in the tree of ``?size=`` entries."""
+    ledger = audit_log.ledger
+    if ledger is None:
+        return _ledger_disabled()
+    index = request.args.get("index", type=int)
+    size = request.args.get("size", len(ledger), type=int)
+    try:
+        proof = ledger.inclusion_proof(index, size) if index is not None else None
+    except (IndexError, ValueError):
+        proof = None
+    if proof is None:
+        return jsonify({"error": f"index must be in 0..{size - 1} for size <= {len(ledger)}"}), 400
     return jsonify({
-        "total_messages": len(audit_log.entries),
-        "decisions": decisions,
-        "emergency_count": sum(1 for e in audit_log.entries if e.has_emergency_flag)
+        "index": index,
+        "size": size,
+        "leaf": ledger.leaf(index).hex(),
+        "root": ledger.root(size).hex(),
+        "proof": [h.hex() for h in proof],
     })
 
 
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "columnar": "application/octet-stream",
+}
+
+
+@app.route("/api/audit/export")
+def api_audit_export():
+    """Stream audit entries logged since ``?since=<cursor>`` as csv, jsonl or columnar.
+
+    The ``X-Audit-Cursor`` response header is the cursor to pass next time,
+    so scheduled pulls copy only new entries. ``?gzip=1`` compresses the body.
+    """
+    export_format = request.args.get("format", "jsonl")
+    if export_format not in FORMATS:
+        return jsonify({"error": f"format must be one of {list(FORMATS)}"}), 400
+    end = len(audit_log)
+    since = min(max(request.args.get("since", 0, type=int), 0), end)
+    compress = request.args.get("gzip") == "1"
+    body = iter_export(islice(audit_log.since(since), end - since), export_format, compress)
+    response = Response(
+        stream_with_context(body),
+        mimetype="application/gzip" if compress else EXPORT_MIMETYPES[export_format],
+    )
+    response.headers["X-Audit-Cursor"] = str(end)
+    return response
+
+
+@app.route("/api/stats")
+def api_stats():
+    """Return session statistics, optionally for the last ``?window=`` (e.g. 15m, 24h, 7d)."""
+    window = request.args.get("window")
+    try:
+        window = parse_window(window) if window else None
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(audit_log.aggregates.stats(window))
+
+
 if __name__ == "__main__":
     print("NaijaCare Web UI (Non-clinical prototype)")
     print("Starting on http://localhost:5000")
@@ -0,0 +1,30 @@
+"""Privacy-preserving routing audit log and its storage backends."""
+
+from .aggregates import AuditAggregates
+from .columnar import ColumnarStorage
+from .export import AuditExporter, export_since, iter_export, read_export
+from .index import AuditIndex, AuditPage
+from .ledger import AuditLedger, Checkpoint, verify_records
+from .log import AuditLog
+from .spill import SpillingStorage
+from .sqlite import SQLiteAuditSink, read_sqlite
+from .storage import ListStorage
+
+__all__ = [
+    "AuditAggregates",
+    "AuditExporter",
+    "AuditIndex",
+    "AuditLedger",
+    "AuditLog",
+    "AuditPage",
+    "Checkpoint",
+    "ColumnarStorage",
+    "ListStorage",
+    "SQLiteAuditSink",
+    "SpillingStorage",
+    "export_since",
+    "iter_export",
+    "read_export",
+    "read_sqlite",
+    "verify_records",
+]
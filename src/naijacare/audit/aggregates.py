@@ -0,0 +1,134 @@
+"""Incrementally maintained audit statistics: running totals plus time rollups."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Iterable
+
+from ..models.compact import AuditRecord
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+# (name, bucket width in seconds, buckets retained)
+ROLLUPS = (
+    ("minute", 60, 24 * 60),
+    ("hour", 3600, 31 * 24),
+    ("day", 86400, 366),
+)
+# Longest window (seconds) each granularity answers: a query sums at most 120
+# minute or hour buckets, or up to 366 day buckets (the day retention).
+_WINDOW_LIMITS = (("minute", 2 * 3600), ("hour", 5 * 86400), ("day", 366 * 86400))
+MAX_WINDOW = _WINDOW_LIMITS[-1][1]
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_window(value: str) -> int:
+    """Window length in seconds from ``"900"``, ``"15m"``, ``"24h"`` or ``"7d"``.
+
+    Windows longer than the day rollup's retention (``MAX_WINDOW``) are rejected.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([smhd]?)\s*", value)
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid window {value!r}; use e.g. 900, 15m, 24h or 7d")
+    window = int(match.group(1)) * _WINDOW_UNITS[match.group(2) or "s"]
+    _check_window(window)
+    return window
+
+
+def _check_window(window: int) -> None:
+    if not 0 < window <= MAX_WINDOW:
+        days = MAX_WINDOW // 86400
+        raise ValueError(f"Window must be between 1s and {days}d (the stats retention)")
+
+
+class _Bucket:
+    __slots__ = ("total", "emergency", "decisions", "clinics")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.emergency = 0
+        self.decisions: Counter[str] = Counter()
+        self.clinics: Counter[str] = Counter()
+
+    def add(self, record: AuditRecord) -> None:
+        self.total += 1
+        self.emergency += record.has_emergency_flag
+        self.decisions[record.decision] += 1
+        self.clinics[record.clinic_id_hash] += 1
+
+    def merge_into(self, other: _Bucket) -> None:
+        other.total += self.total
+        other.emergency += self.emergency
+        other.decisions.update(self.decisions)
+        other.clinics.update(self.clinics)
+
+    def as_dict(self) -> dict:
+        return {
+            "total_messages": self.total,
+            "emergency_count": self.emergency,
+            "decisions": dict(self.decisions),
+            "clinics": dict(self.clinics),
+        }
+
+
+class AuditAggregates:
+    """Running counters and per-minute/hour/day rollups by decision and clinic hash.
+
+    ``add`` does a constant amount of work per record. Totals are answered
+    directly; a windowed query sums the buckets of the finest granularity
+    that covers the window (at most 120 minute or hour buckets, or 366 day
+    buckets), so its cost does not depend on how many entries have been
+    logged. Window edges are rounded out to whole buckets. Old buckets are
+    dropped past each rollup's retention; windows longer than ``MAX_WINDOW``
+    raise ``ValueError``.
+    """
+
+    def __init__(self) -> None:
+        self.totals = _Bucket()
+        self._rollups: dict[str, tuple[int, int, dict[int, _Bucket]]] = {
+            name: (width, keep, {}) for name, width, keep in ROLLUPS
+        }
+        self._lock = Lock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[AuditRecord]) -> AuditAggregates:
+        aggregates = cls()
+        for record in records:
+            aggregates.add(record)
+        return aggregates
+
+    def add(self, record: AuditRecord) -> None:
+        seconds = (record.timestamp - _EPOCH) // _SECOND
+        with self._lock:
+            self.totals.add(record)
+            for width, keep, buckets in self._rollups.values():
+                start = seconds - seconds % width
+                bucket = buckets.get(start)
+                if bucket is None:
+                    bucket = buckets[start] = _Bucket()
+                    if len(buckets) > keep:
+                        # Once per new bucket, not per record.
+                        del buckets[min(buckets)]
+                bucket.add(record)
+
+    def stats(self, window: int | None = None, now: datetime | None = None) -> dict:
+        """Totals, or counts for the last ``window`` seconds up to ``now``."""
+        if window is not None:
+            _check_window(window)
+        with self._lock:
+            if window is None:
+                return self.totals.as_dict()
+            name = next(n for n, limit in _WINDOW_LIMITS if window <= limit)
+            width, _, buckets = self._rollups[name]
+            end = ((now or datetime.now()) - _EPOCH) // _SECOND
+            first = (end - window) - (end - window) % width
+            result = _Bucket()
+            for start in range(first, end + 1, width):
+                bucket = buckets.get(start)
+                if bucket is not None:
+                    bucket.merge_into(result)
+        return {**result.as_dict(), "window_seconds": window, "granularity": name}
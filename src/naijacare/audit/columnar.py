@@ -0,0 +1,131 @@
+"""Columnar (struct-of-arrays) audit storage."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Iterable, Iterator
+
+from ..models.compact import AuditRecord
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class ColumnarStorage:
+    """Audit records held as parallel typed columns instead of objects.
+
+    Per record this costs a uint32 clinic id (the 16-hex hash string is
+    interned once per clinic), a uint8 decision code, an int64 timestamp in
+    microseconds, a uint32 message length and one bit of an emergency bitset:
+    about 17.1 bytes, against a few hundred for an ``AuditEntry`` model.
+    Records are rebuilt as ``AuditRecord`` objects only when iterated;
+    aggregations run on the columns directly (vectorised with NumPy when it
+    is installed).
+    """
+
+    def __init__(self) -> None:
+        self.clinic_ids = array("I")
+        self.decision_codes = array("B")
+        self.timestamps = array("q")
+        self.lengths = array("I")
+        self.emergency_bits = bytearray()
+        self.clinics: list[str] = []
+        self.decisions: list[str] = []
+        self._clinic_index: dict[str, int] = {}
+        self._decision_index: dict[str, int] = {}
+        self._lock = Lock()
+
+    def _intern_decision(self, decision: str) -> int:
+        code = self._decision_index.get(decision)
+        if code is None:
+            if len(self.decisions) > 255:
+                raise ValueError("ColumnarStorage supports at most 256 distinct decisions")
+            code = self._decision_index[decision] = len(self.decisions)
+            self.decisions.append(decision)
+        return code
+
+    def _intern_clinic(self, clinic_id_hash: str) -> int:
+        clinic = self._clinic_index.get(clinic_id_hash)
+        if clinic is None:
+            clinic = self._clinic_index[clinic_id_hash] = len(self.clinics)
+            self.clinics.append(clinic_id_hash)
+        return clinic
+
+    def clinic_code(self, clinic_id_hash: str) -> int | None:
+        """Column value for a clinic hash, or ``None`` if it was never stored."""
+        return self._clinic_index.get(clinic_id_hash)
+
+    def decision_code(self, decision: str) -> int | None:
+        return self._decision_index.get(decision)
+
+    def append(self, record: AuditRecord) -> None:
+        with self._lock:
+            i = len(self.lengths)
+            self.clinic_ids.append(self._intern_clinic(record.clinic_id_hash))
+            self.decision_codes.append(self._intern_decision(record.decision))
+            self.timestamps.append((record.timestamp - _EPOCH) // _MICROSECOND)
+            if i % 8 == 0:
+                self.emergency_bits.append(0)
+            if record.has_emergency_flag:
+                self.emergency_bits[i >> 3] |= 1 << (i & 7)
+            # Appended last: len() only counts rows whose columns are complete.
+            self.lengths.append(record.message_length)
+
+    def extend(self, records: Iterable[AuditRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def record(self, i: int) -> AuditRecord:
+        return AuditRecord(
+            self.clinics[self.clinic_ids[i]],
+            self.decisions[self.decision_codes[i]],
+            _EPOCH + timedelta(microseconds=self.timestamps[i]),
+            self.lengths[i],
+            bool(self.emergency_bits[i >> 3] >> (i & 7) & 1),
+        )
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        return self.iter_from(0)
+
+    def iter_from(self, position: int) -> Iterator[AuditRecord]:
+        for i in range(position, len(self)):
+            yield self.record(i)
+
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (excluding the interned strings)."""
+        columns = (self.clinic_ids, self.decision_codes, self.timestamps, self.lengths)
+        return sum(c.itemsize * len(c) for c in columns) + len(self.emergency_bits)
+
+    def emergency_count(self) -> int:
+        """Number of records with the emergency flag, by popcount over the bitset."""
+        with self._lock:
+            return bin(int.from_bytes(self.emergency_bits, "little")).count("1")
+
+    def decision_counts(self) -> dict[str, int]:
+        return self._count_codes(self.decision_codes, np.uint8 if np else None, self.decisions)
+
+    def clinic_counts(self) -> dict[str, int]:
+        return self._count_codes(self.clinic_ids, np.uint32 if np else None, self.clinics)
+
+    def _count_codes(self, column: array, dtype, labels: list[str]) -> dict[str, int]:
+        # Under the lock: an array cannot grow while NumPy holds a view of it.
+        with self._lock:
+            n = len(self)
+            if np is not None:
+                counts = np.bincount(
+                    np.frombuffer(column, dtype=dtype, count=n), minlength=len(labels)
+                )
+                return {label: int(c) for label, c in zip(labels, counts) if c}
+            counts = Counter(column[:n])
+            return {labels[code]: count for code, count in counts.items()}
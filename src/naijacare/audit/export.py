@@ -0,0 +1,332 @@
+"""Streaming audit export (CSV, JSONL, columnar binary) with resumable cursors.
+
+Records are written chunk by chunk as they arrive, so an export never holds
+more than ``chunk_size`` rows in memory. Appending ``.gz`` to the file name
+(or passing ``compress=True``) gzips the output.
+
+The ``columnar`` format stores each chunk as a row group::
+
+    magic "NCAUDC01"
+    per group: u32 rows | u32 group bytes | group payload
+    payload:   u16 n clinics, (u16 len, utf-8)* | u8 n decisions, (u8 len, utf-8)*
+               | u32 clinic index * rows | u8 decision index * rows
+               | i64 timestamp µs * rows | u32 message length * rows
+               | emergency bitset, ceil(rows / 8) bytes
+
+All integers are little-endian; timestamps are microseconds since
+1970-01-01 (naive, as logged).
+
+An export cursor is the number of log entries already exported.
+``export_since`` keeps it in a small JSON file and only advances it once the
+export file is complete.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..models.compact import AuditRecord
+from .log import AuditLog
+
+FORMATS = ("csv", "jsonl", "columnar")
+FIELDS = ("clinic_id_hash", "decision", "timestamp", "message_length", "has_emergency_flag")
+DEFAULT_EXPORT_CHUNK = 10_000
+COLUMNAR_MAGIC = b"NCAUDC01"
+
+_GROUP = struct.Struct("<II")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_SUFFIXES = {".csv": "csv", ".jsonl": "jsonl", ".ncol": "columnar"}
+
+
+def detect_format(path: str | Path) -> tuple[str, bool]:
+    """``(format, gzipped)`` from a file name such as ``audit.jsonl.gz``."""
+    path = Path(path)
+    compressed = path.suffix == ".gz"
+    suffix = path.with_suffix("").suffix if compressed else path.suffix
+    if suffix not in _SUFFIXES:
+        raise ValueError(f"Cannot infer audit export format from {path.name!r}")
+    return _SUFFIXES[suffix], compressed
+
+
+def _little_endian(column: array) -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _encode_group(records: list[AuditRecord]) -> bytes:
+    clinics: dict[str, int] = {}
+    decisions: dict[str, int] = {}
+    clinic_ids, codes = array("I"), array("B")
+    timestamps, lengths = array("q"), array("I")
+    bits = bytearray((len(records) + 7) // 8)
+    for i, r in enumerate(records):
+        clinic_ids.append(clinics.setdefault(r.clinic_id_hash, len(clinics)))
+        codes.append(decisions.setdefault(r.decision, len(decisions)))
+        timestamps.append((r.timestamp - _EPOCH) // _MICROSECOND)
+        lengths.append(r.message_length)
+        if r.has_emergency_flag:
+            bits[i >> 3] |= 1 << (i & 7)
+    if len(clinics) > 0xFFFF or len(decisions) > 0xFF:
+        raise ValueError("Too many distinct clinics or decisions for one row group")
+    out = bytearray(struct.pack("<H", len(clinics)))
+    for clinic in clinics:
+        data = clinic.encode()
+        out += struct.pack("<H", len(data)) + data
+    out += struct.pack("<B", len(decisions))
+    for decision in decisions:
+        data = decision.encode()
+        out += struct.pack("<B", len(data)) + data
+    for column in (clinic_ids, codes, timestamps, lengths):
+        out += _little_endian(column)
+    out += bits
+    return bytes(out)
+
+
+def _decode_group(rows: int, payload: bytes) -> Iterator[AuditRecord]:
+    pos = 0
+
+    def strings(count_fmt: str, len_fmt: str) -> list[str]:
+        nonlocal pos
+        (count,) = struct.unpack_from(count_fmt, payload, pos)
+        pos += struct.calcsize(count_fmt)
+        values = []
+        for _ in range(count):
+            (size,) = struct.unpack_from(len_fmt, payload, pos)
+            pos += struct.calcsize(len_fmt)
+            values.append(payload[pos : pos + size].decode())
+            pos += size
+        return values
+
+    clinics = strings("<H", "<H")
+    decisions = strings("<B", "<B")
+    columns = []
+    for typecode in ("I", "B", "q", "I"):
+        column = array(typecode)
+        size = column.itemsize * rows
+        column.frombytes(payload[pos : pos + size])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column)
+        pos += size
+    clinic_ids, codes, timestamps, lengths = columns
+    bits = payload[pos:]
+    for i in range(rows):
+        yield AuditRecord(
+            clinics[clinic_ids[i]],
+            decisions[codes[i]],
+            _EPOCH + timedelta(microseconds=timestamps[i]),
+            lengths[i],
+            bool(bits[i >> 3] >> (i & 7) & 1),
+        )
+
+
+def _header(format: str) -> bytes:
+    if format == "csv":
+        return (",".join(FIELDS) + "\r\n").encode()
+    return COLUMNAR_MAGIC if format == "columnar" else b""
+
+
+def _encode_chunk(format: str, chunk: list[AuditRecord]) -> bytes:
+    if format == "csv":
+        buf = io.StringIO()
+        csv.writer(buf).writerows(
+            (r.clinic_id_hash, r.decision, r.timestamp, r.message_length, r.has_emergency_flag)
+            for r in chunk
+        )
+        return buf.getvalue().encode()
+    if format == "jsonl":
+        return "".join(
+            json.dumps({**r.as_dict(), "timestamp": r.timestamp.isoformat()}) + "\n"
+            for r in chunk
+        ).encode()
+    payload = _encode_group(chunk)
+    return _GROUP.pack(len(chunk), len(payload)) + payload
+
+
+def _chunks(records: Iterable[AuditRecord], chunk_size: int) -> Iterator[list[AuditRecord]]:
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError(f"Unknown audit export format {format!r}; expected {FORMATS}")
+
+
+def iter_export(
+    records: Iterable[AuditRecord],
+    format: str = "jsonl",
+    compress: bool = False,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK,
+) -> Iterator[bytes]:
+    """Encoded export as a stream of byte chunks (e.g. for an HTTP response)."""
+    _check_format(format)
+    gzipper = zlib.compressobj(wbits=31) if compress else None
+    for data in _chain_header(format, records, chunk_size):
+        data = gzipper.compress(data) if gzipper else data
+        if data:
+            yield data
+    if gzipper:
+        yield gzipper.flush()
+
+
+def _chain_header(format: str, records, chunk_size: int) -> Iterator[bytes]:
+    yield _header(format)
+    for chunk in _chunks(records, chunk_size):
+        yield _encode_chunk(format, chunk)
+
+
+class AuditExporter:
+    """Writes audit records to one file as they are handed over.
+
+    ``format`` defaults to the one implied by the file name. The file is
+    written under a temporary name and moved into place on ``close()``, so a
+    reader never sees a half-written export.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        format: str | None = None,
+        compress: bool | None = None,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK,
+    ) -> None:
+        self.path = Path(path)
+        # Only infer from the file name what the caller did not supply.
+        if format is None:
+            format, gzipped = detect_format(self.path)
+            compress = gzipped if compress is None else compress
+        elif compress is None:
+            compress = self.path.suffix == ".gz"
+        _check_format(format)
+        self.format = format
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(self.path.name + ".part")
+        self._raw = open(self._tmp, "wb")
+        self._out = gzip.GzipFile(fileobj=self._raw, mode="wb") if compress else self._raw
+        self._out.write(_header(format))
+
+    def write(self, records: Iterable[AuditRecord]) -> int:
+        """Write ``records`` in chunks; returns how many were written."""
+        written = 0
+        for chunk in _chunks(records, self.chunk_size):
+            self._out.write(_encode_chunk(self.format, chunk))
+            written += len(chunk)
+        self.rows += written
+        return written
+
+    def close(self) -> None:
+        if self._raw.closed:
+            return
+        self._out.close()
+        self._raw.close()
+        os.replace(self._tmp, self.path)
+
+    def __enter__(self) -> AuditExporter:
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._raw.close()
+            self._tmp.unlink(missing_ok=True)
+
+
+def read_export(path: str | Path) -> Iterator[AuditRecord]:
+    """Stream records back from any export written by ``AuditExporter``."""
+    format, compressed = detect_format(path)
+    opener = gzip.open if compressed else open
+    if format == "columnar":
+        with opener(path, "rb") as fh:
+            if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+                raise ValueError(f"{path} is not a columnar audit export")
+            while header := fh.read(_GROUP.size):
+                rows, size = _GROUP.unpack(header)
+                yield from _decode_group(rows, fh.read(size))
+        return
+    with opener(path, "rt", encoding="utf-8", newline="") as fh:
+        rows = csv.DictReader(fh) if format == "csv" else map(json.loads, fh)
+        for row in rows:
+            yield AuditRecord(
+                row["clinic_id_hash"],
+                row["decision"],
+                datetime.fromisoformat(str(row["timestamp"])),
+                int(row["message_length"]),
+                row["has_emergency_flag"] in (True, "True"),
+            )
+
+
+@dataclass
+class ExportResult:
+    path: Path
+    start: int
+    end: int
+
+    @property
+    def rows(self) -> int:
+        return self.end - self.start
+
+
+def load_cursor(cursor_path: str | Path) -> int:
+    cursor_path = Path(cursor_path)
+    if not cursor_path.exists():
+        return 0
+    return json.loads(cursor_path.read_text())["position"]
+
+
+def save_cursor(cursor_path: str | Path, position: int) -> None:
+    cursor_path = Path(cursor_path)
+    tmp = cursor_path.with_name(cursor_path.name + ".tmp")
+    tmp.write_text(json.dumps({"position": position, "saved_at": datetime.now().isoformat()}))
+    os.replace(tmp, cursor_path)
+
+
+def export_since(
+    audit_log: AuditLog,
+    path: str | Path,
+    since: int | None = None,
+    cursor_path: str | Path | None = None,
+    format: str | None = None,
+    compress: bool | None = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK,
+) -> ExportResult:
+    """Export entries appended since a cursor and advance it.
+
+    The start position is ``since`` if given, else the value stored at
+    ``cursor_path`` (0 if absent). Entries logged while the export runs are
+    left for the next pull. The cursor file is updated only after the export
+    file is complete. A start position past the end of the log (e.g. a cursor
+    kept from a different log) raises ``ValueError``.
+    """
+    start = since
+    if start is None:
+        start = load_cursor(cursor_path) if cursor_path is not None else 0
+    end = len(audit_log)
+    if not 0 <= start <= end:
+        raise ValueError(f"Export cursor {start} is outside the audit log (0..{end})")
+    with AuditExporter(path, format, compress, chunk_size) as exporter:
+        exporter.write(islice(audit_log.since(start), end - start))
+    if cursor_path is not None:
+        save_cursor(cursor_path, end)
+    return ExportResult(Path(path), start, end)
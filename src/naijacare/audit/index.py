@@ -0,0 +1,190 @@
+"""Secondary indexes over the audit log for filtered, cursor-paginated queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Iterator, Sequence
+
+from ..models.compact import AuditRecord
+from .columnar import ColumnarStorage
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+DEFAULT_PAGE_SIZE = 100
+
+
+def _walk(
+    positions: Sequence[int],
+    cursor: int | None,
+    descending: bool,
+    lo: int = 0,
+    hi: int | None = None,
+) -> Iterator[int]:
+    """Ascending ``positions[lo:hi]`` strictly after (or before) ``cursor``, without copying."""
+    hi = len(positions) if hi is None else hi
+    if descending:
+        end = hi if cursor is None else bisect_left(positions, cursor, lo, hi)
+        return (positions[i] for i in range(end - 1, lo - 1, -1))
+    start = lo if cursor is None else bisect_right(positions, cursor, lo, hi)
+    return (positions[i] for i in range(start, hi))
+
+
+@dataclass
+class AuditPage:
+    """One page of query results, in log order (or reverse log order)."""
+
+    positions: list[int]
+    records: list[AuditRecord]
+    next_cursor: int | None
+
+    def to_list(self) -> list[dict]:
+        return [r.as_dict() for r in self.records]
+
+
+class AuditIndex:
+    """Postings by clinic hash, decision and emergency flag plus a time index.
+
+    Each logged record gets a position (its offset in the log). The index
+    keeps a columnar copy of every record (about 18 bytes) plus position
+    lists per clinic and per decision, a list of emergency positions and a
+    ``(timestamp, position)`` list sorted by time: roughly 40 bytes per
+    entry in all, held in memory for the life of the index (nothing is
+    spilled, so an indexed log is not memory-bounded even on
+    ``SpillingStorage``). ``add`` is O(1) amortised (the time index is
+    appended to, or insorted near its end when a merged entry arrives
+    slightly out of order).
+
+    ``query`` picks the smallest candidate set among the filters given,
+    bisects to the cursor and checks the remaining filters against the
+    columns, so its cost follows the size of that set and the page, not the
+    length of the log.
+    """
+
+    def __init__(self) -> None:
+        self.columns = ColumnarStorage()
+        self._by_clinic: list[array] = []
+        self._by_decision: list[array] = []
+        self._emergency = array("I")
+        self._times = array("q")
+        self._time_positions = array("I")
+        # True while timestamps arrive in order, so time postings are position-sorted
+        self._time_ordered = True
+        self._lock = Lock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[AuditRecord]) -> AuditIndex:
+        index = cls()
+        for record in records:
+            index.add(record)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def add(self, record: AuditRecord) -> None:
+        with self._lock:
+            columns = self.columns
+            position = len(columns)
+            columns.append(record)
+            clinic = columns.clinic_ids[position]
+            if clinic == len(self._by_clinic):
+                self._by_clinic.append(array("I"))
+            self._by_clinic[clinic].append(position)
+            decision = columns.decision_codes[position]
+            if decision == len(self._by_decision):
+                self._by_decision.append(array("I"))
+            self._by_decision[decision].append(position)
+            if record.has_emergency_flag:
+                self._emergency.append(position)
+            micros = columns.timestamps[position]
+            if not self._times or micros >= self._times[-1]:
+                self._times.append(micros)
+                self._time_positions.append(position)
+            else:
+                self._time_ordered = False
+                at = bisect_right(self._times, micros)
+                self._times.insert(at, micros)
+                self._time_positions.insert(at, position)
+
+    def _time_candidates(
+        self, start: datetime | None, end: datetime | None, cursor: int | None, descending: bool
+    ) -> tuple[int, Iterator[int]]:
+        lo = 0 if start is None else bisect_left(self._times, (start - _EPOCH) // _MICROSECOND)
+        hi = len(self._times)
+        if end is not None:
+            hi = bisect_left(self._times, (end - _EPOCH) // _MICROSECOND)
+        hi = max(lo, hi)
+        if self._time_ordered:
+            return hi - lo, _walk(self._time_positions, cursor, descending, lo, hi)
+        # Out-of-order merges: the window's positions need sorting first
+        positions = sorted(self._time_positions[lo:hi])
+        return hi - lo, _walk(positions, cursor, descending)
+
+    def query(
+        self,
+        clinic_id_hash: str | None = None,
+        decision: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        emergency_only: bool = False,
+        cursor: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        descending: bool = False,
+    ) -> AuditPage:
+        """Records matching every filter given, ``limit`` at a time.
+
+        ``start`` is inclusive and ``end`` exclusive. Pass the returned
+        ``next_cursor`` back as ``cursor`` for the following page; it is
+        ``None`` on the last page. ``descending`` walks newest first.
+        """
+        with self._lock:
+            columns = self.columns
+            clinic = decision_code = None
+            candidates: list[tuple[int, Iterator[int]]] = []
+            if clinic_id_hash is not None:
+                clinic = columns.clinic_code(clinic_id_hash)
+                if clinic is None:
+                    return AuditPage([], [], None)
+                postings = self._by_clinic[clinic]
+                candidates.append((len(postings), _walk(postings, cursor, descending)))
+            if decision is not None:
+                decision_code = columns.decision_code(decision)
+                if decision_code is None:
+                    return AuditPage([], [], None)
+                postings = self._by_decision[decision_code]
+                candidates.append((len(postings), _walk(postings, cursor, descending)))
+            if emergency_only:
+                postings = self._emergency
+                candidates.append((len(postings), _walk(postings, cursor, descending)))
+            if start is not None or end is not None:
+                candidates.append(self._time_candidates(start, end, cursor, descending))
+            if candidates:
+                walk = min(candidates, key=lambda c: c[0])[1]
+            else:
+                walk = _walk(range(len(columns)), cursor, descending)
+
+            lo = None if start is None else (start - _EPOCH) // _MICROSECOND
+            hi = None if end is None else (end - _EPOCH) // _MICROSECOND
+            bits = columns.emergency_bits
+
+            def matches(p: int) -> bool:
+                if clinic is not None and columns.clinic_ids[p] != clinic:
+                    return False
+                if decision_code is not None and columns.decision_codes[p] != decision_code:
+                    return False
+                if emergency_only and not bits[p >> 3] >> (p & 7) & 1:
+                    return False
+                micros = columns.timestamps[p]
+                return (lo is None or micros >= lo) and (hi is None or micros < hi)
+
+            positions = list(islice(filter(matches, walk), limit + 1))
+            next_cursor = None
+            if len(positions) > limit:
+                positions = positions[:limit]
+                next_cursor = positions[-1] if positions else None
+            return AuditPage(positions, [columns.record(p) for p in positions], next_cursor)
@@ -0,0 +1,388 @@
+"""Tamper-evident audit trail: a hash chain plus an incremental Merkle tree.
+
+Hashing follows RFC 6962 (Certificate Transparency)::
+
+    leaf hash = SHA-256(0x00 || canonical record bytes)
+    node hash = SHA-256(0x01 || left || right)
+
+and trees over any number of leaves split at the largest power of two
+below the size, so inclusion and consistency proofs are the RFC 6962 ones.
+Every leaf also extends a running chain, ``chain = SHA-256(chain || leaf)``.
+
+A checkpoint records ``(size, root, chain)`` at a point in time. Anyone
+holding a checkpoint can check a single entry (inclusion proof), a run of
+entries (range proof), or that a later checkpoint only appended to it
+(consistency proof), each with O(log n) hashes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Iterator, Sequence
+
+from ..models.compact import AuditRecord
+
+DEFAULT_CHECKPOINT_INTERVAL = 1024
+HASH_SIZE = 32
+_EMPTY_ROOT = hashlib.sha256(b"").digest()
+_CHAIN_START = bytes(HASH_SIZE)
+
+
+def record_bytes(record: AuditRecord) -> bytes:
+    """Canonical encoding of a record; identical for every export format."""
+    return json.dumps(
+        [
+            record.clinic_id_hash,
+            record.decision,
+            record.timestamp.isoformat(),
+            record.message_length,
+            bool(record.has_emergency_flag),
+        ],
+        separators=(",", ":"),
+    ).encode()
+
+
+def leaf_hash(record: AuditRecord) -> bytes:
+    return hashlib.sha256(b"\x00" + record_bytes(record)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly below ``size`` (``size`` > 1)."""
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    size: int
+    root: str
+    chain: str
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class AuditLedger:
+    """Append-only Merkle tree and hash chain over audit records.
+
+    The tree is stored as one packed bytearray of 32-byte hashes per level,
+    holding only complete (power-of-two) subtrees: each append hashes the
+    leaf, extends the chain and combines at most a run of finished pairs,
+    so it is O(1) amortised and needs about 64 bytes per entry, all kept in
+    memory (the ledger does not spill). Roots and
+    proofs for any size up to the current one reuse those subtrees and cost
+    O(log n). A checkpoint is taken automatically every
+    ``checkpoint_interval`` entries (0 disables that).
+    """
+
+    def __init__(self, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL) -> None:
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints: list[Checkpoint] = []
+        self._levels: list[bytearray] = []
+        self._chain = _CHAIN_START
+        self._size = 0
+        self._lock = Lock()
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[AuditRecord], checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> AuditLedger:
+        ledger = cls(checkpoint_interval)
+        for record in records:
+            ledger.add(record)
+        return ledger
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def chain_head(self) -> str:
+        return self._chain.hex()
+
+    def add(self, record: AuditRecord) -> None:
+        leaf = leaf_hash(record)
+        with self._lock:
+            self._chain = hashlib.sha256(self._chain + leaf).digest()
+            node, level, index = leaf, 0, self._size
+            while True:
+                if level == len(self._levels):
+                    self._levels.append(bytearray())
+                self._levels[level] += node
+                if not index & 1:
+                    break
+                node = _node(bytes(self._levels[level][-2 * HASH_SIZE : -HASH_SIZE]), node)
+                index >>= 1
+                level += 1
+            self._size += 1
+            if self.checkpoint_interval and self._size % self.checkpoint_interval == 0:
+                self._checkpoint()
+
+    def _checkpoint(self) -> Checkpoint:
+        checkpoint = Checkpoint(self._size, self._hash(0, self._size).hex(), self._chain.hex())
+        self.checkpoints.append(checkpoint)
+        return checkpoint
+
+    def checkpoint(self) -> Checkpoint:
+        """Record a checkpoint at the current size (e.g. before an export)."""
+        with self._lock:
+            if self.checkpoints and self.checkpoints[-1].size == self._size:
+                return self.checkpoints[-1]
+            return self._checkpoint()
+
+    def adopt_checkpoints(self, checkpoints: Sequence[Checkpoint]) -> bool:
+        """Take over checkpoints saved by an earlier run over the same log.
+
+        The latest saved checkpoint must match this ledger's root at its size,
+        i.e. the log was only appended to since. Otherwise nothing is adopted
+        and ``False`` is returned. Checkpoints this ledger took past that size
+        are kept after the adopted ones.
+        """
+        if not checkpoints:
+            return True
+        saved = sorted(checkpoints, key=lambda c: c.size)
+        last = saved[-1]
+        with self._lock:
+            if last.size > self._size or self._hash(0, last.size).hex() != last.root:
+                return False
+            self.checkpoints = saved + [c for c in self.checkpoints if c.size > last.size]
+        return True
+
+    def _hash(self, lo: int, hi: int) -> bytes:
+        """Root of the subtree over leaves ``[lo, hi)``."""
+        width = hi - lo
+        if width == 0:
+            return _EMPTY_ROOT
+        if width & (width - 1) == 0:
+            level = width.bit_length() - 1
+            start = (lo >> level) * HASH_SIZE
+            return bytes(self._levels[level][start : start + HASH_SIZE])
+        k = _split(width)
+        return _node(self._hash(lo, lo + k), self._hash(lo + k, hi))
+
+    def _size_arg(self, size: int | None) -> int:
+        size = self._size if size is None else size
+        if not 0 <= size <= self._size:
+            raise ValueError(f"Tree size {size} is outside 0..{self._size}")
+        return size
+
+    def root(self, size: int | None = None) -> bytes:
+        with self._lock:
+            return self._hash(0, self._size_arg(size))
+
+    def leaf(self, index: int) -> bytes:
+        with self._lock:
+            if not 0 <= index < self._size:
+                raise IndexError(index)
+            return self._hash(index, index + 1)
+
+    def inclusion_proof(self, index: int, size: int | None = None) -> list[bytes]:
+        """RFC 6962 audit path for leaf ``index`` in the tree of ``size`` leaves."""
+        with self._lock:
+            size = self._size_arg(size)
+            if not 0 <= index < size:
+                raise IndexError(index)
+            path: list[bytes] = []
+            lo, hi = 0, size
+            while hi - lo > 1:
+                k = _split(hi - lo)
+                if index < lo + k:
+                    path.append(self._hash(lo + k, hi))
+                    hi = lo + k
+                else:
+                    path.append(self._hash(lo, lo + k))
+                    lo += k
+            return path[::-1]
+
+    def consistency_proof(self, old_size: int, new_size: int | None = None) -> list[bytes]:
+        """RFC 6962 proof that the tree of ``new_size`` extends that of ``old_size``."""
+        with self._lock:
+            new_size = self._size_arg(new_size)
+            if not 0 <= old_size <= new_size:
+                raise ValueError(f"Old size {old_size} is outside 0..{new_size}")
+            if old_size in (0, new_size):
+                return []
+            proof: list[bytes] = []
+            m, lo, hi, complete = old_size, 0, new_size, True
+            while m != hi - lo:
+                k = _split(hi - lo)
+                if m <= k:
+                    proof.append(self._hash(lo + k, hi))
+                    hi = lo + k
+                else:
+                    proof.append(self._hash(lo, lo + k))
+                    m -= k
+                    lo += k
+                    complete = False
+            if not complete:
+                proof.append(self._hash(lo, hi))
+            return proof[::-1]
+
+    def range_proof(self, start: int, end: int, size: int | None = None) -> list[bytes]:
+        """Hashes of the subtrees outside ``[start, end)``, left to right.
+
+        With the leaves in the range these rebuild the root (``verify_range``);
+        there are at most about 2·log2(n) of them.
+        """
+        with self._lock:
+            size = self._size_arg(size)
+            if not 0 <= start < end <= size:
+                raise ValueError(f"Range {start}..{end} is outside 0..{size}")
+            proof: list[bytes] = []
+
+            def walk(lo: int, hi: int) -> None:
+                if hi <= start or lo >= end:
+                    proof.append(self._hash(lo, hi))
+                elif not (start <= lo and hi <= end):
+                    k = _split(hi - lo)
+                    walk(lo, lo + k)
+                    walk(lo + k, hi)
+
+            walk(0, size)
+            return proof
+
+
+def verify_inclusion(
+    leaf: bytes, index: int, size: int, proof: Sequence[bytes], root: bytes
+) -> bool:
+    """Check an RFC 6962 audit path (RFC 9162, section 2.1.3.2)."""
+    if not 0 <= index < size:
+        return False
+    fn, sn, r = index, size - 1, leaf
+    for p in proof:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = _node(p, r)
+            while fn and not fn & 1:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = _node(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+def verify_consistency(
+    old_size: int, new_size: int, old_root: bytes, new_root: bytes, proof: Sequence[bytes]
+) -> bool:
+    """Check an RFC 6962 consistency proof (RFC 9162, section 2.1.4.2)."""
+    if old_size == new_size:
+        return not proof and old_root == new_root
+    if old_size == 0:
+        return not proof
+    if old_size > new_size or not proof:
+        return False
+    proof = list(proof)
+    if old_size & (old_size - 1) == 0:
+        proof.insert(0, old_root)
+    fn, sn = old_size - 1, new_size - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+    fr = sr = proof[0]
+    for c in proof[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr, sr = _node(c, fr), _node(c, sr)
+            while fn and not fn & 1:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = _node(sr, c)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and fr == old_root and sr == new_root
+
+
+def verify_range(
+    leaves: Sequence[bytes], start: int, size: int, proof: Sequence[bytes], root: bytes
+) -> bool:
+    """Check leaf hashes ``leaves`` sit at ``start..`` in the tree with ``root``."""
+    end = start + len(leaves)
+    if not leaves or not 0 <= start < end <= size:
+        return False
+    hashes = iter(proof)
+
+    def rebuild(lo: int, hi: int) -> bytes:
+        if hi <= start or lo >= end:
+            return next(hashes)
+        if hi - lo == 1:
+            return leaves[lo - start]
+        k = _split(hi - lo)
+        return _node(rebuild(lo, lo + k), rebuild(lo + k, hi))
+
+    try:
+        rebuilt = rebuild(0, size)
+    except StopIteration:
+        return False
+    return rebuilt == root and next(hashes, None) is None
+
+
+def save_checkpoints(path: str | Path, checkpoints: Iterable[Checkpoint]) -> None:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text("".join(json.dumps(asdict(c)) + "\n" for c in checkpoints))
+    os.replace(tmp, path)
+
+
+def load_checkpoints(path: str | Path) -> list[Checkpoint]:
+    with open(path, encoding="utf-8") as fh:
+        return [Checkpoint(**json.loads(line)) for line in fh if line.strip()]
+
+
+@dataclass
+class LedgerVerification:
+    ok: bool
+    entries: int
+    checked: int
+    message: str
+    # Entries between the last good and the first failing checkpoint
+    suspect_range: tuple[int, int] | None = None
+
+
+def verify_records(
+    records: Iterable[AuditRecord], checkpoints: Sequence[Checkpoint]
+) -> LedgerVerification:
+    """Recompute the tree over ``records`` and compare it with each checkpoint."""
+    ordered = sorted((c for c in checkpoints if c.size), key=lambda c: c.size)
+    pending: Iterator[Checkpoint] = iter(ordered)
+    target = next(pending, None)
+    ledger = AuditLedger(checkpoint_interval=0)
+    checked, good = 0, 0
+
+    def compare(checkpoint: Checkpoint) -> str | None:
+        if ledger.root().hex() != checkpoint.root or ledger.chain_head != checkpoint.chain:
+            return (
+                f"entries 0..{checkpoint.size} do not match the checkpoint "
+                f"taken at {checkpoint.created_at}"
+            )
+        return None
+
+    for record in records:
+        ledger.add(record)
+        while target is not None and target.size == len(ledger):
+            problem = compare(target)
+            if problem:
+                return LedgerVerification(False, len(ledger), checked, problem, (good, target.size))
+            checked += 1
+            good = target.size
+            target = next(pending, None)
+    if target is not None and target.size > len(ledger):
+        message = f"export has {len(ledger)} entries but a checkpoint covers {target.size}"
+        return LedgerVerification(False, len(ledger), checked, message, (good, target.size))
+    if checked == 0 and len(ledger):
+        return LedgerVerification(False, len(ledger), 0, "no checkpoint covers these entries")
+    tail = len(ledger) - good
+    message = f"{checked} checkpoint(s) verified over {good} entries"
+    if tail:
+        message += f"; last {tail} entries are not covered by a checkpoint"
+    return LedgerVerification(True, len(ledger), checked, message)
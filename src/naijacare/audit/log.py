@@ -0,0 +1,179 @@
+"""Audit logging (privacy-preserving)."""
+
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+
+from .. import instrumentation
+from ..models.compact import AuditRecord
+from ..privacy import hash_clinic_id
+from .index import DEFAULT_PAGE_SIZE, AuditPage
+from .storage import ListStorage
+
+
+class AuditLog:
+    """Audit store (prototype).
+
+    Entries are kept as slotted ``AuditRecord`` objects; ``entries()``
+    converts every stored record to a pydantic ``AuditEntry`` model on each
+    call (log new entries with ``log`` or ``merge``). Records live in a
+    pluggable ``storage`` backend: an unbounded in-memory list by default, or
+    e.g. ``SpillingStorage`` for long-running servers. Passing an
+    ``AuditAggregates`` keeps running statistics up to date as entries are
+    logged, so stats never need a scan of the records. A ``sink`` (e.g.
+    ``SQLiteAuditSink``) is handed every entry as well, for durable copies
+    written off the request path. An ``AuditIndex`` serves filtered,
+    paginated queries (see ``query``), and an ``AuditLedger`` hash-chains
+    every entry into a Merkle tree so the log can be checked for tampering.
+
+    ``log`` and ``merge`` may be called from several threads: storage and
+    observers are updated under one lock so positions stay aligned, while
+    the sink is handed entries outside it, so sink backpressure only holds
+    up the calling thread.
+    """
+
+    def __init__(self, storage=None, aggregates=None, sink=None, index=None, ledger=None):
+        self._storage = storage if storage is not None else ListStorage()
+        self._aggregates = aggregates
+        self._sink = sink
+        self._index = index
+        self._ledger = ledger
+        self._lock = Lock()
+
+    def __getstate__(self):
+        # Replay workers ship their logs between processes; locks do not pickle.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @property
+    def storage(self):
+        return self._storage
+
+    @property
+    def aggregates(self):
+        return self._aggregates
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def ledger(self):
+        return self._ledger
+
+    def entries(self, lazy=False):
+        """Every entry as an ``AuditEntry`` model, converted on each call.
+
+        Returns a tuple, or with ``lazy=True`` an iterator that converts one
+        record at a time.
+        """
+        models = (r.to_model() for r in self._storage)
+        return models if lazy else tuple(models)
+
+    def __len__(self):
+        return len(self._storage)
+
+    def __iter__(self):
+        """Iterate the compact records without converting them."""
+        return iter(self._storage)
+
+    def since(self, position):
+        """Iterate records appended at or after ``position`` (an export cursor)."""
+        return self._storage.iter_from(position)
+
+    def log(self, clinic_id: str, decision: str, message_text: str, has_emergency: bool):
+        """Log a routing decision without storing raw message content."""
+        recorder = instrumentation.recorder
+        started = recorder.start()
+        clinic_id_hash = hash_clinic_id(clinic_id)
+        started = recorder.lap("audit.hash", started)
+        entry = AuditRecord(
+            clinic_id_hash,
+            decision,
+            datetime.now(),
+            len(message_text),
+            has_emergency
+        )
+        started = recorder.lap("audit.entry_build", started)
+        with self._lock:
+            self._storage.append(entry)
+            started = recorder.lap("audit.append", started)
+            if self._aggregates is not None:
+                self._aggregates.add(entry)
+                started = recorder.lap("audit.aggregate", started)
+            if self._index is not None:
+                self._index.add(entry)
+                started = recorder.lap("audit.index", started)
+            if self._ledger is not None:
+                self._ledger.add(entry)
+                started = recorder.lap("audit.ledger", started)
+        if self._sink is not None:
+            self._sink.submit(entry)
+            recorder.lap("audit.sink", started)
+
+    def merge(self, other: "AuditLog"):
+        """Append another log's entries (e.g. from a replay worker) in order."""
+        observers = [o for o in (self._aggregates, self._index, self._ledger) if o is not None]
+        if not observers and self._sink is None:
+            with self._lock:
+                self._storage.extend(other)
+            return
+        records = list(other)
+        with self._lock:
+            self._storage.extend(records)
+            for observer in observers:
+                for record in records:
+                    observer.add(record)
+        if self._sink is not None:
+            self._sink.extend(records)
+
+    def reindex(self):
+        """Feed every stored record to the aggregates, index and ledger in one pass.
+
+        For storage reopened with history (e.g. spilled segments) and observers
+        created empty: the records are read once rather than once per observer.
+        """
+        observers = [o for o in (self._aggregates, self._index, self._ledger) if o is not None]
+        if observers:
+            for record in self._storage:
+                for observer in observers:
+                    observer.add(record)
+
+    def page(self, cursor=None, limit=DEFAULT_PAGE_SIZE, descending=False):
+        """Unfiltered page of records by log position; needs no ``AuditIndex``.
+
+        Cursors work as in ``query``. Only the requested positions are read,
+        so on ``SpillingStorage`` a newest-first page comes from memory.
+        """
+        size = len(self._storage)
+        if descending:
+            end = size if cursor is None else min(max(cursor, 0), size)
+            start = max(end - limit, 0)
+            records = list(islice(self._storage.iter_from(start), end - start))[::-1]
+            positions = list(range(start + len(records) - 1, start - 1, -1))
+            more = start > 0
+        else:
+            start = 0 if cursor is None else max(cursor + 1, 0)
+            records = list(islice(self._storage.iter_from(start), limit))
+            positions = list(range(start, start + len(records)))
+            more = start + len(records) < size
+        return AuditPage(positions, records, positions[-1] if more and positions else None)
+
+    def query(self, **filters):
+        """Filtered page of records via the ``AuditIndex`` (see ``AuditIndex.query``)."""
+        if self._index is None:
+            raise RuntimeError("AuditLog.query needs an AuditLog created with an AuditIndex")
+        return self._index.query(**filters)
+
+    def to_list(self):
+        """Export audit entries as list of dicts."""
+        return [r.as_dict() for r in self._storage]
@@ -0,0 +1,138 @@
+"""Bounded audit storage: a ring of recent records plus compressed spill segments."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Iterator
+
+from ..models.compact import AuditRecord
+
+DEFAULT_RING_SIZE = 10_000
+DEFAULT_SEGMENT_RECORDS = 5_000
+
+
+def _write_segment(path: Path, records: list[AuditRecord]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        for r in records:
+            row = [
+                r.clinic_id_hash,
+                r.decision,
+                r.timestamp.isoformat(),
+                r.message_length,
+                r.has_emergency_flag,
+            ]
+            fh.write(json.dumps(row, separators=(",", ":")))
+            fh.write("\n")
+    os.replace(tmp, path)
+
+
+def _read_segment(path: Path) -> Iterator[AuditRecord]:
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            clinic_id_hash, decision, timestamp, length, emergency = json.loads(line)
+            yield AuditRecord(
+                clinic_id_hash, decision, datetime.fromisoformat(timestamp), length, emergency
+            )
+
+
+class SpillingStorage:
+    """Keeps the newest ``ring_size`` records in memory and spills older ones to disk.
+
+    Evicted records are batched and written ``segment_records`` at a time as
+    gzip-compressed JSON-lines segments under ``directory``, so memory stays
+    below ``ring_size + segment_records`` records however long the process
+    runs. Iteration streams the segments one at a time, then the in-memory
+    records, in append order. Segments already in ``directory`` are picked up
+    as older history; call ``close()`` at shutdown so the records still in
+    memory are written out too.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ring_size: int = DEFAULT_RING_SIZE,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+    ) -> None:
+        if ring_size < 1 or segment_records < 1:
+            raise ValueError("ring_size and segment_records must be >= 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ring_size = ring_size
+        self.segment_records = segment_records
+        self._ring: deque[AuditRecord] = deque()
+        self._spill: list[AuditRecord] = []
+        self._segments: list[tuple[Path, int]] = []
+        for path in sorted(self.directory.glob("audit-*.jsonl.gz")):
+            count = int(path.name.split(".")[0].split("-")[2])
+            self._segments.append((path, count))
+        self._spilled = sum(count for _, count in self._segments)
+        self._lock = Lock()
+
+    def append(self, record: AuditRecord) -> None:
+        with self._lock:
+            self._ring.append(record)
+            if len(self._ring) > self.ring_size:
+                self._spill.append(self._ring.popleft())
+                if len(self._spill) >= self.segment_records:
+                    self._flush_spill()
+
+    def extend(self, records: Iterable[AuditRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def _flush_spill(self) -> None:
+        batch, self._spill = self._spill, []
+        path = self.directory / f"audit-{len(self._segments):08d}-{len(batch)}.jsonl.gz"
+        _write_segment(path, batch)
+        self._segments.append((path, len(batch)))
+        self._spilled += len(batch)
+
+    def close(self) -> None:
+        """Write the pending spill and the in-memory ring to a final segment.
+
+        The storage stays usable; later appends start a fresh ring.
+        """
+        with self._lock:
+            self._spill.extend(self._ring)
+            self._ring.clear()
+            if self._spill:
+                self._flush_spill()
+
+    @property
+    def spilled(self) -> int:
+        """Records held in on-disk segments."""
+        return self._spilled
+
+    @property
+    def in_memory(self) -> int:
+        return len(self._ring) + len(self._spill)
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._spill) + len(self._ring)
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        return self.iter_from(0)
+
+    def iter_from(self, position: int) -> Iterator[AuditRecord]:
+        """Records from ``position`` on; whole segments before it are skipped unread."""
+        # Snapshot under the lock; the in-memory part is bounded, segments are immutable.
+        with self._lock:
+            segments = list(self._segments)
+            recent = self._spill + list(self._ring)
+        for path, count in segments:
+            if position >= count:
+                position -= count
+                continue
+            records = _read_segment(path)
+            for _ in range(position):
+                next(records)
+            position = 0
+            yield from records
+        yield from recent[position:]
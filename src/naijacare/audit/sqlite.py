@@ -0,0 +1,280 @@
+"""Durable audit trail: a background writer that batches entries into SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from threading import Condition, Thread
+from time import perf_counter_ns
+from typing import Iterable, Iterator
+
+from ..instrumentation import Histogram
+from ..models.compact import AuditRecord
+
+BACKPRESSURE_POLICIES = ("block", "drop_newest", "drop_oldest")
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Flush latency buckets (µs): 100 µs .. 1 s
+FLUSH_BUCKETS_US = (100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_entries (
+    id INTEGER PRIMARY KEY,
+    clinic_id_hash TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    message_length INTEGER NOT NULL,
+    has_emergency_flag INTEGER NOT NULL
+)
+"""
+_INSERT = (
+    "INSERT INTO audit_entries "
+    "(clinic_id_hash, decision, timestamp, message_length, has_emergency_flag) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def read_sqlite(path: str | Path) -> Iterator[AuditRecord]:
+    """Stream records back from a ``SQLiteAuditSink`` database, oldest first."""
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT clinic_id_hash, decision, timestamp, message_length, has_emergency_flag "
+            "FROM audit_entries ORDER BY id"
+        )
+        for clinic, decision, timestamp, length, emergency in rows:
+            yield AuditRecord(clinic, decision, datetime.fromisoformat(timestamp), length,
+                              bool(emergency))
+    finally:
+        conn.close()
+
+
+class SQLiteAuditSink:
+    """Persists audit records to SQLite without blocking the caller on I/O.
+
+    ``submit`` only appends to a bounded in-memory queue. A daemon writer
+    thread inserts queued records in one transaction per batch, as soon as
+    ``batch_size`` are waiting or ``flush_interval`` seconds after the last
+    batch, whichever comes first.
+
+    When the queue is full, ``backpressure`` decides what happens:
+    ``"block"`` waits for room (up to ``block_timeout`` seconds, then drops
+    the record), ``"drop_newest"`` discards the incoming record and
+    ``"drop_oldest"`` discards the oldest queued one. Drops are counted in
+    ``stats()``. ``flush()`` waits until everything submitted so far is
+    written; ``close()`` drains the queue and stops the writer, so register
+    it as a shutdown hook.
+
+    A batch that fails to insert is counted as ``failed`` and the writer
+    carries on. If the writer thread itself dies (e.g. the database cannot be
+    opened), the error is kept in ``last_error``, queued records are counted
+    as failed, ``submit`` drops new records and ``flush`` returns ``False``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        backpressure: str = "block",
+        block_timeout: float | None = None,
+    ) -> None:
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {backpressure!r}; expected {BACKPRESSURE_POLICIES}"
+            )
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be positive")
+        self.path = Path(path)
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _connect(self.path) as conn:
+            conn.execute(_SCHEMA)
+        conn.close()
+
+        self._queue: deque[AuditRecord] = deque()
+        self._cond = Condition()
+        self._closed = False
+        self._writer_dead = False
+        self._flush_requested = False
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.peak_depth = 0
+        self.last_error: str | None = None
+        self.flush_latency = Histogram(FLUSH_BUCKETS_US)
+        # Submitted records that are written, failed or evicted; flush() waits on it
+        self._settled = 0
+        self._thread = Thread(target=self._run, name="audit-sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: AuditRecord) -> bool:
+        """Queue ``record`` for writing; ``False`` if backpressure dropped it."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SQLiteAuditSink is closed")
+            if self._writer_dead:
+                self.dropped += 1
+                return False
+            if len(self._queue) >= self.max_queue:
+                if self.backpressure == "block":
+                    has_room = self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_queue
+                        or self._closed
+                        or self._writer_dead,
+                        self.block_timeout,
+                    )
+                    if not has_room or self._closed or self._writer_dead:
+                        self.dropped += 1
+                        return False
+                elif self.backpressure == "drop_newest":
+                    self.dropped += 1
+                    return False
+                else:
+                    self._queue.popleft()
+                    self.dropped += 1
+                    self._settled += 1
+            self._queue.append(record)
+            self.submitted += 1
+            if len(self._queue) > self.peak_depth:
+                self.peak_depth = len(self._queue)
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+            return True
+
+    def extend(self, records: Iterable[AuditRecord]) -> None:
+        for record in records:
+            self.submit(record)
+
+    def _take_batch(self) -> list[AuditRecord] | None:
+        """Next batch to write, or ``None`` once closed and drained."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: len(self._queue) >= self.batch_size
+                or self._flush_requested
+                or self._closed,
+                self.flush_interval,
+            )
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            if not self._queue:
+                self._flush_requested = False
+            # Wake producers blocked on a full queue
+            self._cond.notify_all()
+            if not batch and self._closed:
+                return None
+            return batch
+
+    def _write(self, conn: sqlite3.Connection, batch: list[AuditRecord]) -> None:
+        started = perf_counter_ns()
+        error = None
+        try:
+            with conn:
+                conn.executemany(
+                    _INSERT,
+                    [
+                        (r.clinic_id_hash, r.decision, r.timestamp.isoformat(),
+                         r.message_length, int(r.has_emergency_flag))
+                        for r in batch
+                    ],
+                )
+        except Exception as exc:
+            # Bad records or a database error fail this batch, not the writer
+            error = f"{type(exc).__name__}: {exc}"
+        elapsed = perf_counter_ns() - started
+        with self._cond:
+            if error is None:
+                self.written += len(batch)
+                self.batches += 1
+                self.flush_latency.observe(elapsed)
+            else:
+                self.failed += len(batch)
+                self.last_error = error
+            self._settled += len(batch)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        try:
+            conn = _connect(self.path)
+            try:
+                while (batch := self._take_batch()) is not None:
+                    if batch:
+                        self._write(conn, batch)
+            finally:
+                conn.close()
+        except Exception as exc:
+            with self._cond:
+                self._writer_dead = True
+                self.last_error = f"writer stopped: {type(exc).__name__}: {exc}"
+                self.failed += len(self._queue)
+                self._settled += len(self._queue)
+                self._queue.clear()
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every record submitted so far is written.
+
+        ``False`` on timeout or if the writer thread has died.
+        """
+        with self._cond:
+            target = self.submitted
+            self._flush_requested = True
+            self._cond.notify_all()
+            settled = self._cond.wait_for(
+                lambda: self._settled >= target or self._writer_dead, timeout
+            )
+            return settled and not self._writer_dead
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write out everything queued and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __enter__(self) -> SQLiteAuditSink:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "queue_depth": len(self._queue),
+                "peak_queue_depth": self.peak_depth,
+                "max_queue": self.max_queue,
+                "backpressure": self.backpressure,
+                "submitted": self.submitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+                "last_error": self.last_error,
+                "writer_alive": not self._writer_dead and self._thread.is_alive(),
+                "flush_latency": self.flush_latency.snapshot(),
+            }
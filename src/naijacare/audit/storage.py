@@ -0,0 +1,37 @@
+"""Default in-memory storage for ``AuditLog``."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from ..models.compact import AuditRecord
+
+
+class ListStorage:
+    """Unbounded list of ``AuditRecord`` objects in append order.
+
+    Storage backends provide ``append``, ``extend``, ``__len__``,
+    ``__iter__`` (oldest first) and ``iter_from(position)``, which yields the
+    records from that zero-based position onwards without visiting earlier
+    ones; ``AuditLog`` needs nothing else.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[AuditRecord] = []
+
+    def append(self, record: AuditRecord) -> None:
+        self._records.append(record)
+
+    def extend(self, records: Iterable[AuditRecord]) -> None:
+        self._records.extend(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        return iter(self._records)
+
+    def iter_from(self, position: int) -> Iterator[AuditRecord]:
+        records = self._records
+        for i in range(position, len(records)):
+            yield records[i]
@@ -0,0 +1,70 @@
+"""Bounded LRU cache of routing outcomes keyed on normalised text."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+
+DEFAULT_CACHE_SIZE = 10_000
+
+
+def normalise_text(text: str) -> str:
+    """Cache key form of a message: case-folded and stripped of edge whitespace."""
+    return text.strip().lower()
+
+
+class DecisionCache:
+    """Least-recently-used cache in front of routing.
+
+    Keys are ``(normalised text, rule-set version)``, so entries produced by an
+    older rule set are never returned once a new version is active. Call
+    ``invalidate()`` to drop them eagerly after a reload.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> tuple | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: tuple) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every cached outcome (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,17 +1,44 @@
 """Consent management package."""
 
 from .audit import ConsentAuditEntry, ConsentAuditLog
+from .cache import ConsentDecisionCache
+from .erasure import ErasureJob, ErasureReport
+from .expiry import ExpiryIndex, ReconsentReminderJob
+from .segments import SegmentedConsentAuditLog
+from .sql_store import SQLConsentStore
+from .striped import StripedConsentStore
 from .tracker import CONSENT_SCOPES, ConsentRecord, ConsentStore
-from .validator import ConsentValidationError, validate_consent
+from .validator import (
+    CONSENT_REASONS,
+    CONSENT_VALID,
+    ConsentColumns,
+    ConsentValidationError,
+    consent_reason,
+    validate_consent,
+    validate_consent_many,
+)
 from .withdrawal import withdraw_and_anonymize
 
 __all__ = [
+    "CONSENT_REASONS",
     "CONSENT_SCOPES",
+    "CONSENT_VALID",
     "ConsentAuditEntry",
     "ConsentAuditLog",
+    "ConsentColumns",
+    "ConsentDecisionCache",
     "ConsentRecord",
     "ConsentStore",
     "ConsentValidationError",
+    "ErasureJob",
+    "ErasureReport",
+    "ExpiryIndex",
+    "ReconsentReminderJob",
+    "SQLConsentStore",
+    "SegmentedConsentAuditLog",
+    "StripedConsentStore",
+    "consent_reason",
     "validate_consent",
+    "validate_consent_many",
     "withdraw_and_anonymize",
 ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterable, Iterator
 
 
 @dataclass
@@ -25,5 +26,23 @@ class ConsentAuditLog:
     def record(self, entry: ConsentAuditEntry) -> None:
         self._entries.append(entry)
 
-    def entries(self) -> list[ConsentAuditEntry]:
+    def entries(self, lazy: bool = False) -> list[ConsentAuditEntry] | Iterator[ConsentAuditEntry]:
+        """A copy of the entries, or with ``lazy=True`` an iterator over them."""
+        if lazy:
+            return iter(self._entries)
         return list(self._entries)
+
+    def redact(self, subject_ids: Iterable[str]) -> int:
+        """Anonymize entries for ``subject_ids``; returns how many were rewritten."""
+        subject_ids = set(subject_ids)
+        redacted = 0
+        for i, entry in enumerate(self._entries):
+            if entry.subject_id in subject_ids:
+                self._entries[i] = ConsentAuditEntry(
+                    "ANONYMIZED", entry.action, entry.timestamp, {}
+                )
+                redacted += 1
+        return redacted
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,90 @@
+"""Memoised consent decisions with change-driven invalidation."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Iterable
+
+from .tracker import ConsentRecord, add_change_listener
+from .validator import CONSENT_VALID, consent_reason
+
+DEFAULT_CONSENT_CACHE_SIZE = 10_000
+
+
+class ConsentDecisionCache:
+    """Per-(subject, scope set) cache of ``consent_reason`` results.
+
+    A valid decision expires on its own at the record's re-consent deadline;
+    invalid decisions do not change with time and are kept until invalidated.
+    ``ConsentRecord.grant``/``withdraw``/``anonymize`` and ``ConsentStore.upsert``
+    drop a subject's entries immediately. Entries are also tied to the record
+    object they were computed from, so a different record for the same subject
+    is always re-validated. Fields assigned directly on a record bypass the
+    change hooks; ``upsert`` the record afterwards.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CONSENT_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # subject_id -> {scope set: (record, reason code, expires_at)}
+        self._subjects: OrderedDict[str, dict[frozenset, tuple]] = OrderedDict()
+        self._lock = Lock()
+        add_change_listener(self.invalidate_subject)
+
+    def check(
+        self, record: ConsentRecord, scopes: Iterable[str], now: datetime | None = None
+    ) -> int:
+        """Reason code for ``record`` against ``scopes``, served from cache when fresh."""
+        scopes = frozenset(scopes)
+        now = now or datetime.utcnow()
+        # Validate under the lock: a concurrent withdraw sets its field before
+        # notifying, so its invalidation always lands after any stale put.
+        with self._lock:
+            entries = self._subjects.get(record.subject_id)
+            entry = entries.get(scopes) if entries else None
+            if entry is not None:
+                cached_record, code, expires_at = entry
+                if cached_record is record and (expires_at is None or now <= expires_at):
+                    self._subjects.move_to_end(record.subject_id)
+                    self.hits += 1
+                    return code
+            self.misses += 1
+            code = consent_reason(record, scopes, now)
+            expires_at = record.reconsent_due_at if code == CONSENT_VALID else None
+            if entries is None:
+                entries = self._subjects[record.subject_id] = {}
+            entries[scopes] = (record, code, expires_at)
+            self._subjects.move_to_end(record.subject_id)
+            if len(self._subjects) > self.maxsize:
+                self._subjects.popitem(last=False)
+            return code
+
+    def invalidate_subject(self, subject_id: str) -> None:
+        with self._lock:
+            if self._subjects.pop(subject_id, None) is not None:
+                self.invalidations += 1
+
+    def invalidate(self) -> None:
+        """Drop every cached decision (counters are kept)."""
+        with self._lock:
+            self._subjects.clear()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "subjects": len(self._subjects),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._subjects)
@@ -0,0 +1,207 @@
+"""Bulk right-to-be-forgotten erasure across consent stores, ORM tables and audit logs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Protocol, Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from ..models.orm import Case, Patient, RoutingDecision
+from ..models.orm import ConsentRecord as ConsentRow
+from .tracker import ConsentRecord
+from .withdrawal import withdraw_and_anonymize
+
+DEFAULT_ERASURE_CHUNK = 500
+
+
+def erased_reference(subject_id: str) -> str:
+    """Tombstone ``external_reference`` left on an erased patient row.
+
+    A one-way hash, so the row no longer names the subject but a store can
+    still tell that ``subject_id`` was erased and refuse to recreate it.
+    """
+    return "erased-" + hashlib.sha256(subject_id.encode()).hexdigest()[:32]
+
+
+class SupportsErasure(Protocol):
+    def get(self, subject_id: str) -> ConsentRecord | None: ...
+
+    def remove(self, subject_id: str) -> object: ...
+
+
+class SupportsRedaction(Protocol):
+    def redact(self, subject_ids: Sequence[str]) -> int: ...
+
+
+@dataclass
+class ErasureReport:
+    """Counts and throughput for one ``ErasureJob.run``."""
+
+    requested: int = 0
+    erased: int = 0
+    resumed_from: int = 0
+    chunks: int = 0
+    patients: int = 0
+    cases: int = 0
+    routing_decisions: int = 0
+    consent_rows: int = 0
+    store_records: int = 0
+    audit_entries: int = 0
+    elapsed: float = 0.0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def subjects_per_sec(self) -> float:
+        return self.erased / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "subjects_per_sec": self.subjects_per_sec}
+
+
+class ErasureJob:
+    """Erase many subjects in chunks, resumably.
+
+    For each chunk of subject ids, in order:
+
+    1. ORM (one transaction): ``patients`` are anonymized and soft-deleted,
+       their ``cases`` have summaries cleared and are soft-deleted, the cases'
+       ``routing_decisions`` are deleted and ``consent_records`` are withdrawn,
+       stripped of details and soft-deleted. The patient's reference becomes
+       an ``erased_reference`` tombstone, so write-behind consent updates still
+       queued in any ``SQLConsentStore`` are dropped instead of recreating it.
+    2. The in-process consent ``store`` withdraws, anonymizes and drops each record.
+    3. Each consent ``audit_log`` has the subjects' entries redacted.
+    4. The checkpoint file records how many subjects are done.
+
+    Every step is idempotent, so a run interrupted mid-chunk redoes that chunk
+    on resume. The checkpoint stores a digest of the subject list and refuses
+    to resume a different list.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        store: SupportsErasure | None = None,
+        audit_logs: Sequence[SupportsRedaction] = (),
+        checkpoint_path: str | Path | None = None,
+        chunk_size: int = DEFAULT_ERASURE_CHUNK,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.session_factory = session_factory
+        self.store = store
+        self.audit_logs = list(audit_logs)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.chunk_size = chunk_size
+
+    def run(self, subject_ids: Sequence[str]) -> ErasureReport:
+        subject_ids = list(subject_ids)
+        digest = hashlib.sha256("\n".join(subject_ids).encode()).hexdigest()
+        done = self._load_checkpoint(digest)
+        report = ErasureReport(requested=len(subject_ids), resumed_from=done)
+        started = time.perf_counter()
+        for offset in range(done, len(subject_ids), self.chunk_size):
+            chunk = subject_ids[offset : offset + self.chunk_size]
+            self._erase_chunk(chunk, report)
+            report.erased += len(chunk)
+            report.chunks += 1
+            self._save_checkpoint(digest, offset + len(chunk))
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _erase_chunk(self, chunk: list[str], report: ErasureReport) -> None:
+        stages = report.stage_seconds
+        started = time.perf_counter()
+        if self.session_factory is not None:
+            with self.session_factory() as session, session.begin():
+                self._erase_rows(session, chunk, report)
+        stages["orm"] = stages.get("orm", 0.0) + time.perf_counter() - started
+
+        started = time.perf_counter()
+        if self.store is not None:
+            for subject_id in chunk:
+                record = self.store.get(subject_id)
+                if record is not None:
+                    self.store.remove(subject_id)
+                    withdraw_and_anonymize(record)
+                    report.store_records += 1
+        stages["store"] = stages.get("store", 0.0) + time.perf_counter() - started
+
+        started = time.perf_counter()
+        for audit_log in self.audit_logs:
+            report.audit_entries += audit_log.redact(chunk)
+        stages["audit"] = stages.get("audit", 0.0) + time.perf_counter() - started
+
+    @staticmethod
+    def _erase_rows(session: Session, chunk: list[str], report: ErasureReport) -> None:
+        now = datetime.utcnow()
+        patients = session.execute(
+            select(Patient.id, Patient.external_reference).where(
+                Patient.external_reference.in_(chunk)
+            )
+        ).all()
+        if not patients:
+            return
+        patient_ids = [patient_id for patient_id, _ in patients]
+        case_ids = list(session.scalars(select(Case.id).where(Case.patient_id.in_(patient_ids))))
+        if case_ids:
+            report.routing_decisions += session.execute(
+                delete(RoutingDecision).where(RoutingDecision.case_id.in_(case_ids))
+            ).rowcount
+            report.cases += session.execute(
+                update(Case)
+                .where(Case.id.in_(case_ids))
+                .values(summary=None, deleted_at=now)
+            ).rowcount
+        report.consent_rows += session.execute(
+            update(ConsentRow)
+            .where(ConsentRow.patient_id.in_(patient_ids))
+            .values(details={}, deleted_at=now)
+        ).rowcount
+        session.execute(
+            update(ConsentRow)
+            .where(ConsentRow.patient_id.in_(patient_ids), ConsentRow.withdrawn_at.is_(None))
+            .values(withdrawn_at=now)
+        )
+        # external_reference is unique and required, so replace it with the
+        # non-identifying tombstone that SQLConsentStore.flush checks.
+        session.execute(
+            update(Patient),
+            [
+                {
+                    "id": patient_id,
+                    "external_reference": erased_reference(subject_id),
+                    "preferred_name": None,
+                    "age_years": None,
+                    "gender": None,
+                    "deleted_at": now,
+                }
+                for patient_id, subject_id in patients
+            ],
+        )
+        report.patients += len(patients)
+
+    def _load_checkpoint(self, digest: str) -> int:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return 0
+        state = json.loads(self.checkpoint_path.read_text())
+        if state["digest"] != digest:
+            raise ValueError(
+                f"checkpoint {self.checkpoint_path} belongs to a different subject list"
+            )
+        return state["completed"]
+
+    def _save_checkpoint(self, digest: str, completed: int) -> None:
+        if self.checkpoint_path is None:
+            return
+        tmp = self.checkpoint_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"digest": digest, "completed": completed}))
+        os.replace(tmp, self.checkpoint_path)
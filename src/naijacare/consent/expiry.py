@@ -0,0 +1,124 @@
+"""Re-consent expiry index and reminder job."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Protocol
+
+
+class ExpiryIndex:
+    """Subjects bucketed by the day their consent needs renewing.
+
+    Buckets are keyed on the deadline's day ordinal and the occupied days are
+    kept sorted, so ``due_by`` visits only the buckets at or before the
+    cutoff: O(buckets visited + k) for k matching subjects, independent of the
+    total number of subjects indexed.
+    """
+
+    def __init__(self) -> None:
+        self._deadlines: dict[str, datetime] = {}
+        self._buckets: dict[int, set[str]] = {}
+        self._days: list[int] = []
+
+    def update(self, subject_id: str, deadline: datetime | None) -> None:
+        """Set (or clear, with ``None``) the re-consent deadline for a subject."""
+        self.remove(subject_id)
+        if deadline is None:
+            return
+        day = deadline.toordinal()
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = self._buckets[day] = set()
+            insort(self._days, day)
+        bucket.add(subject_id)
+        self._deadlines[subject_id] = deadline
+
+    def remove(self, subject_id: str) -> None:
+        deadline = self._deadlines.pop(subject_id, None)
+        if deadline is None:
+            return
+        day = deadline.toordinal()
+        bucket = self._buckets[day]
+        bucket.discard(subject_id)
+        if not bucket:
+            del self._buckets[day]
+            self._days.pop(bisect_right(self._days, day) - 1)
+
+    def deadline(self, subject_id: str) -> datetime | None:
+        return self._deadlines.get(subject_id)
+
+    def due_by(self, cutoff: datetime) -> Iterator[tuple[str, datetime]]:
+        """Yield ``(subject_id, deadline)`` with deadline <= cutoff, earliest first."""
+        cutoff_day = cutoff.toordinal()
+        for day in self._days[: bisect_right(self._days, cutoff_day)]:
+            bucket = sorted((self._deadlines[s], s) for s in self._buckets[day])
+            for deadline, subject_id in bucket:
+                if day < cutoff_day or deadline <= cutoff:
+                    yield subject_id, deadline
+
+    def due_within(
+        self, days: int, now: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """Subjects whose deadline falls within ``days`` of ``now`` (or has passed)."""
+        now = now or datetime.utcnow()
+        return list(self.due_by(now + timedelta(days=days)))
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+
+class SupportsReconsentQueries(Protocol):
+    def due_for_reconsent(
+        self, within_days: int, now: datetime | None = None
+    ) -> list[tuple[str, datetime]]: ...
+
+
+class ReconsentReminderJob:
+    """Sends one reminder per subject per deadline, driven by a store's expiry index."""
+
+    def __init__(
+        self,
+        store: SupportsReconsentQueries,
+        notify: Callable[[str, datetime], None],
+        lead_days: int = 14,
+        interval_seconds: float = 24 * 60 * 60,
+    ) -> None:
+        self.store = store
+        self.notify = notify
+        self.lead_days = lead_days
+        self.interval_seconds = interval_seconds
+        self._reminded: dict[str, datetime] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self, now: datetime | None = None) -> list[str]:
+        """Notify subjects newly due within ``lead_days``; returns who was reminded."""
+        reminded = []
+        for subject_id, deadline in self.store.due_for_reconsent(self.lead_days, now):
+            if self._reminded.get(subject_id) != deadline:
+                self.notify(subject_id, deadline)
+                self._reminded[subject_id] = deadline
+                reminded.append(subject_id)
+        return reminded
+
+    def start(self) -> None:
+        """Run ``run_once`` every ``interval_seconds`` on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                self.run_once()
+                self._stop.wait(self.interval_seconds)
+
+        self._thread = threading.Thread(target=loop, name="reconsent-reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,364 @@
+"""Durable append-only consent audit log stored in rotating binary segments.
+
+Each segment file starts with ``MAGIC`` followed by length-prefixed records::
+
+    u32 body length | u32 crc32(body) | body
+    body = i64 timestamp (µs since 1970-01-01, naive UTC) | u8 flags
+           | u16 subject len | u16 action len | u32 details len
+           | subject utf-8 | action utf-8 | details compact JSON
+
+A sparse index keeps one block entry per ``block_records`` records with the
+block's byte range, time range and a small Bloom filter of subject ids, so
+queries only touch blocks that can match. Reads go through ``mmap``. The
+index of a sealed segment is written next to it as ``<segment>.idx``; the
+active segment is rescanned on open, and a torn final record is truncated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Iterator
+
+from .audit import ConsentAuditEntry
+
+MAGIC = b"NCCAUD01"
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_BLOCK_RECORDS = 128
+FLAG_REDACTED = 1
+
+_PREFIX = struct.Struct("<II")
+_FIELDS = struct.Struct("<qBHHI")
+_EPOCH = datetime(1970, 1, 1)
+_BLOOM_BITS = 2048
+_BLOOM_HASHES = 3
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _bloom(subject: bytes) -> int:
+    value = int.from_bytes(hashlib.blake2b(subject, digest_size=8).digest(), "little")
+    bits = 0
+    for i in range(_BLOOM_HASHES):
+        bits |= 1 << ((value >> (i * 16)) % _BLOOM_BITS)
+    return bits
+
+
+def encode_entry(entry: ConsentAuditEntry, flags: int = 0) -> bytes:
+    subject = entry.subject_id.encode()
+    action = entry.action.encode()
+    details = json.dumps(entry.details, separators=(",", ":")).encode()
+    body = (
+        _FIELDS.pack(_micros(entry.timestamp), flags, len(subject), len(action), len(details))
+        + subject
+        + action
+        + details
+    )
+    return _PREFIX.pack(len(body), zlib.crc32(body)) + body
+
+
+def decode_entry(buf, offset: int) -> tuple[ConsentAuditEntry, int]:
+    """Decode the record at ``offset``; returns the entry and the next offset."""
+    length, _ = _PREFIX.unpack_from(buf, offset)
+    start = offset + _PREFIX.size
+    timestamp, flags, subject_len, action_len, details_len = _FIELDS.unpack_from(buf, start)
+    pos = start + _FIELDS.size
+    subject = bytes(buf[pos : pos + subject_len]).decode()
+    pos += subject_len
+    action = bytes(buf[pos : pos + action_len]).decode()
+    pos += action_len
+    details = json.loads(bytes(buf[pos : pos + details_len]))
+    if flags & FLAG_REDACTED:
+        subject, details = "ANONYMIZED", {}
+    entry = ConsentAuditEntry(subject, action, _EPOCH + timedelta(microseconds=timestamp), details)
+    return entry, start + length
+
+
+def _redact_range(buf, offset: int, end: int, subjects: set[bytes]) -> int:
+    redacted = 0
+    while offset < end:
+        length, _ = _PREFIX.unpack_from(buf, offset)
+        fields = offset + _PREFIX.size
+        timestamp, flags, subject_len, action_len, details_len = _FIELDS.unpack_from(buf, fields)
+        pos = fields + _FIELDS.size
+        if not flags & FLAG_REDACTED and bytes(buf[pos : pos + subject_len]) in subjects:
+            buf[pos : pos + subject_len] = b"\0" * subject_len
+            details = pos + subject_len + action_len
+            buf[details : details + details_len] = b"{}".ljust(details_len)
+            _FIELDS.pack_into(
+                buf, fields, timestamp, flags | FLAG_REDACTED, subject_len, action_len, details_len
+            )
+            body = bytes(buf[fields : fields + length])
+            _PREFIX.pack_into(buf, offset, length, zlib.crc32(body))
+            redacted += 1
+        offset = fields + length
+    return redacted
+
+
+class _Block:
+    """Sparse index entry covering consecutive records of one segment."""
+
+    __slots__ = ("offset", "end", "count", "min_us", "max_us", "bloom")
+
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+        self.end = offset
+        self.count = 0
+        self.min_us = 2**63 - 1
+        self.max_us = -(2**63)
+        self.bloom = 0
+
+    def add(self, end: int, timestamp_us: int, subject: bytes) -> None:
+        self.end = end
+        self.count += 1
+        self.min_us = min(self.min_us, timestamp_us)
+        self.max_us = max(self.max_us, timestamp_us)
+        self.bloom |= _bloom(subject)
+
+    def matches(self, start_us: int | None, end_us: int | None, bloom: int | None) -> bool:
+        if start_us is not None and self.max_us < start_us:
+            return False
+        if end_us is not None and self.min_us > end_us:
+            return False
+        return bloom is None or self.bloom & bloom == bloom
+
+    def to_json(self) -> list:
+        return [self.offset, self.end, self.count, self.min_us, self.max_us, self.bloom]
+
+    @classmethod
+    def from_json(cls, data: list) -> _Block:
+        block = cls(data[0])
+        block.end, block.count, block.min_us, block.max_us, block.bloom = data[1:]
+        return block
+
+
+class _Segment:
+    __slots__ = ("path", "blocks")
+
+    def __init__(self, path: Path, blocks: list[_Block] | None = None) -> None:
+        self.path = path
+        self.blocks = blocks or []
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx")
+
+    @property
+    def count(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+
+class SegmentedConsentAuditLog:
+    """Append-only consent audit log persisted under ``directory``.
+
+    Has the same ``record``/``entries`` interface as ``ConsentAuditLog`` plus
+    ``query`` for subject and time-range lookups. Appends are buffered; call
+    ``flush()`` (``fsync=True`` for durability against power loss) or use the
+    log as a context manager.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        block_records: int = DEFAULT_BLOCK_RECORDS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.block_records = block_records
+        self._lock = Lock()
+        self._segments: list[_Segment] = []
+        paths = sorted(self.directory.glob("segment-*.log"))
+        for i, path in enumerate(paths):
+            sealed = i < len(paths) - 1
+            self._segments.append(self._load_segment(path, sealed))
+        if not self._segments:
+            self._segments.append(self._new_segment(0))
+        self._file = open(self._active.path, "ab")
+        self._size = self._file.tell()
+        self._count = sum(segment.count for segment in self._segments)
+
+    @property
+    def _active(self) -> _Segment:
+        return self._segments[-1]
+
+    def _new_segment(self, number: int) -> _Segment:
+        path = self.directory / f"segment-{number:08d}.log"
+        path.write_bytes(MAGIC)
+        return _Segment(path)
+
+    def _load_segment(self, path: Path, sealed: bool) -> _Segment:
+        segment = _Segment(path)
+        if sealed and segment.index_path.exists():
+            data = json.loads(segment.index_path.read_text())
+            segment.blocks = [_Block.from_json(block) for block in data["blocks"]]
+            return segment
+        with open(path, "r+b") as fh:
+            data = fh.read()
+            if not data.startswith(MAGIC):
+                raise ValueError(f"{path} is not a consent audit segment")
+            offset = len(MAGIC)
+            while offset + _PREFIX.size <= len(data):
+                length, crc = _PREFIX.unpack_from(data, offset)
+                body = data[offset + _PREFIX.size : offset + _PREFIX.size + length]
+                if len(body) < length or zlib.crc32(body) != crc:
+                    break
+                end = offset + _PREFIX.size + length
+                self._index_record(segment, offset, end, body)
+                offset = end
+            if offset < len(data):
+                # Torn or corrupt tail from an interrupted append.
+                fh.truncate(offset)
+        return segment
+
+    def _index_record(self, segment: _Segment, offset: int, end: int, body: bytes) -> None:
+        timestamp, _, subject_len, _, _ = _FIELDS.unpack_from(body)
+        subject = body[_FIELDS.size : _FIELDS.size + subject_len]
+        if not segment.blocks or segment.blocks[-1].count >= self.block_records:
+            segment.blocks.append(_Block(offset))
+        segment.blocks[-1].add(end, timestamp, subject)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        sealed = self._active
+        sealed.index_path.write_text(
+            json.dumps({"blocks": [block.to_json() for block in sealed.blocks]})
+        )
+        number = int(sealed.path.stem.split("-")[1]) + 1
+        self._segments.append(self._new_segment(number))
+        self._file = open(self._active.path, "ab")
+        self._size = len(MAGIC)
+
+    def record(self, entry: ConsentAuditEntry) -> None:
+        data = encode_entry(entry)
+        with self._lock:
+            if self._size > len(MAGIC) and self._size + len(data) > self.segment_bytes:
+                self._rotate()
+            offset = self._size
+            self._file.write(data)
+            self._size += len(data)
+            self._index_record(self._active, offset, self._size, data[_PREFIX.size :])
+            self._count += 1
+
+    def redact(self, subject_ids: Iterable[str]) -> int:
+        """Anonymize every record for ``subject_ids`` in place; returns the count.
+
+        The record keeps its size and offset: the subject and details bytes are
+        blanked, ``FLAG_REDACTED`` is set and the CRC recomputed, so the index
+        stays valid. Redacted records read back as subject ``"ANONYMIZED"``.
+        """
+        subjects = {subject_id.encode() for subject_id in subject_ids}
+        blooms = [_bloom(subject) for subject in subjects]
+        redacted = 0
+        with self._lock:
+            self._file.flush()
+            for segment in self._segments:
+                ranges = [
+                    (b.offset, b.end)
+                    for b in segment.blocks
+                    if any(b.bloom & bloom == bloom for bloom in blooms)
+                ]
+                if not ranges:
+                    continue
+                with open(segment.path, "r+b") as fh, mmap.mmap(fh.fileno(), 0) as buf:
+                    for offset, end in ranges:
+                        redacted += _redact_range(buf, offset, end, subjects)
+                    buf.flush()
+        return redacted
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._lock:
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> SegmentedConsentAuditLog:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def entries(self, lazy: bool = False) -> list[ConsentAuditEntry] | Iterator[ConsentAuditEntry]:
+        """Every entry in append order; ``lazy=True`` streams instead of building a list."""
+        entries = self.query()
+        return entries if lazy else list(entries)
+
+    def query(
+        self,
+        subject_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[ConsentAuditEntry]:
+        """Stream entries for ``subject_id`` and/or with ``start <= timestamp <= end``.
+
+        Only index blocks whose time range and subject filter can match are
+        decoded, one block at a time under the log's lock so that ``redact``
+        never runs mid-block.
+        """
+        subject = subject_id.encode() if subject_id is not None else None
+        bloom = _bloom(subject) if subject is not None else None
+        start_us = _micros(start) if start is not None else None
+        end_us = _micros(end) if end is not None else None
+        with self._lock:
+            self._file.flush()
+            # Snapshot byte ranges: the active block keeps growing after this.
+            plan = [
+                (
+                    segment.path,
+                    [
+                        (b.offset, b.end)
+                        for b in segment.blocks
+                        if b.matches(start_us, end_us, bloom)
+                    ],
+                )
+                for segment in self._segments
+            ]
+        for path, ranges in plan:
+            if not ranges:
+                continue
+            with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for offset, end in ranges:
+                    # Decode a block at a time under the lock: redact() rewrites
+                    # records in place, so an unlocked read could see one half-done.
+                    with self._lock:
+                        block = list(self._scan(buf, offset, end, subject, start_us, end_us))
+                    yield from block
+
+    @staticmethod
+    def _scan(buf, offset, end, subject, start_us, end_us) -> Iterator[ConsentAuditEntry]:
+        while offset < end:
+            length, _ = _PREFIX.unpack_from(buf, offset)
+            fields = offset + _PREFIX.size
+            timestamp, flags, subject_len, _, _ = _FIELDS.unpack_from(buf, fields)
+            keep = (start_us is None or timestamp >= start_us) and (
+                end_us is None or timestamp <= end_us
+            )
+            if keep and subject is not None:
+                pos = fields + _FIELDS.size
+                keep = not flags & FLAG_REDACTED and buf[pos : pos + subject_len] == subject
+            if keep:
+                yield decode_entry(buf, offset)[0]
+            offset = fields + length
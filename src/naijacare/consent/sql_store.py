@@ -0,0 +1,243 @@
+"""SQL-backed consent store with a read-through cache and write-behind batching."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+from threading import RLock
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from ..models.database import Base, SessionLocal
+from ..models.orm import ConsentRecord as ConsentRow
+from ..models.orm import Patient
+from .erasure import erased_reference
+from .expiry import ExpiryIndex
+from .tracker import ConsentRecord, notify_change
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 100
+
+# ConsentRecord scope name -> ORM boolean column
+SCOPE_COLUMNS = {
+    "data_collection": "scope_data_collection",
+    "ai_processing": "scope_ai_processing",
+    "third_party_sharing": "scope_third_party",
+}
+
+
+def _to_record(patient: Patient, row: ConsentRow | None) -> ConsentRecord:
+    record = ConsentRecord(subject_id=patient.external_reference, age_years=patient.age_years or 0)
+    if row is not None:
+        record.granted_scopes = {s for s, col in SCOPE_COLUMNS.items() if getattr(row, col)}
+        record.consented_at = row.consented_at
+        record.withdrawn_at = row.withdrawn_at
+        record.last_reconsent_at = row.last_reconsent_at
+        record.consent_version = row.consent_version
+        record.metadata = dict(row.details or {})
+    return record
+
+
+def _apply(record: ConsentRecord, patient: Patient, row: ConsentRow) -> None:
+    patient.age_years = record.age_years
+    for scope, column in SCOPE_COLUMNS.items():
+        setattr(row, column, scope in record.granted_scopes)
+    row.consented_at = record.consented_at
+    row.withdrawn_at = record.withdrawn_at
+    row.last_reconsent_at = record.last_reconsent_at
+    row.consent_version = record.consent_version
+    row.details = dict(record.metadata)
+
+
+def _active_row(patient: Patient) -> ConsentRow | None:
+    rows = [r for r in patient.consents if r.deleted_at is None]
+    return max(rows, key=lambda r: r.id or 0) if rows else None
+
+
+class SQLConsentStore:
+    """Consent store persisted to the ``patients``/``consent_records`` tables.
+
+    Subjects map to ``Patient.external_reference``. Reads go through a bounded
+    LRU cache. ``upsert`` queues the record and writes queued records together
+    in one transaction once ``batch_size`` are pending (or on ``flush()``).
+    ``withdraw`` always flushes before returning, so a withdrawal is durable and
+    visible to other store instances immediately.
+
+    The re-consent ``ExpiryIndex`` is built from the tables on the first
+    ``due_for_reconsent`` call and maintained by this instance's writes after
+    that; call ``rebuild_expiry_index()`` to pick up other writers' changes.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self._session_factory = session_factory
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self._cache: OrderedDict[str, ConsentRecord] = OrderedDict()
+        self._pending: dict[str, ConsentRecord] = {}
+        self._lock = RLock()
+        self._expiry: ExpiryIndex | None = None
+
+    def create_schema(self) -> None:
+        """Create the ORM tables on the store's engine if they do not exist."""
+        with self._session_factory() as session:
+            Base.metadata.create_all(session.get_bind())
+
+    def _remember(self, record: ConsentRecord) -> None:
+        self._cache[record.subject_id] = record
+        self._cache.move_to_end(record.subject_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, subject_id: str) -> ConsentRecord | None:
+        with self._lock:
+            record = self._pending.get(subject_id)
+            if record is None:
+                record = self._cache.get(subject_id)
+                if record is not None:
+                    self._cache.move_to_end(subject_id)
+            if record is not None:
+                return record
+            with self._session_factory() as session:
+                patient = session.scalars(
+                    select(Patient)
+                    .where(Patient.external_reference == subject_id, Patient.deleted_at.is_(None))
+                    .options(selectinload(Patient.consents))
+                ).first()
+                if patient is None:
+                    return None
+                record = _to_record(patient, _active_row(patient))
+            self._remember(record)
+            return record
+
+    def upsert(self, record: ConsentRecord) -> None:
+        with self._lock:
+            self._pending[record.subject_id] = record
+            self._remember(record)
+            if self._expiry is not None:
+                self._expiry.update(record.subject_id, record.reconsent_due_at)
+            notify_change(record.subject_id)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def withdraw(
+        self, subject_id: str, withdrawn_at: datetime | None = None
+    ) -> ConsentRecord | None:
+        with self._lock:
+            record = self.get(subject_id)
+            if record:
+                record.withdraw(withdrawn_at)
+                self._pending[subject_id] = record
+                self.flush()
+                if self._expiry is not None:
+                    self._expiry.remove(subject_id)
+            return record
+
+    def remove(self, subject_id: str) -> None:
+        """Forget a subject locally: queued write, cached record and expiry entry.
+
+        Database rows are left alone; erase them with ``ErasureJob``.
+        """
+        with self._lock:
+            self._pending.pop(subject_id, None)
+            self._cache.pop(subject_id, None)
+            if self._expiry is not None:
+                self._expiry.remove(subject_id)
+        notify_change(subject_id)
+
+    def rebuild_expiry_index(self) -> ExpiryIndex:
+        """Index re-consent deadlines for every stored subject in one pass."""
+        with self._lock:
+            index = ExpiryIndex()
+            with self._session_factory() as session:
+                patients = session.scalars(
+                    select(Patient)
+                    .where(Patient.deleted_at.is_(None))
+                    .options(selectinload(Patient.consents))
+                )
+                for patient in patients:
+                    record = _to_record(patient, _active_row(patient))
+                    index.update(record.subject_id, record.reconsent_due_at)
+            for record in self._pending.values():
+                index.update(record.subject_id, record.reconsent_due_at)
+            self._expiry = index
+            return index
+
+    def due_for_reconsent(
+        self, within_days: int, now: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """``(subject_id, deadline)`` pairs lapsing within ``within_days``, earliest first."""
+        with self._lock:
+            index = self._expiry or self.rebuild_expiry_index()
+            return index.due_within(within_days, now)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes not yet flushed."""
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Write every pending record in a single transaction.
+
+        Writes for soft-deleted or erased subjects (see ``ErasureJob``) are
+        dropped, and the subjects evicted from the cache, rather than
+        recreating or reviving them.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = {}
+            try:
+                with self._session_factory() as session, session.begin():
+                    subject_ids = list(batch)
+                    patients = {
+                        p.external_reference: p
+                        for p in session.scalars(
+                            select(Patient)
+                            .where(
+                                Patient.external_reference.in_(subject_ids),
+                                Patient.deleted_at.is_(None),
+                            )
+                            .options(selectinload(Patient.consents))
+                        )
+                    }
+                    tombstones = {erased_reference(s): s for s in subject_ids}
+                    deleted = {
+                        tombstones.get(reference, reference)
+                        for reference in session.scalars(
+                            select(Patient.external_reference).where(
+                                Patient.external_reference.in_(subject_ids + list(tombstones)),
+                                Patient.deleted_at.is_not(None),
+                            )
+                        )
+                    }
+                    for subject_id, record in batch.items():
+                        if subject_id in deleted:
+                            continue
+                        patient = patients.get(subject_id)
+                        if patient is None:
+                            patient = Patient(external_reference=subject_id)
+                            session.add(patient)
+                        row = _active_row(patient)
+                        if row is None:
+                            row = ConsentRow(patient=patient)
+                            session.add(row)
+                        _apply(record, patient, row)
+            except Exception:
+                # Keep the writes queued so a later flush can retry them.
+                self._pending = {**batch, **self._pending}
+                raise
+            for subject_id in deleted:
+                self._cache.pop(subject_id, None)
+                if self._expiry is not None:
+                    self._expiry.remove(subject_id)
+
+    def close(self) -> None:
+        self.flush()
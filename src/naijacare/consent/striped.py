@@ -0,0 +1,128 @@
+"""Thread-safe consent store with lock striping by subject id."""
+
+from __future__ import annotations
+
+import copy
+import heapq
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Iterable
+
+from .expiry import ExpiryIndex
+from .tracker import ConsentRecord, notify_change
+from .validator import CONSENT_MISSING, consent_reason
+
+DEFAULT_SHARDS = 16
+
+
+class _Shard:
+    __slots__ = ("lock", "records", "expiry")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.records: dict[str, ConsentRecord] = {}
+        self.expiry = ExpiryIndex()
+
+
+class StripedConsentStore:
+    """``ConsentStore`` for multi-threaded servers.
+
+    Subjects are spread over ``shards`` independently locked partitions by
+    hash of the subject id, so threads working on different subjects rarely
+    contend. The store owns its records: ``upsert`` takes a private copy and
+    ``get`` returns a snapshot, so a caller never sees a record half-way
+    through a concurrent change. Mutate stored records with ``grant``,
+    ``withdraw`` or ``update``, and validate with ``check``, each of which
+    runs under the subject's shard lock.
+    """
+
+    def __init__(self, shards: int = DEFAULT_SHARDS) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._shards = tuple(_Shard() for _ in range(shards))
+
+    def _shard(self, subject_id: str) -> _Shard:
+        return self._shards[hash(subject_id) % len(self._shards)]
+
+    def upsert(self, record: ConsentRecord) -> None:
+        record = copy.deepcopy(record)
+        shard = self._shard(record.subject_id)
+        with shard.lock:
+            shard.records[record.subject_id] = record
+            shard.expiry.update(record.subject_id, record.reconsent_due_at)
+        notify_change(record.subject_id)
+
+    def get(self, subject_id: str) -> ConsentRecord | None:
+        """Snapshot of the stored record (changes to it do not affect the store)."""
+        shard = self._shard(subject_id)
+        with shard.lock:
+            record = shard.records.get(subject_id)
+            return copy.deepcopy(record) if record is not None else None
+
+    def update(
+        self, subject_id: str, mutate: Callable[[ConsentRecord], None]
+    ) -> ConsentRecord | None:
+        """Apply ``mutate`` to the stored record atomically; returns a snapshot.
+
+        Change listeners are told once, after the shard lock is released, so
+        ``mutate`` should not notify itself (pass ``notify=False`` to
+        ``ConsentRecord.grant``/``withdraw``).
+        """
+        shard = self._shard(subject_id)
+        with shard.lock:
+            record = shard.records.get(subject_id)
+            if record is None:
+                return None
+            mutate(record)
+            shard.expiry.update(subject_id, record.reconsent_due_at)
+            snapshot = copy.deepcopy(record)
+        notify_change(subject_id)
+        return snapshot
+
+    def grant(
+        self, subject_id: str, scopes: Iterable[str], consented_at: datetime | None = None
+    ) -> ConsentRecord | None:
+        scopes = tuple(scopes)
+        return self.update(
+            subject_id, lambda record: record.grant(scopes, consented_at, notify=False)
+        )
+
+    def withdraw(
+        self, subject_id: str, withdrawn_at: datetime | None = None
+    ) -> ConsentRecord | None:
+        return self.update(subject_id, lambda record: record.withdraw(withdrawn_at, notify=False))
+
+    def remove(self, subject_id: str) -> ConsentRecord | None:
+        shard = self._shard(subject_id)
+        with shard.lock:
+            record = shard.records.pop(subject_id, None)
+            shard.expiry.remove(subject_id)
+        notify_change(subject_id)
+        return record
+
+    def check(
+        self, subject_id: str, required_scopes: set[str], now: datetime | None = None
+    ) -> int:
+        """Consent reason code for a subject, evaluated under its shard lock.
+
+        Unknown subjects report ``CONSENT_MISSING``.
+        """
+        shard = self._shard(subject_id)
+        with shard.lock:
+            record = shard.records.get(subject_id)
+            if record is None:
+                return CONSENT_MISSING
+            return consent_reason(record, required_scopes, now)
+
+    def due_for_reconsent(
+        self, within_days: int, now: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """``(subject_id, deadline)`` pairs lapsing within ``within_days``, earliest first."""
+        per_shard = []
+        for shard in self._shards:
+            with shard.lock:
+                per_shard.append(shard.expiry.due_within(within_days, now))
+        return list(heapq.merge(*per_shard, key=lambda item: (item[1], item[0])))
+
+    def __len__(self) -> int:
+        return sum(len(shard.records) for shard in self._shards)
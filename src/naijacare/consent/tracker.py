@@ -3,11 +3,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Iterable
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+from weakref import WeakMethod
 
+from .expiry import ExpiryIndex
 
 CONSENT_SCOPES = {"data_collection", "ai_processing", "third_party_sharing"}
+RECONSENT_WINDOW_DAYS = 90
+
+# Bound methods called with a subject id whenever that subject's consent changes.
+_change_listeners: list[WeakMethod] = []
+
+
+def add_change_listener(callback: Callable[[str], None]) -> None:
+    """Register a bound method to be told about consent changes.
+
+    Only a weak reference is kept, so a listener disappears with its owner.
+    """
+    _change_listeners.append(WeakMethod(callback))
+
+
+def notify_change(subject_id: str) -> None:
+    dead = False
+    for ref in tuple(_change_listeners):
+        callback = ref()
+        if callback is None:
+            dead = True
+        else:
+            callback(subject_id)
+    if dead:
+        _change_listeners[:] = [ref for ref in _change_listeners if ref() is not None]
 
 
 @dataclass
@@ -23,27 +49,51 @@ class ConsentRecord:
     consent_version: str = "v1"
     metadata: dict[str, str] = field(default_factory=dict)
 
-    def grant(self, scopes: Iterable[str], consented_at: datetime | None = None) -> None:
+    def grant(
+        self, scopes: Iterable[str], consented_at: datetime | None = None, notify: bool = True
+    ) -> None:
         self.granted_scopes.update(scopes)
         self.consented_at = consented_at or datetime.utcnow()
         self.last_reconsent_at = self.consented_at
+        if notify:
+            notify_change(self.subject_id)
 
-    def withdraw(self, withdrawn_at: datetime | None = None) -> None:
+    def withdraw(self, withdrawn_at: datetime | None = None, notify: bool = True) -> None:
         self.withdrawn_at = withdrawn_at or datetime.utcnow()
+        if notify:
+            notify_change(self.subject_id)
 
     def anonymize(self) -> None:
+        subject_id = self.subject_id
         self.subject_id = "ANONYMIZED"
         self.metadata.clear()
+        notify_change(subject_id)
+
+    @property
+    def reconsent_due_at(self) -> datetime | None:
+        """When active consent lapses; ``None`` if not consented or withdrawn."""
+        if self.consented_at is None or self.withdrawn_at is not None:
+            return None
+        last_consent = self.last_reconsent_at or self.consented_at
+        return last_consent + timedelta(days=RECONSENT_WINDOW_DAYS)
 
 
 class ConsentStore:
-    """In-memory consent store for prototype workflows."""
+    """In-memory consent store for prototype workflows.
+
+    Re-consent deadlines are tracked in an ``ExpiryIndex`` kept current by
+    ``upsert``, ``grant`` and ``withdraw``; changes made directly on a stored
+    record should be followed by ``upsert`` to re-index it.
+    """
 
     def __init__(self) -> None:
         self._records: dict[str, ConsentRecord] = {}
+        self._expiry = ExpiryIndex()
 
     def upsert(self, record: ConsentRecord) -> None:
         self._records[record.subject_id] = record
+        self._expiry.update(record.subject_id, record.reconsent_due_at)
+        notify_change(record.subject_id)
 
     def get(self, subject_id: str) -> ConsentRecord | None:
         return self._records.get(subject_id)
@@ -52,4 +102,32 @@ class ConsentStore:
         record = self._records.get(subject_id)
         if record:
             record.withdraw(withdrawn_at)
+            self._expiry.remove(subject_id)
         return record
+
+    def remove(self, subject_id: str) -> ConsentRecord | None:
+        """Drop a subject from the store (used by erasure)."""
+        record = self._records.pop(subject_id, None)
+        self._expiry.remove(subject_id)
+        notify_change(subject_id)
+        return record
+
+    def grant(
+        self, subject_id: str, scopes: Iterable[str], consented_at: datetime | None = None
+    ) -> ConsentRecord | None:
+        """Grant (or renew) consent for a stored subject."""
+        record = self._records.get(subject_id)
+        if record:
+            record.grant(scopes, consented_at)
+            self._expiry.update(subject_id, record.reconsent_due_at)
+        return record
+
+    def due_for_reconsent(
+        self, within_days: int, now: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """``(subject_id, deadline)`` pairs lapsing within ``within_days``, earliest first.
+
+        Already-lapsed subjects are included. Cost is proportional to the
+        matching subjects, not to the size of the store.
+        """
+        return self._expiry.due_within(within_days, now)
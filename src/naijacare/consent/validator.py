@@ -2,39 +2,188 @@
 
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Iterable, Sequence
 
-from .tracker import CONSENT_SCOPES, ConsentRecord
+from .tracker import CONSENT_SCOPES, RECONSENT_WINDOW_DAYS, ConsentRecord
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
 
-RECONSENT_WINDOW_DAYS = 90
 MINIMUM_CONSENT_AGE = 16
 
+# Reason codes returned by ``validate_consent_many``, in the order the scalar
+# validator checks them; CONSENT_REASONS[code] is the matching error message.
+(
+    CONSENT_VALID,
+    CONSENT_MINOR,
+    CONSENT_WITHDRAWN,
+    CONSENT_MISSING,
+    CONSENT_UNKNOWN_SCOPE,
+    CONSENT_SCOPE_MISSING,
+    CONSENT_EXPIRED,
+) = range(7)
+CONSENT_REASONS = (
+    None,
+    "Minor requires guardian consent",
+    "Consent has been withdrawn",
+    "Consent has not been provided",
+    "Unknown consent scope requested",
+    "Required consent scope missing",
+    "Consent expired; re-consent required",
+)
+
+SCOPE_BITS = {scope: 1 << i for i, scope in enumerate(sorted(CONSENT_SCOPES))}
+NO_TIMESTAMP = -(2**63)
+_EPOCH = datetime(1970, 1, 1)
+_WINDOW_US = RECONSENT_WINDOW_DAYS * 86_400 * 1_000_000
+
 
 class ConsentValidationError(ValueError):
     """Raised when consent is invalid or missing."""
 
 
-def validate_consent(record: ConsentRecord, required_scopes: set[str]) -> None:
-    """Validate consent for required scopes.
+def consent_reason(
+    record: ConsentRecord, required_scopes: set[str], now: datetime | None = None
+) -> int:
+    """Reason code for ``record`` (``CONSENT_VALID`` if consent holds) without raising."""
+    if record.age_years < MINIMUM_CONSENT_AGE:
+        return CONSENT_MINOR
+    if record.withdrawn_at is not None:
+        return CONSENT_WITHDRAWN
+    if record.consented_at is None:
+        return CONSENT_MISSING
+    if not required_scopes.issubset(CONSENT_SCOPES):
+        return CONSENT_UNKNOWN_SCOPE
+    if not required_scopes.issubset(record.granted_scopes):
+        return CONSENT_SCOPE_MISSING
+    last_consent = record.last_reconsent_at or record.consented_at
+    if (now or datetime.utcnow()) - last_consent > timedelta(days=RECONSENT_WINDOW_DAYS):
+        return CONSENT_EXPIRED
+    return CONSENT_VALID
+
+
+def validate_consent(
+    record: ConsentRecord, required_scopes: set[str], now: datetime | None = None
+) -> None:
+    """Validate consent for required scopes (as of ``now``, default utcnow).
 
     Raises:
         ConsentValidationError if consent is missing or invalid.
     """
-    if record.age_years < MINIMUM_CONSENT_AGE:
-        raise ConsentValidationError("Minor requires guardian consent")
+    code = consent_reason(record, required_scopes, now)
+    if code != CONSENT_VALID:
+        raise ConsentValidationError(CONSENT_REASONS[code])
 
-    if record.withdrawn_at is not None:
-        raise ConsentValidationError("Consent has been withdrawn")
 
-    if record.consented_at is None:
-        raise ConsentValidationError("Consent has not been provided")
+def _micros(value: datetime | None) -> int:
+    if value is None:
+        return NO_TIMESTAMP
+    return (value - _EPOCH) // timedelta(microseconds=1)
 
-    if not required_scopes.issubset(CONSENT_SCOPES):
-        raise ConsentValidationError("Unknown consent scope requested")
 
-    if not required_scopes.issubset(record.granted_scopes):
-        raise ConsentValidationError("Required consent scope missing")
+def scope_mask(scopes: Iterable[str]) -> int:
+    """Bitmask of known scopes (unknown names are ignored)."""
+    mask = 0
+    for scope in scopes:
+        mask |= SCOPE_BITS.get(scope, 0)
+    return mask
 
-    last_consent = record.last_reconsent_at or record.consented_at
-    if datetime.utcnow() - last_consent > timedelta(days=RECONSENT_WINDOW_DAYS):
-        raise ConsentValidationError("Consent expired; re-consent required")
+
+@dataclass
+class ConsentColumns:
+    """Consent state as parallel columns, one entry per record.
+
+    Timestamps are integer microseconds since 1970-01-01 (naive UTC), with
+    ``NO_TIMESTAMP`` for missing values. Columns may be ``array`` objects or
+    NumPy arrays.
+    """
+
+    ages: Sequence[int]
+    withdrawn: Sequence[int]
+    consented_at: Sequence[int]
+    last_reconsent_at: Sequence[int]
+    scope_masks: Sequence[int]
+
+    @classmethod
+    def from_records(cls, records: Iterable[ConsentRecord]) -> ConsentColumns:
+        columns = cls(array("i"), array("B"), array("q"), array("q"), array("B"))
+        for record in records:
+            columns.ages.append(record.age_years)
+            columns.withdrawn.append(record.withdrawn_at is not None)
+            columns.consented_at.append(_micros(record.consented_at))
+            columns.last_reconsent_at.append(_micros(record.last_reconsent_at))
+            columns.scope_masks.append(scope_mask(record.granted_scopes))
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+
+def validate_consent_many(
+    columns: ConsentColumns,
+    required_scopes: set[str],
+    now: datetime | None = None,
+    use_numpy: bool | None = None,
+):
+    """Validate every record in ``columns`` without raising.
+
+    Returns one reason code per record (``CONSENT_VALID`` when consent holds),
+    matching what ``validate_consent`` would raise. Uses NumPy when installed
+    (a ``uint8`` ndarray is returned), otherwise a pure-Python loop returning
+    ``array('B')``; ``use_numpy`` forces either path.
+    """
+    now_us = _micros(now or datetime.utcnow())
+    unknown_scope = not required_scopes.issubset(CONSENT_SCOPES)
+    required = scope_mask(required_scopes)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _validate_numpy(columns, required, unknown_scope, now_us)
+
+    codes = array("B")
+    for age, withdrawn, consented, reconsented, mask in zip(
+        columns.ages,
+        columns.withdrawn,
+        columns.consented_at,
+        columns.last_reconsent_at,
+        columns.scope_masks,
+    ):
+        if age < MINIMUM_CONSENT_AGE:
+            code = CONSENT_MINOR
+        elif withdrawn:
+            code = CONSENT_WITHDRAWN
+        elif consented == NO_TIMESTAMP:
+            code = CONSENT_MISSING
+        elif unknown_scope:
+            code = CONSENT_UNKNOWN_SCOPE
+        elif mask & required != required:
+            code = CONSENT_SCOPE_MISSING
+        else:
+            last = consented if reconsented == NO_TIMESTAMP else reconsented
+            code = CONSENT_EXPIRED if now_us - last > _WINDOW_US else CONSENT_VALID
+        codes.append(code)
+    return codes
+
+
+def _validate_numpy(columns: ConsentColumns, required: int, unknown_scope: bool, now_us: int):
+    ages = np.asarray(columns.ages)
+    consented = np.asarray(columns.consented_at, dtype=np.int64)
+    reconsented = np.asarray(columns.last_reconsent_at, dtype=np.int64)
+    masks = np.asarray(columns.scope_masks)
+
+    # Assign from the last check to the first so earlier checks take precedence.
+    codes = np.zeros(len(ages), dtype=np.uint8)
+    last = np.where(reconsented == NO_TIMESTAMP, consented, reconsented)
+    codes[(now_us - last) > _WINDOW_US] = CONSENT_EXPIRED
+    codes[(masks & required) != required] = CONSENT_SCOPE_MISSING
+    if unknown_scope:
+        codes[:] = CONSENT_UNKNOWN_SCOPE
+    codes[consented == NO_TIMESTAMP] = CONSENT_MISSING
+    codes[np.asarray(columns.withdrawn).astype(bool)] = CONSENT_WITHDRAWN
+    codes[ages < MINIMUM_CONSENT_AGE] = CONSENT_MINOR
+    return codes
@@ -0,0 +1,114 @@
+"""Misspelling-tolerant keyword lookup with a precomputed deletion index (SymSpell-style)."""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+DEFAULT_MAX_DISTANCE = 1
+# Short words sit within one edit of too many ordinary words ("fever"/"never",
+# "severe"/"sever"), so only keywords at least this long are matched fuzzily.
+DEFAULT_MIN_LENGTH = 7
+# Per-token lookup results are memoised; message vocabularies are small and skewed.
+TOKEN_MEMO_SIZE = 50_000
+
+_TOKEN_RE = re.compile(r"[^\W\d_]+")
+
+FuzzyHit = tuple[int, str, int]  # (keyword bit, token as written, edit distance)
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """All strings reachable from ``word`` by removing up to ``max_distance`` characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal-string-alignment distance, or ``max_distance + 1`` if it exceeds the bound."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class DeletionIndex:
+    """Maps every delete-variant of each keyword back to that keyword.
+
+    A token is looked up by generating its own delete-variants (a number of
+    dict probes that depends on the token length and ``max_distance``, not on
+    the keyword count) and verifying candidates with a bounded edit distance.
+    Keyword bits match the order of ``keywords``, as in ``KeywordMatcher``.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        min_length: int = DEFAULT_MIN_LENGTH,
+    ) -> None:
+        if max_distance < 0:
+            raise ValueError("max_distance must be >= 0")
+        self.keywords = tuple(keywords)
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self._index: dict[str, list[int]] = {}
+        self._memo: dict[str, tuple[tuple[int, int], ...]] = {}
+        for bit, keyword in enumerate(self.keywords):
+            # Multi-word keywords are left to the exact matcher.
+            if len(keyword) < min_length or not _TOKEN_RE.fullmatch(keyword):
+                continue
+            for variant in _deletes(keyword, max_distance):
+                self._index.setdefault(variant, []).append(bit)
+
+    def lookup(self, token: str) -> tuple[tuple[int, int], ...]:
+        """Return ``(keyword bit, distance)`` for keywords within range of ``token``."""
+        if len(token) < self.min_length - self.max_distance:
+            return ()
+        result = self._memo.get(token)
+        if result is None:
+            if len(self._memo) >= TOKEN_MEMO_SIZE:
+                self._memo.clear()
+            result = self._memo[token] = self._lookup(token)
+        return result
+
+    def _lookup(self, token: str) -> tuple[tuple[int, int], ...]:
+        found: dict[int, int] = {}
+        for variant in _deletes(token, self.max_distance):
+            for bit in self._index.get(variant, ()):
+                if bit not in found:
+                    distance = edit_distance(token, self.keywords[bit], self.max_distance)
+                    if distance <= self.max_distance:
+                        found[bit] = distance
+        return tuple(sorted(found.items()))
+
+    def search(self, text: str, skip_mask: int = 0) -> tuple[FuzzyHit, ...]:
+        """Find misspelled keywords in lowercased ``text``.
+
+        Keywords whose bit is in ``skip_mask`` (already matched exactly) and
+        exact token matches are not reported.
+        """
+        if not self._index:
+            return ()
+        hits: list[FuzzyHit] = []
+        seen = skip_mask
+        for token in _TOKEN_RE.findall(text):
+            for bit, distance in self.lookup(token):
+                if distance and not seen >> bit & 1:
+                    seen |= 1 << bit
+                    hits.append((bit, token, distance))
+        return tuple(hits)
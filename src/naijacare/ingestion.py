@@ -0,0 +1,227 @@
+"""Asyncio ingestion service with an emergency priority lane (non-clinical prototype)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .audit import AuditLog
+from .cache import DecisionCache
+from .models import Message, RoutingDecision
+from .routing import DECISIONS, ESCALATE_IMMEDIATELY, has_red_flag, route_message
+from .rulesets import RuleSet, get_active_ruleset
+
+PRIORITY = "priority"
+ROUTINE = "routine"
+
+DEFAULT_PRIORITY_WORKERS = 2
+DEFAULT_ROUTINE_WORKERS = 4
+DEFAULT_MAX_ROUTINE_QUEUE = 10_000
+DEFAULT_PRIORITY_LATENCY_TARGET = 0.05  # seconds from enqueue to pickup
+
+
+@dataclass
+class LaneMetrics:
+    """Counters and queue wait times for one lane."""
+
+    enqueued: int = 0
+    completed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    target_breaches: int = 0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.completed if self.completed else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "enqueued": self.enqueued,
+            "completed": self.completed,
+            "mean_wait_ms": self.mean_wait * 1000,
+            "max_wait_ms": self.max_wait * 1000,
+            "target_breaches": self.target_breaches,
+        }
+
+
+class IngestionService:
+    """Routes messages from two asyncio queues.
+
+    ``submit`` only triages: messages with an exact red-flag keyword skip the
+    routine backlog and go to the priority lane, which has its own workers.
+    Routine workers also drain the priority lane before taking routine work,
+    so such an emergency never waits behind routine messages. Workers make
+    the full routing decision (including the fuzzy pass and the cache); a
+    message escalated only by a fuzzy match is still escalated, but via the
+    routine lane.
+
+    Routing and audit logging are synchronous (cache and storage locks, sink
+    backpressure), so each lane runs them on its own thread pool, one thread
+    per worker: a stalled audit write holds up only the worker that made it,
+    and never the event loop or the other lane.
+    """
+
+    def __init__(
+        self,
+        priority_workers: int = DEFAULT_PRIORITY_WORKERS,
+        routine_workers: int = DEFAULT_ROUTINE_WORKERS,
+        max_routine_queue: int = DEFAULT_MAX_ROUTINE_QUEUE,
+        priority_latency_target: float = DEFAULT_PRIORITY_LATENCY_TARGET,
+        audit_log: AuditLog | None = None,
+        cache: DecisionCache | None = None,
+    ) -> None:
+        if priority_workers < 1 or routine_workers < 1:
+            raise ValueError("Each lane needs at least one worker")
+        self.priority_workers = priority_workers
+        self.routine_workers = routine_workers
+        self.max_routine_queue = max_routine_queue
+        self.priority_latency_target = priority_latency_target
+        self.audit_log = audit_log
+        self.cache = cache
+        self.lanes = {PRIORITY: LaneMetrics(), ROUTINE: LaneMetrics()}
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Create the lane queues and worker tasks on the running loop."""
+        if self._tasks:
+            return
+        self._queues = {
+            PRIORITY: asyncio.Queue(),
+            ROUTINE: asyncio.Queue(maxsize=self.max_routine_queue),
+        }
+        self._executors = {
+            PRIORITY: ThreadPoolExecutor(self.priority_workers, f"naijacare-{PRIORITY}"),
+            ROUTINE: ThreadPoolExecutor(self.routine_workers, f"naijacare-{ROUTINE}"),
+        }
+        self._tasks = [
+            asyncio.ensure_future(self._worker(PRIORITY)) for _ in range(self.priority_workers)
+        ] + [
+            asyncio.ensure_future(self._worker(ROUTINE)) for _ in range(self.routine_workers)
+        ]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop workers, optionally after finishing queued messages."""
+        if drain:
+            for queue in self._queues.values():
+                await queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._executors = {}
+
+    async def submit(self, msg: Message) -> RoutingDecision:
+        """Queue ``msg`` on the lane chosen by triage and await its decision."""
+        if not self._tasks:
+            raise RuntimeError("IngestionService.start() has not been awaited")
+        ruleset = get_active_ruleset()
+        lane = PRIORITY if has_red_flag(msg.text, ruleset) else ROUTINE
+        future = asyncio.get_running_loop().create_future()
+        self.lanes[lane].enqueued += 1
+        await self._queues[lane].put((msg, ruleset, time.perf_counter(), future))
+        return await future
+
+    def _next_item(self, lane: str):
+        """Non-blocking pickup; routine workers help with priority work first."""
+        priority = self._queues[PRIORITY]
+        if lane == ROUTINE and not priority.empty():
+            return PRIORITY, priority.get_nowait()
+        queue = self._queues[lane]
+        if not queue.empty():
+            return lane, queue.get_nowait()
+        return None
+
+    async def _worker(self, lane: str) -> None:
+        loop = asyncio.get_running_loop()
+        # The worker's own lane pool, also for priority work a routine worker
+        # picks up: each pool has a thread per worker of its lane.
+        executor = self._executors[lane]
+        while True:
+            picked = self._next_item(lane)
+            if picked is None:
+                picked = lane, await self._queues[lane].get()
+            item_lane, (msg, ruleset, enqueued_at, future) = picked
+            try:
+                self._record_wait(item_lane, time.perf_counter() - enqueued_at)
+                decision = await loop.run_in_executor(executor, self._process, msg, ruleset)
+                if not future.done():
+                    future.set_result(decision)
+            except Exception as exc:  # surface to the submitter, keep the worker alive
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                self._queues[item_lane].task_done()
+            # Yield so queued submitters and other workers get the loop.
+            await asyncio.sleep(0)
+
+    def _process(self, msg: Message, ruleset: RuleSet) -> RoutingDecision:
+        """Route and audit one message (on a lane thread)."""
+        decision = route_message(msg, ruleset, self.cache)
+        if self.audit_log is not None:
+            self.audit_log.log(
+                clinic_id=msg.sender,
+                decision=decision.decision,
+                message_text=msg.text,
+                has_emergency=decision.decision == DECISIONS[ESCALATE_IMMEDIATELY],
+            )
+        return decision
+
+    def _record_wait(self, lane: str, wait: float) -> None:
+        metrics = self.lanes[lane]
+        metrics.completed += 1
+        metrics.total_wait += wait
+        metrics.max_wait = max(metrics.max_wait, wait)
+        if lane == PRIORITY and wait > self.priority_latency_target:
+            metrics.target_breaches += 1
+
+    def metrics(self) -> dict:
+        """Queue depth and per-lane wait-time metrics."""
+        return {
+            "queue_depth": {lane: q.qsize() for lane, q in self._queues.items()},
+            "lanes": {lane: m.as_dict() for lane, m in self.lanes.items()},
+            "workers": {PRIORITY: self.priority_workers, ROUTINE: self.routine_workers},
+            "priority_latency_target_ms": self.priority_latency_target * 1000,
+        }
+
+
+class ThreadedIngestion:
+    """Runs an IngestionService on a dedicated event-loop thread.
+
+    Lets synchronous callers (e.g. Flask views) submit messages and block on
+    the decision without running their own event loop.
+    """
+
+    def __init__(self, service: IngestionService) -> None:
+        self.service = service
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="naijacare-ingestion", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.service.start(), self._loop).result()
+
+    def route(self, msg: Message, timeout: float | None = None) -> RoutingDecision:
+        future = asyncio.run_coroutine_threadsafe(self.service.submit(msg), self._loop)
+        return future.result(timeout)
+
+    def metrics(self) -> dict:
+        return asyncio.run_coroutine_threadsafe(self._metrics(), self._loop).result()
+
+    async def _metrics(self) -> dict:
+        return self.service.metrics()
+
+    def stop(self, drain: bool = True) -> None:
+        if not self._thread.is_alive():
+            return  # already stopped (e.g. explicitly, then again via atexit)
+        asyncio.run_coroutine_threadsafe(self.service.stop(drain), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
@@ -0,0 +1,135 @@
+"""Low-overhead per-stage timing with fixed-bucket latency histograms.
+
+Hot paths read the module-level ``recorder`` and call ``start()`` / ``lap()``
+on it. By default it is a ``NullRecorder`` whose methods do nothing, so
+instrumentation costs a couple of no-op calls until ``enable()`` is called.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+from time import perf_counter_ns
+from typing import Sequence
+
+# Upper bucket bounds in microseconds; one extra overflow bucket is implied.
+DEFAULT_BUCKETS_US: tuple[float, ...] = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000, 50_000, 100_000,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (values recorded in nanoseconds)."""
+
+    __slots__ = ("bounds_us", "_bounds_ns", "counts", "count", "total_ns", "max_ns")
+
+    def __init__(self, bounds_us: Sequence[float] = DEFAULT_BUCKETS_US) -> None:
+        self.bounds_us = tuple(bounds_us)
+        self._bounds_ns = [b * 1_000 for b in self.bounds_us]
+        self.counts = [0] * (len(self.bounds_us) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def observe(self, elapsed_ns: int) -> None:
+        self.counts[bisect_left(self._bounds_ns, elapsed_ns)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def percentile(self, pct: float) -> float | None:
+        """Upper bound (µs) of the bucket holding the ``pct``-th percentile."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.bounds_us[i] if i < len(self.bounds_us) else self.max_ns / 1_000
+        return self.max_ns / 1_000
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1_000 if self.count else 0.0,
+            "max_us": self.max_ns / 1_000,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+            "buckets_us": list(self.bounds_us) + ["+Inf"],
+            "counts": list(self.counts),
+        }
+
+
+class NullRecorder:
+    """Default recorder: every hook is a no-op."""
+
+    enabled = False
+
+    def start(self) -> int:
+        return 0
+
+    def lap(self, stage: str, started: int) -> int:
+        return 0
+
+    def snapshot(self) -> dict:
+        return {}
+
+    def reset(self) -> None:
+        pass
+
+
+class Recorder:
+    """Collects one histogram per stage name."""
+
+    enabled = True
+
+    def __init__(self, bounds_us: Sequence[float] = DEFAULT_BUCKETS_US) -> None:
+        self.bounds_us = tuple(bounds_us)
+        self.histograms: dict[str, Histogram] = {}
+        self._lock = Lock()
+
+    def start(self) -> int:
+        return perf_counter_ns()
+
+    def lap(self, stage: str, started: int) -> int:
+        """Record time since ``started`` under ``stage``; returns the new start."""
+        now = perf_counter_ns()
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, Histogram(self.bounds_us))
+        histogram.observe(now - started)
+        return now
+
+    def snapshot(self) -> dict:
+        return {stage: h.snapshot() for stage, h in sorted(self.histograms.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = {}
+
+
+recorder: NullRecorder | Recorder = NullRecorder()
+
+
+def enable(bounds_us: Sequence[float] = DEFAULT_BUCKETS_US) -> Recorder:
+    """Start recording stage timings (replaces any previous recorder)."""
+    global recorder
+    recorder = Recorder(bounds_us)
+    return recorder
+
+
+def disable() -> None:
+    global recorder
+    recorder = NullRecorder()
+
+
+def export_json(path: str | Path) -> None:
+    """Write the current histograms to a JSON file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(recorder.snapshot(), indent=2))
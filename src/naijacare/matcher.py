@@ -0,0 +1,88 @@
+"""Compiled multi-keyword matcher (Aho-Corasick automaton)."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+class KeywordMatcher:
+    """Finds every keyword occurring in a text with a single left-to-right pass.
+
+    Keywords are compiled once into an Aho-Corasick automaton. Matching keeps
+    the substring semantics of ``keyword in text`` (overlapping hits included),
+    but the cost depends on the text length, not on the number of keywords.
+
+    Each keyword is assigned a bit (its position in ``keywords``); ``scan``
+    returns the OR of the bits of every keyword found.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: tuple[str, ...] = tuple(keywords)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[int] = [0]
+
+        for bit, keyword in enumerate(self.keywords):
+            if not keyword:
+                raise ValueError("Keywords must be non-empty strings")
+            self._insert(keyword, 1 << bit)
+        self._link()
+
+    def _insert(self, keyword: str, mask: int) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(0)
+            node = nxt
+        self._out[node] |= mask
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and fold outputs along them."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] |= self._out[self._fail[child]]
+
+    def scan(self, text: str) -> int:
+        """Return the bitmask of all keywords occurring in ``text``."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        node = 0
+        found = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            found |= out[node]
+        return found
+
+    def find(self, text: str) -> list[str]:
+        """Return matched keywords in declaration order."""
+        return self.names(self.scan(text))
+
+    def names(self, mask: int) -> list[str]:
+        """Decode a bitmask into keyword names in declaration order."""
+        keywords = self.keywords
+        names = []
+        bit = 0
+        while mask:
+            if mask & 1:
+                names.append(keywords[bit])
+            mask >>= 1
+            bit += 1
+        return names
+
+    def __len__(self) -> int:
+        return len(self.keywords)
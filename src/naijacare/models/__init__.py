@@ -1,5 +1,5 @@
 """Model exports for NaijaCare."""
 
-from .pydantic import AuditEntry, Message, RoutingDecision
+from .pydantic import AuditEntry, FuzzyMatch, Message, RoutingDecision
 
-__all__ = ["AuditEntry", "Message", "RoutingDecision"]
+__all__ = ["AuditEntry", "FuzzyMatch", "Message", "RoutingDecision"]
@@ -0,0 +1,113 @@
+"""Compact slotted representations for the routing hot path.
+
+These mirror the pydantic models field-for-field but skip validation and the
+per-instance ``__dict__``. Convert with ``to_model()`` at the API boundary.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from .pydantic import AuditEntry, FuzzyMatch, RoutingDecision
+
+
+class CompactDecision:
+    """Immutable routing outcome; common outcomes are shared instances."""
+
+    __slots__ = ("decision", "reason", "flags", "ruleset_version", "fuzzy_matches")
+
+    def __init__(
+        self,
+        decision: str,
+        reason: str | None,
+        flags: tuple[str, ...] = (),
+        ruleset_version: str | None = None,
+        fuzzy_matches: tuple[tuple[str, str, int], ...] = (),
+    ) -> None:
+        # Instances are shared between callers, so fields are set once here.
+        object.__setattr__(self, "decision", decision)
+        object.__setattr__(self, "reason", reason)
+        object.__setattr__(self, "flags", tuple(flags))
+        object.__setattr__(self, "ruleset_version", ruleset_version)
+        object.__setattr__(self, "fuzzy_matches", tuple(fuzzy_matches))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("CompactDecision is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("CompactDecision is immutable")
+
+    def to_model(self) -> RoutingDecision:
+        return RoutingDecision(
+            decision=self.decision,
+            reason=self.reason,
+            flags=list(self.flags),
+            ruleset_version=self.ruleset_version,
+            fuzzy_matches=[
+                FuzzyMatch(keyword=keyword, matched=matched, distance=distance)
+                for keyword, matched, distance in self.fuzzy_matches
+            ],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactDecision):
+            return NotImplemented
+        return all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash((self.decision, self.flags, self.ruleset_version))
+
+    def __repr__(self) -> str:
+        return f"CompactDecision({self.decision!r}, flags={self.flags!r})"
+
+
+class AuditRecord:
+    """Slotted audit entry; field names match ``AuditEntry``."""
+
+    __slots__ = (
+        "clinic_id_hash",
+        "decision",
+        "timestamp",
+        "message_length",
+        "has_emergency_flag",
+    )
+
+    def __init__(
+        self,
+        clinic_id_hash: str,
+        decision: str,
+        timestamp: datetime,
+        message_length: int,
+        has_emergency_flag: bool,
+    ) -> None:
+        self.clinic_id_hash = clinic_id_hash
+        self.decision = decision
+        self.timestamp = timestamp
+        self.message_length = message_length
+        self.has_emergency_flag = has_emergency_flag
+
+    @classmethod
+    def from_model(cls, entry: AuditEntry) -> AuditRecord:
+        return cls(
+            entry.clinic_id_hash,
+            entry.decision,
+            entry.timestamp,
+            entry.message_length,
+            entry.has_emergency_flag,
+        )
+
+    def as_dict(self) -> dict:
+        """Same shape as ``AuditEntry.model_dump()``."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self) -> AuditEntry:
+        # Values were produced by AuditLog itself, so validation can be skipped.
+        return AuditEntry.model_construct(**self.as_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AuditRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"AuditRecord({self.as_dict()!r})"
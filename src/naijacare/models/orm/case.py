@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,7 +19,7 @@ class Case(Base, TimestampMixin, SoftDeleteMixin):
     id: Mapped[int] = mapped_column(primary_key=True)
     patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"), nullable=False)
     status: Mapped[str] = mapped_column(String(32), default="open")
-    opened_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), default=None)
+    opened_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
     summary: Mapped[str | None] = mapped_column(String(255))
 
     patient: Mapped["Patient"] = relationship(back_populates="cases")
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import DateTime, ForeignKey, String
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .mixins import SoftDeleteMixin, TimestampMixin
@@ -20,7 +22,11 @@ class ConsentRecord(Base, TimestampMixin, SoftDeleteMixin):
     scope_data_collection: Mapped[bool] = mapped_column(default=False)
     scope_ai_processing: Mapped[bool] = mapped_column(default=False)
     scope_third_party: Mapped[bool] = mapped_column(default=False)
-    consented_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), default=None)
-    withdrawn_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), default=None)
+    consented_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    withdrawn_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    last_reconsent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+    details: Mapped[dict] = mapped_column(JSON, default=dict)
 
     patient: Mapped["Patient"] = relationship(back_populates="consents")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import date
+
 from sqlalchemy import Date, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,7 +17,7 @@ class FieldNote(Base, TimestampMixin):
     __tablename__ = "field_notes"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    visit_date: Mapped[Date]
+    visit_date: Mapped[date] = mapped_column(Date)
     location: Mapped[str] = mapped_column(String(120))
     summary: Mapped[str] = mapped_column(String(255))
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,7 +20,7 @@ class RoutingDecision(Base, TimestampMixin):
     case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"), nullable=False)
     method: Mapped[str] = mapped_column(String(32), default="keyword")
     outcome: Mapped[str] = mapped_column(String(64))
-    decided_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), default=None)
+    decided_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
     reviewer_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
 
     case: Mapped["Case"] = relationship(back_populates="routing_decisions")
@@ -14,6 +14,14 @@ class Message(BaseModel):
     timestamp: Optional[datetime] = None
 
 
+class FuzzyMatch(BaseModel):
+    """A keyword matched despite a misspelling."""
+
+    keyword: str = Field(..., description="Canonical keyword from the rule set")
+    matched: str = Field(..., description="Token as written in the message")
+    distance: int = Field(..., description="Edit distance between the two")
+
+
 class RoutingDecision(BaseModel):
     """Routing outcome."""
 
@@ -22,6 +30,10 @@ class RoutingDecision(BaseModel):
     )
     reason: Optional[str] = None
     flags: list[str] = Field(default_factory=list)
+    ruleset_version: Optional[str] = Field(
+        default=None, description="Version of the rule set that produced the decision"
+    )
+    fuzzy_matches: list[FuzzyMatch] = Field(default_factory=list)
 
 
 class AuditEntry(BaseModel):
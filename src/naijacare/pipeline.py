@@ -0,0 +1,103 @@
+"""Streaming JSONL ingestion: read → validate → route → audit → sink, in bounded chunks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import ValidationError
+
+from .audit import AuditLog
+from .cache import DecisionCache
+from .models import Message
+from .routing import ESCALATE_IMMEDIATELY, RoutingBatch, route_messages
+from .rulesets import RuleSet
+
+DEFAULT_CHUNK_SIZE = 1000
+
+Sink = Callable[[list[Message], RoutingBatch], None]
+
+
+class IngestError(ValueError):
+    """Raised when a JSONL line cannot be parsed into a Message."""
+
+
+def _validate_chunk(lines: list[bytes], line_numbers: list[int]) -> list[Message]:
+    # Each line on its own: joining lines into one JSON array would accept
+    # objects or strings spliced across line boundaries.
+    messages = []
+    for line_no, line in zip(line_numbers, lines):
+        try:
+            messages.append(Message.model_validate_json(line))
+        except ValidationError as exc:
+            raise IngestError(f"Line {line_no}: {exc}") from exc
+    return messages
+
+
+def iter_message_chunks(
+    source: str | Path | BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[Message]]:
+    """Yield validated Messages from a JSONL file, ``chunk_size`` lines at a time.
+
+    Blank lines are skipped. At most one chunk of raw lines is held in memory.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from iter_message_chunks(f, chunk_size)
+        return
+
+    line_no = 1
+    while True:
+        raw = list(islice(source, chunk_size))
+        if not raw:
+            return
+        numbered = [(line_no + i, line) for i, line in enumerate(raw) if line.strip()]
+        if numbered:
+            yield _validate_chunk([line for _, line in numbered], [n for n, _ in numbered])
+        line_no += len(raw)
+
+
+def route_chunks(
+    chunks: Iterable[list[Message]],
+    audit_log: AuditLog | None = None,
+    ruleset: RuleSet | None = None,
+    cache: DecisionCache | None = None,
+) -> Iterator[tuple[list[Message], RoutingBatch]]:
+    """Route (and optionally audit) each chunk, yielding it with its batch result."""
+    for messages in chunks:
+        texts = [m.text for m in messages]
+        batch = route_messages(texts, [m.sender for m in messages], ruleset, cache)
+        if audit_log is not None:
+            for i, msg in enumerate(messages):
+                audit_log.log(
+                    clinic_id=msg.sender,
+                    decision=batch.decision_name(i),
+                    message_text=msg.text,
+                    has_emergency=batch.decision_codes[i] == ESCALATE_IMMEDIATELY,
+                )
+        yield messages, batch
+
+
+def run_pipeline(
+    source: str | Path | BinaryIO,
+    sink: Sink,
+    audit_log: AuditLog | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ruleset: RuleSet | None = None,
+    cache: DecisionCache | None = None,
+) -> int:
+    """Stream ``source`` through routing and auditing into ``sink``.
+
+    Returns:
+        Number of messages processed
+    """
+    count = 0
+    chunks = iter_message_chunks(source, chunk_size)
+    for messages, batch in route_chunks(chunks, audit_log, ruleset, cache):
+        sink(messages, batch)
+        count += len(messages)
+    return count
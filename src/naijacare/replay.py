@@ -0,0 +1,138 @@
+"""Multi-process replay of routed traffic (non-clinical prototype)."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Sequence
+
+from .audit import AuditLog
+from .models import Message
+from .routing import ESCALATE_IMMEDIATELY, RoutingBatch, route_messages
+from .rulesets import RuleSet, get_active_ruleset
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_ruleset: RuleSet | None = None
+
+
+@dataclass
+class ReplayStats:
+    """Throughput and per-worker busy time for a replay run."""
+
+    messages: int = 0
+    elapsed: float = 0.0
+    busy_by_worker: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def messages_per_sec(self) -> float:
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    def utilisation(self) -> dict[int, float]:
+        """Fraction of wall-clock time each worker process spent routing."""
+        if not self.elapsed:
+            return {pid: 0.0 for pid in self.busy_by_worker}
+        return {pid: busy / self.elapsed for pid, busy in self.busy_by_worker.items()}
+
+
+@dataclass
+class ReplayResult:
+    """Merged output of a replay: batches in input order plus one audit log."""
+
+    batches: list[RoutingBatch]
+    audit_log: AuditLog
+    stats: ReplayStats
+
+    def iter_rows(self) -> Iterator[tuple[RoutingBatch, int]]:
+        """Yield ``(batch, row)`` pairs in input order."""
+        for batch in self.batches:
+            for i in range(len(batch)):
+                yield batch, i
+
+
+def _init_worker(ruleset: RuleSet) -> None:
+    global _worker_ruleset
+    _worker_ruleset = ruleset
+
+
+def _route_chunk(chunk: tuple[list[str], list[str]]):
+    """Route and audit one chunk inside a worker process."""
+    started = time.perf_counter()
+    senders, texts = chunk
+    batch = route_messages(texts, senders, _worker_ruleset)
+    audit_log = AuditLog()
+    for i, text in enumerate(texts):
+        audit_log.log(
+            clinic_id=senders[i],
+            decision=batch.decision_name(i),
+            message_text=text,
+            has_emergency=batch.decision_codes[i] == ESCALATE_IMMEDIATELY,
+        )
+    busy = time.perf_counter() - started
+    columns = batch.decision_codes, batch.flag_masks, batch.fuzzy_hits
+    return columns, audit_log, os.getpid(), busy
+
+
+def iter_replay(
+    chunks: Iterable[list[Message]],
+    workers: int,
+    ruleset: RuleSet | None = None,
+    stats: ReplayStats | None = None,
+) -> Iterator[tuple[list[Message], RoutingBatch, AuditLog]]:
+    """Route and audit a stream of message chunks across a process pool.
+
+    Yields ``(messages, batch, chunk_audit_log)`` in input order. At most
+    ``2 * workers`` chunks are in flight, so memory stays bounded for
+    arbitrarily long inputs. ``stats`` (if given) is updated as chunks finish.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    ruleset = ruleset or get_active_ruleset()
+    stats = stats if stats is not None else ReplayStats()
+    pending: deque = deque()
+    started = time.perf_counter()
+
+    def drain_one():
+        messages, future = pending.popleft()
+        (codes, masks, fuzzy), chunk_log, pid, busy = future.result()
+        senders = [m.sender for m in messages]
+        stats.messages += len(messages)
+        stats.busy_by_worker[pid] = stats.busy_by_worker.get(pid, 0.0) + busy
+        stats.elapsed = time.perf_counter() - started
+        return messages, RoutingBatch(ruleset, senders, codes, codes, masks, fuzzy), chunk_log
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(ruleset,)
+    ) as pool:
+        for messages in chunks:
+            payload = ([m.sender for m in messages], [m.text for m in messages])
+            pending.append((messages, pool.submit(_route_chunk, payload)))
+            # Futures are drained first-in first-out, which keeps the merge ordered.
+            if len(pending) >= 2 * workers:
+                yield drain_one()
+        while pending:
+            yield drain_one()
+
+
+def replay_parallel(
+    messages: Sequence[Message],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ruleset: RuleSet | None = None,
+) -> ReplayResult:
+    """Route and audit ``messages`` across a process pool.
+
+    Chunks are routed with the same rule-set snapshot in every worker, and
+    their audit logs are merged back in input order.
+    """
+    chunks = (messages[start:start + chunk_size] for start in range(0, len(messages), chunk_size))
+    audit_log = AuditLog()
+    stats = ReplayStats()
+    batches = []
+    for _, batch, chunk_log in iter_replay(chunks, workers, ruleset, stats):
+        batches.append(batch)
+        audit_log.merge(chunk_log)
+    return ReplayResult(batches=batches, audit_log=audit_log, stats=stats)
@@ -1,57 +1,330 @@
 """Routing logic with red-flag detection (non-clinical prototype)."""
 
-from .consent import ConsentRecord, ConsentValidationError, validate_consent
-from .models import Message, RoutingDecision
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
 
+from . import instrumentation
+from .cache import DecisionCache, normalise_text
+from .consent import (
+    CONSENT_REASONS,
+    CONSENT_VALID,
+    ConsentDecisionCache,
+    ConsentRecord,
+    consent_reason,
+)
+from .fuzzy import FuzzyHit
+from .models import FuzzyMatch, Message, RoutingDecision
+from .models.compact import CompactDecision
+from .rulesets import (  # noqa: F401  (GENERAL_KEYWORDS/RED_FLAGS re-exported defaults)
+    GENERAL_KEYWORDS,
+    RED_FLAGS,
+    RuleSet,
+    get_active_ruleset,
+)
 
-RED_FLAGS = ["bleeding", "unconscious", "seizure", "unresponsive", "severe"]
 ROUTING_CONSENT_SCOPES = {"data_collection", "ai_processing"}
 
+# Decision and reason codes used by the columnar batch API. Index == code.
+DECISIONS = ("ESCALATE_IMMEDIATELY", "ROUTE_GENERAL", "NON_CLINICAL")
+REASONS = ("Emergency red-flag detected", "General symptoms", "No clinical keywords")
+ESCALATE_IMMEDIATELY, ROUTE_GENERAL, NON_CLINICAL = range(3)
 
-def route_message(msg: Message) -> RoutingDecision:
+# (decision code, red-flag bitmask, fuzzy hits) -- immutable, so safe to cache
+Outcome = tuple[int, int, tuple[FuzzyHit, ...]]
+
+# Shared CompactDecision instances keyed on (rule set, code, reason, flag mask)
+_INTERNED: dict[tuple, CompactDecision] = {}
+_INTERN_LIMIT = 4096
+
+
+def _classify(text: str, ruleset: RuleSet) -> Outcome:
+    """Classify raw message text with one exact scan plus an optional fuzzy pass."""
+    text = text.lower()
+    hits = ruleset.matcher.scan(text)
+    fuzzy = ()
+    if ruleset.fuzzy is not None:
+        fuzzy = ruleset.fuzzy.search(text, skip_mask=hits)
+        for bit, _, _ in fuzzy:
+            hits |= 1 << bit
+    red = hits & ruleset.red_flag_mask
+    if red:
+        return ESCALATE_IMMEDIATELY, red, tuple(h for h in fuzzy if red >> h[0] & 1)
+    if hits:
+        return ROUTE_GENERAL, 0, fuzzy
+    return NON_CLINICAL, 0, ()
+
+
+def _classify_cached(text: str, ruleset: RuleSet, cache: DecisionCache) -> Outcome:
+    normalised = normalise_text(text)
+    key = (normalised, ruleset.version)
+    result = cache.get(key)
+    if result is None:
+        result = _classify(normalised, ruleset)
+        cache.put(key, result)
+    return result
+
+
+def _outcome(text: str, ruleset: RuleSet, cache: Optional[DecisionCache]) -> Outcome:
+    if cache is None:
+        return _classify(text, ruleset)
+    return _classify_cached(text, ruleset, cache)
+
+
+def _build_decision(
+    code: int,
+    reason_code: int,
+    flag_mask: int,
+    ruleset: RuleSet,
+    fuzzy: tuple[FuzzyHit, ...] = (),
+) -> RoutingDecision:
+    keywords = ruleset.matcher.keywords
+    return RoutingDecision(
+        decision=DECISIONS[code],
+        reason=REASONS[reason_code],
+        flags=ruleset.matcher.names(flag_mask),
+        ruleset_version=ruleset.version,
+        fuzzy_matches=[
+            FuzzyMatch(keyword=keywords[bit], matched=token, distance=distance)
+            for bit, token, distance in fuzzy
+        ],
+    )
+
+
+def _compact_decision(
+    code: int,
+    reason_code: int,
+    flag_mask: int,
+    ruleset: RuleSet,
+    fuzzy: tuple[FuzzyHit, ...] = (),
+) -> CompactDecision:
+    """Return a shared CompactDecision for the outcome (fresh only for fuzzy hits)."""
+    if fuzzy:
+        keywords = ruleset.matcher.keywords
+        return CompactDecision(
+            DECISIONS[code],
+            REASONS[reason_code],
+            tuple(ruleset.matcher.names(flag_mask)),
+            ruleset.version,
+            tuple((keywords[bit], token, distance) for bit, token, distance in fuzzy),
+        )
+    key = (ruleset, code, reason_code, flag_mask)
+    decision = _INTERNED.get(key)
+    if decision is None:
+        if len(_INTERNED) >= _INTERN_LIMIT:
+            _INTERNED.clear()
+        decision = _INTERNED[key] = CompactDecision(
+            DECISIONS[code],
+            REASONS[reason_code],
+            tuple(ruleset.matcher.names(flag_mask)),
+            ruleset.version,
+        )
+    return decision
+
+
+def route_message(
+    msg: Message,
+    ruleset: Optional[RuleSet] = None,
+    cache: Optional[DecisionCache] = None,
+) -> RoutingDecision:
     """
     Route a simulated message.
-    
+
     Args:
         msg: Incoming Message object
-        
+        ruleset: Rule set to apply (defaults to the active rule set)
+        cache: Optional DecisionCache consulted before matching
+
     Returns:
         RoutingDecision with decision and flags
-        
+
     NOTE: This is prototype code. Red-flag lists and logic are simulated,
     not clinical guidance.
     """
-    text = msg.text.lower()
-    flags = [flag for flag in RED_FLAGS if flag in text]
-    
-    if flags:
-        return RoutingDecision(
-            decision="ESCALATE_IMMEDIATELY",
-            reason="Emergency red-flag detected",
-            flags=flags
+    ruleset = ruleset or get_active_ruleset()
+    code, flag_mask, fuzzy = _outcome(msg.text, ruleset, cache)
+    return _build_decision(code, code, flag_mask, ruleset, fuzzy)
+
+
+def has_red_flag(text: str, ruleset: Optional[RuleSet] = None) -> bool:
+    """
+    Cheap triage: does ``text`` contain an exact red-flag keyword?
+
+    One automaton scan without the fuzzy pass or a cache lookup. It is meant
+    for picking a queue; ``route_message`` still makes the decision.
+    """
+    ruleset = ruleset or get_active_ruleset()
+    return bool(ruleset.matcher.scan(text.lower()) & ruleset.red_flag_mask)
+
+
+def route_message_compact(
+    text: str,
+    ruleset: Optional[RuleSet] = None,
+    cache: Optional[DecisionCache] = None,
+) -> CompactDecision:
+    """
+    Hot-path variant of route_message: takes raw text, returns a CompactDecision.
+
+    Decisions without fuzzy matches are shared, read-only instances; call
+    ``to_model()`` when a pydantic RoutingDecision is needed.
+    """
+    ruleset = ruleset or get_active_ruleset()
+    code, flag_mask, fuzzy = _outcome(text, ruleset, cache)
+    return _compact_decision(code, code, flag_mask, ruleset, fuzzy)
+
+
+@dataclass
+class RoutingBatch:
+    """Columnar routing results for a batch of messages.
+
+    Row ``i`` describes ``texts[i]``. Pydantic ``RoutingDecision`` objects are
+    only built on request via ``decision(i)`` / ``iter_decisions()``.
+    """
+
+    ruleset: RuleSet
+    senders: Sequence[str]
+    decision_codes: array
+    reason_codes: array
+    flag_masks: list[int]
+    fuzzy_hits: Optional[list[tuple[FuzzyHit, ...]]] = None
+
+    def __len__(self) -> int:
+        return len(self.decision_codes)
+
+    def decision_name(self, i: int) -> str:
+        return DECISIONS[self.decision_codes[i]]
+
+    def reason(self, i: int) -> str:
+        return REASONS[self.reason_codes[i]]
+
+    def flags(self, i: int) -> list[str]:
+        return self.ruleset.matcher.names(self.flag_masks[i])
+
+    def fuzzy(self, i: int) -> list[tuple[str, str, int]]:
+        """``(keyword, token as written, distance)`` for misspelled matches in row ``i``."""
+        if self.fuzzy_hits is None:
+            return []
+        keywords = self.ruleset.matcher.keywords
+        return [(keywords[bit], token, distance) for bit, token, distance in self.fuzzy_hits[i]]
+
+    def is_emergency(self, i: int) -> bool:
+        return self.decision_codes[i] == ESCALATE_IMMEDIATELY
+
+    def decision(self, i: int) -> RoutingDecision:
+        """Materialise row ``i`` as a RoutingDecision."""
+        return _build_decision(
+            self.decision_codes[i],
+            self.reason_codes[i],
+            self.flag_masks[i],
+            self.ruleset,
+            self.fuzzy_hits[i] if self.fuzzy_hits is not None else (),
         )
-    elif any(k in text for k in ["pain", "fever", "cough", "weakness"]):
-        return RoutingDecision(
-            decision="ROUTE_GENERAL",
-            reason="General symptoms",
-            flags=[]
+
+    def compact(self, i: int) -> CompactDecision:
+        """Row ``i`` as a (usually shared) CompactDecision."""
+        return _compact_decision(
+            self.decision_codes[i],
+            self.reason_codes[i],
+            self.flag_masks[i],
+            self.ruleset,
+            self.fuzzy_hits[i] if self.fuzzy_hits is not None else (),
         )
+
+    def iter_decisions(self) -> Iterator[RoutingDecision]:
+        for i in range(len(self)):
+            yield self.decision(i)
+
+    def counts(self) -> dict[str, int]:
+        """Number of rows per decision, computed on the code column."""
+        return {name: self.decision_codes.count(code) for code, name in enumerate(DECISIONS)}
+
+
+def route_messages(
+    texts: Sequence[str],
+    senders: Optional[Sequence[str]] = None,
+    ruleset: Optional[RuleSet] = None,
+    cache: Optional[DecisionCache] = None,
+) -> RoutingBatch:
+    """
+    Route a batch of raw message texts without building per-message models.
+
+    Args:
+        texts: Message contents
+        senders: Clinic/source IDs aligned with ``texts`` (optional)
+        ruleset: Rule set to apply (defaults to the active rule set)
+        cache: Optional DecisionCache consulted before matching
+
+    Returns:
+        RoutingBatch holding decision codes, reason codes and red-flag bitmasks
+    """
+    if senders is None:
+        senders = [""] * len(texts)
+    elif len(senders) != len(texts):
+        raise ValueError("texts and senders must have the same length")
+
+    # One rule-set snapshot for the whole batch, even if a reload happens mid-way.
+    ruleset = ruleset or get_active_ruleset()
+    decision_codes = array("B")
+    flag_masks = []
+    fuzzy_hits = []
+    if cache is None:
+        classify = _classify
     else:
-        return RoutingDecision(
-            decision="NON_CLINICAL",
-            reason="No clinical keywords",
-            flags=[]
-        )
+        def classify(text, ruleset):
+            return _classify_cached(text, ruleset, cache)
 
+    for text in texts:
+        code, flag_mask, fuzzy = classify(text, ruleset)
+        decision_codes.append(code)
+        flag_masks.append(flag_mask)
+        fuzzy_hits.append(fuzzy)
 
-def route_message_with_consent(msg: Message, consent: ConsentRecord) -> RoutingDecision:
-    """Route a message after consent validation."""
-    try:
-        validate_consent(consent, ROUTING_CONSENT_SCOPES)
-    except ConsentValidationError as exc:
-        return RoutingDecision(
+    return RoutingBatch(
+        ruleset=ruleset,
+        senders=senders,
+        decision_codes=decision_codes,
+        reason_codes=array("B", decision_codes),
+        flag_masks=flag_masks,
+        fuzzy_hits=fuzzy_hits,
+    )
+
+
+def route_message_with_consent(
+    msg: Message,
+    consent: ConsentRecord,
+    ruleset: Optional[RuleSet] = None,
+    cache: Optional[DecisionCache] = None,
+    consent_cache: Optional[ConsentDecisionCache] = None,
+) -> RoutingDecision:
+    """Route a message after consent validation.
+
+    With ``consent_cache`` the consent check is memoised per subject until the
+    record changes or reaches its re-consent deadline. Each stage is timed
+    through ``instrumentation.recorder`` (a no-op unless instrumentation has
+    been enabled).
+    """
+    recorder = instrumentation.recorder
+    started = recorder.start()
+    if consent_cache is not None:
+        consent_code = consent_cache.check(consent, ROUTING_CONSENT_SCOPES)
+    else:
+        consent_code = consent_reason(consent, ROUTING_CONSENT_SCOPES)
+    ruleset = ruleset or get_active_ruleset()
+    if consent_code != CONSENT_VALID:
+        started = recorder.lap("routing.consent_validation", started)
+        decision = RoutingDecision(
             decision="NON_CLINICAL",
-            reason=f"Consent invalid: {exc}",
+            reason=f"Consent invalid: {CONSENT_REASONS[consent_code]}",
             flags=[],
+            ruleset_version=ruleset.version,
         )
-    return route_message(msg)
+        recorder.lap("routing.decision_build", started)
+        return decision
+    started = recorder.lap("routing.consent_validation", started)
+
+    code, flag_mask, fuzzy = _outcome(msg.text, ruleset, cache)
+    started = recorder.lap("routing.keyword_matching", started)
+
+    decision = _build_decision(code, code, flag_mask, ruleset, fuzzy)
+    recorder.lap("routing.decision_build", started)
+    return decision
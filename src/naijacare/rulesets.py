@@ -0,0 +1,147 @@
+"""Versioned routing rule sets with atomic hot-swap (non-clinical prototype)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterable
+
+from .fuzzy import DEFAULT_MIN_LENGTH, DeletionIndex
+from .matcher import KeywordMatcher
+
+RED_FLAGS = ["bleeding", "unconscious", "seizure", "unresponsive", "severe"]
+GENERAL_KEYWORDS = ["pain", "fever", "cough", "weakness"]
+
+
+class RuleSetError(ValueError):
+    """Raised when a rule-set file is missing fields or malformed."""
+
+
+class RuleSet:
+    """Immutable, pre-compiled routing rules.
+
+    Red flags occupy the low bits of the matcher mask and general keywords
+    the remaining bits, so one scan classifies a message. A deletion index
+    over the same bits catches misspellings within ``fuzzy_max_distance``
+    edits. Fuzzy matching is opt-in (``fuzzy_max_distance=0`` by default):
+    ordinary words can sit one edit from a red flag ("breeding"/"bleeding").
+    """
+
+    __slots__ = (
+        "version",
+        "red_flags",
+        "general_keywords",
+        "matcher",
+        "red_flag_mask",
+        "fuzzy_max_distance",
+        "fuzzy_min_length",
+        "fuzzy",
+    )
+
+    def __init__(
+        self,
+        version: str,
+        red_flags: Iterable[str],
+        general_keywords: Iterable[str],
+        fuzzy_max_distance: int = 0,
+        fuzzy_min_length: int = DEFAULT_MIN_LENGTH,
+    ) -> None:
+        red_flags = tuple(k.lower() for k in red_flags)
+        general_keywords = tuple(k.lower() for k in general_keywords)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "red_flags", red_flags)
+        object.__setattr__(self, "general_keywords", general_keywords)
+        object.__setattr__(self, "matcher", KeywordMatcher(red_flags + general_keywords))
+        object.__setattr__(self, "red_flag_mask", (1 << len(red_flags)) - 1)
+        object.__setattr__(self, "fuzzy_max_distance", fuzzy_max_distance)
+        object.__setattr__(self, "fuzzy_min_length", fuzzy_min_length)
+        fuzzy = None
+        if fuzzy_max_distance:
+            keywords = red_flags + general_keywords
+            fuzzy = DeletionIndex(keywords, fuzzy_max_distance, fuzzy_min_length)
+        object.__setattr__(self, "fuzzy", fuzzy)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("RuleSet is immutable")
+
+    def __reduce__(self):
+        # Ship the rule lists, not the automaton; the receiver recompiles once.
+        return (
+            RuleSet,
+            (
+                self.version,
+                self.red_flags,
+                self.general_keywords,
+                self.fuzzy_max_distance,
+                self.fuzzy_min_length,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RuleSet(version={self.version!r}, red_flags={len(self.red_flags)}, "
+            f"general_keywords={len(self.general_keywords)})"
+        )
+
+
+def load_ruleset(path: str | Path) -> RuleSet:
+    """Load and compile a JSON rule-set file.
+
+    Expected shape::
+
+        {"version": "v2", "red_flags": [...], "general_keywords": [...],
+         "fuzzy_max_distance": 1, "fuzzy_min_length": 7}
+
+    The ``fuzzy_*`` keys are optional; fuzzy matching stays off unless
+    ``fuzzy_max_distance`` is set.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise RuleSetError(f"Cannot read rule set {path}: {exc}") from exc
+
+    if not isinstance(data, dict):
+        raise RuleSetError(f"Rule set {path} must be a JSON object")
+    version = data.get("version")
+    if not isinstance(version, str) or not version:
+        raise RuleSetError("Rule set requires a non-empty 'version'")
+    for key in ("red_flags", "general_keywords"):
+        values = data.get(key)
+        if not isinstance(values, list) or not all(isinstance(v, str) and v for v in values):
+            raise RuleSetError(f"Rule set '{key}' must be a list of non-empty strings")
+
+    fuzzy = {}
+    for key in ("fuzzy_max_distance", "fuzzy_min_length"):
+        if key in data:
+            if not isinstance(data[key], int) or data[key] < 0:
+                raise RuleSetError(f"Rule set '{key}' must be a non-negative integer")
+            fuzzy[key] = data[key]
+
+    return RuleSet(version, data["red_flags"], data["general_keywords"], **fuzzy)
+
+
+BUILTIN_RULESET = RuleSet("builtin", RED_FLAGS, GENERAL_KEYWORDS)
+
+# Readers take a single reference per message; replacing it is atomic, so a
+# swap never blocks or tears an in-flight routing call.
+_active: RuleSet = BUILTIN_RULESET
+
+
+def get_active_ruleset() -> RuleSet:
+    """Return the rule set currently used for routing."""
+    return _active
+
+
+def activate_ruleset(ruleset: RuleSet) -> RuleSet:
+    """Make ``ruleset`` active and return the one it replaced."""
+    global _active
+    previous = _active
+    _active = ruleset
+    return previous
+
+
+def reload_ruleset(path: str | Path) -> RuleSet:
+    """Compile the rule set at ``path`` and activate it once fully built."""
+    ruleset = load_ruleset(path)
+    activate_ruleset(ruleset)
+    return ruleset
@@ -0,0 +1,89 @@
+"""Tests for incrementally maintained audit statistics."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.naijacare.audit import AuditAggregates, AuditLog
+from src.naijacare.audit.aggregates import parse_window
+from src.naijacare.models.compact import AuditRecord
+
+NOW = datetime(2026, 3, 1, 12, 0, 30)
+
+
+def record(minutes_ago, decision="ROUTE_GENERAL", clinic="c1", emergency=False):
+    return AuditRecord(clinic, decision, NOW - timedelta(minutes=minutes_ago), 10, emergency)
+
+
+def test_log_keeps_totals_matching_a_full_scan():
+    audit_log = AuditLog(aggregates=AuditAggregates())
+    for i in range(40):
+        emergency = i % 4 == 0
+        decision = "ESCALATE_IMMEDIATELY" if emergency else "ROUTE_GENERAL"
+        audit_log.log(f"clinic_{i % 3}", decision, "text", emergency)
+
+    stats = audit_log.aggregates.stats()
+    assert stats["total_messages"] == len(audit_log) == 40
+    assert stats["emergency_count"] == sum(r.has_emergency_flag for r in audit_log) == 10
+    assert stats["decisions"] == {"ESCALATE_IMMEDIATELY": 10, "ROUTE_GENERAL": 30}
+    assert sum(stats["clinics"].values()) == 40 and len(stats["clinics"]) == 3
+
+
+def test_merge_updates_aggregates():
+    source = AuditLog()
+    source.log("clinic_a", "NON_CLINICAL", "hi", False)
+    source.log("clinic_a", "ESCALATE_IMMEDIATELY", "bleeding", True)
+    target = AuditLog(aggregates=AuditAggregates())
+    target.merge(source)
+    assert len(target) == 2
+    assert target.aggregates.stats()["emergency_count"] == 1
+
+
+def test_windows_use_rollups():
+    aggregates = AuditAggregates.from_records([
+        record(0, emergency=True, decision="ESCALATE_IMMEDIATELY"),
+        record(10, clinic="c2"),
+        record(90),
+        record(60 * 30),
+        record(60 * 24 * 20),
+    ])
+
+    last_15m = aggregates.stats(15 * 60, now=NOW)
+    assert last_15m["granularity"] == "minute"
+    assert last_15m["total_messages"] == 2 and last_15m["emergency_count"] == 1
+    assert last_15m["clinics"] == {"c1": 1, "c2": 1}
+
+    assert aggregates.stats(2 * 3600, now=NOW)["total_messages"] == 3
+    last_2d = aggregates.stats(2 * 86400, now=NOW)
+    assert last_2d["granularity"] == "hour" and last_2d["total_messages"] == 4
+    last_30d = aggregates.stats(30 * 86400, now=NOW)
+    assert last_30d["granularity"] == "day" and last_30d["total_messages"] == 5
+    assert aggregates.stats(now=NOW)["total_messages"] == 5
+
+
+def test_old_buckets_are_evicted():
+    aggregates = AuditAggregates()
+    for minutes in range(24 * 60 + 30):
+        aggregates.add(record(minutes))
+    assert len(aggregates._rollups["minute"][2]) == 24 * 60
+    assert aggregates.stats()["total_messages"] == 24 * 60 + 30
+
+
+@pytest.mark.parametrize(
+    "value, seconds", [("900", 900), ("15m", 900), ("24h", 86400), ("7d", 604800)]
+)
+def test_parse_window(value, seconds):
+    assert parse_window(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "0", "-5m", "1w", "soon", "367d", "99999999999999d"])
+def test_parse_window_rejects_bad_values(value):
+    with pytest.raises(ValueError):
+        parse_window(value)
+
+
+def test_windows_longer_than_retention_are_rejected():
+    aggregates = AuditAggregates.from_records([record(0)])
+    assert aggregates.stats(366 * 86400, now=NOW)["total_messages"] == 1
+    with pytest.raises(ValueError):
+        aggregates.stats(10**15, now=NOW)
@@ -0,0 +1,81 @@
+"""Tests for streaming audit export."""
+
+import pytest
+
+from src.naijacare.audit import (
+    AuditExporter,
+    AuditLog,
+    SpillingStorage,
+    export_since,
+    iter_export,
+    read_export,
+)
+
+
+def fill(audit_log, count, offset=0):
+    for i in range(offset, offset + count):
+        emergency = i % 4 == 0
+        decision = "ESCALATE_IMMEDIATELY" if emergency else "NON_CLINICAL"
+        audit_log.log(f"clinic_{i % 3}", decision, "x" * i, emergency)
+
+
+@pytest.mark.parametrize(
+    "name", ["a.csv", "a.jsonl", "a.ncol", "a.csv.gz", "a.jsonl.gz", "a.ncol.gz"]
+)
+def test_round_trip_every_format(tmp_path, name):
+    audit_log = AuditLog()
+    fill(audit_log, 25)
+    with AuditExporter(tmp_path / name, chunk_size=7) as exporter:
+        assert exporter.write(audit_log) == 25
+    assert list(read_export(tmp_path / name)) == list(audit_log)
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_incremental_pulls_with_cursor(tmp_path):
+    audit_log = AuditLog(SpillingStorage(tmp_path / "spill", ring_size=4, segment_records=5))
+    cursor = tmp_path / "cursor.json"
+    fill(audit_log, 12)
+    first = export_since(audit_log, tmp_path / "n1.jsonl", cursor_path=cursor)
+    fill(audit_log, 6, offset=12)
+    second = export_since(audit_log, tmp_path / "n2.jsonl", cursor_path=cursor)
+    empty = export_since(audit_log, tmp_path / "n3.jsonl", cursor_path=cursor)
+
+    assert (first.rows, second.rows, empty.rows) == (12, 6, 0)
+    exported = list(read_export(tmp_path / "n1.jsonl")) + list(read_export(tmp_path / "n2.jsonl"))
+    assert exported == list(audit_log)
+
+
+def test_failed_export_leaves_no_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with AuditExporter(tmp_path / "a.csv") as exporter:
+            exporter.write([])
+            raise RuntimeError("boom")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_suffix_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        AuditExporter(tmp_path / "audit.txt")
+
+
+def test_explicit_format_skips_suffix_detection(tmp_path):
+    with AuditExporter(tmp_path / "audit.out", format="jsonl") as exporter:
+        assert not exporter.compress
+    with AuditExporter(tmp_path / "audit.out.gz", format="csv") as exporter:
+        assert exporter.compress
+
+
+def test_cursor_past_the_end_is_rejected(tmp_path):
+    audit_log = AuditLog()
+    audit_log.log("clinic_1", "ROUTE_GENERAL", "cough", False)
+    with pytest.raises(ValueError, match="outside the audit log"):
+        export_since(audit_log, tmp_path / "a.jsonl", since=5)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_streamed_gzip_export_matches_file_reader(tmp_path):
+    audit_log = AuditLog()
+    fill(audit_log, 30)
+    path = tmp_path / "stream.ncol.gz"
+    path.write_bytes(b"".join(iter_export(audit_log, "columnar", compress=True, chunk_size=8)))
+    assert list(read_export(path)) == list(audit_log)
@@ -0,0 +1,114 @@
+"""Tests for indexed, paginated audit queries."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.naijacare.audit import AuditIndex, AuditLog
+from src.naijacare.models.compact import AuditRecord
+
+T0 = datetime(2026, 5, 1, 8, 0)
+
+
+def make_records(count):
+    records = []
+    for i in range(count):
+        emergency = i % 7 == 0
+        routine = ("ROUTE_GENERAL", "NON_CLINICAL")[i % 2]
+        decision = "ESCALATE_IMMEDIATELY" if emergency else routine
+        records.append(AuditRecord(f"c{i % 4}", decision, T0 + timedelta(minutes=i), i, emergency))
+    return records
+
+
+def scan(records, clinic=None, decision=None, start=None, end=None, emergency_only=False):
+    return [
+        i for i, r in enumerate(records)
+        if (clinic is None or r.clinic_id_hash == clinic)
+        and (decision is None or r.decision == decision)
+        and (start is None or r.timestamp >= start)
+        and (end is None or r.timestamp < end)
+        and (not emergency_only or r.has_emergency_flag)
+    ]
+
+
+def collect(index, limit, **filters):
+    positions, cursor, pages = [], None, 0
+    while True:
+        page = index.query(cursor=cursor, limit=limit, **filters)
+        positions += page.positions
+        pages += 1
+        if page.next_cursor is None:
+            return positions, pages
+        cursor = page.next_cursor
+
+
+FILTERS = [
+    {},
+    {"clinic_id_hash": "c1"},
+    {"decision": "NON_CLINICAL"},
+    {"emergency_only": True},
+    {"start": T0 + timedelta(minutes=50), "end": T0 + timedelta(minutes=120)},
+    {"clinic_id_hash": "c2", "decision": "ROUTE_GENERAL", "start": T0 + timedelta(minutes=30)},
+    {"clinic_id_hash": "c0", "emergency_only": True, "end": T0 + timedelta(minutes=150)},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_paginated_queries_match_a_full_scan(filters):
+    records = make_records(200)
+    index = AuditIndex.from_records(records)
+    expected = scan(records, clinic=filters.get("clinic_id_hash"), decision=filters.get("decision"),
+                    start=filters.get("start"), end=filters.get("end"),
+                    emergency_only=filters.get("emergency_only", False))
+
+    positions, pages = collect(index, 9, **filters)
+    assert positions == expected
+    assert pages == max(1, -(-len(expected) // 9))
+
+    newest_first, _ = collect(index, 9, descending=True, **filters)
+    assert newest_first == expected[::-1]
+
+
+def test_unknown_values_return_an_empty_page():
+    index = AuditIndex.from_records(make_records(20))
+    assert index.query(clinic_id_hash="nope").records == []
+    assert index.query(decision="NOPE").next_cursor is None
+
+
+def test_out_of_order_timestamps_still_filter_by_time():
+    records = make_records(30)
+    records[10], records[20] = records[20], records[10]
+    index = AuditIndex.from_records(records)
+    window = {"start": T0 + timedelta(minutes=8), "end": T0 + timedelta(minutes=15)}
+    positions, _ = collect(index, 3, **window)
+    assert positions == scan(records, **window)
+
+
+def test_audit_log_query_uses_the_index():
+    audit_log = AuditLog(index=AuditIndex())
+    for i in range(12):
+        audit_log.log(f"clinic_{i % 2}", "ROUTE_GENERAL", "x" * i, i == 5)
+    page = audit_log.query(emergency_only=True)
+    assert [r["message_length"] for r in page.to_list()] == [5]
+    assert page.positions == [5]
+    assert page.records[0].clinic_id_hash == list(audit_log)[5].clinic_id_hash
+
+    with pytest.raises(RuntimeError):
+        AuditLog().query()
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_unindexed_pages_follow_the_same_cursors(descending):
+    records = make_records(23)
+    audit_log = AuditLog()
+    audit_log.storage.extend(records)
+    index = AuditIndex.from_records(records)
+    cursor = None
+    while True:
+        page = audit_log.page(cursor=cursor, limit=5, descending=descending)
+        expected = index.query(cursor=cursor, limit=5, descending=descending)
+        assert (page.positions, page.next_cursor) == (expected.positions, expected.next_cursor)
+        assert page.records == [records[p] for p in page.positions]
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
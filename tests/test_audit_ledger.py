@@ -0,0 +1,155 @@
+"""Tests for the hash-chained Merkle audit ledger."""
+
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.naijacare.audit import (
+    AuditAggregates,
+    AuditExporter,
+    AuditIndex,
+    AuditLedger,
+    AuditLog,
+    SpillingStorage,
+    read_export,
+    verify_records,
+)
+from src.naijacare.audit.ledger import (
+    leaf_hash,
+    load_checkpoints,
+    save_checkpoints,
+    verify_consistency,
+    verify_inclusion,
+    verify_range,
+)
+from src.naijacare.models.compact import AuditRecord
+
+
+def make_records(count):
+    return [
+        AuditRecord(f"c{i % 3}", "ROUTE_GENERAL", datetime(2026, 2, 1) + timedelta(seconds=i), i,
+                    i % 4 == 0)
+        for i in range(count)
+    ]
+
+
+def reference_root(leaves):
+    """RFC 6962 MTH computed from scratch."""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1 << ((len(leaves) - 1).bit_length() - 1)
+    left, right = reference_root(leaves[:k]), reference_root(leaves[k:])
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+@pytest.fixture
+def ledger_and_leaves():
+    records = make_records(37)
+    return AuditLedger.from_records(records, checkpoint_interval=8), [leaf_hash(r) for r in records]
+
+
+def test_roots_match_rfc6962_and_checkpoints_are_periodic(ledger_and_leaves):
+    ledger, leaves = ledger_and_leaves
+    for size in range(len(leaves) + 1):
+        assert ledger.root(size) == reference_root(leaves[:size])
+    assert [c.size for c in ledger.checkpoints] == [8, 16, 24, 32]
+    assert ledger.checkpoint().size == 37 and ledger.checkpoint() is ledger.checkpoints[-1]
+
+
+def test_inclusion_proofs(ledger_and_leaves):
+    ledger, leaves = ledger_and_leaves
+    for size in (1, 2, 7, 8, 37):
+        root = ledger.root(size)
+        for index in range(size):
+            proof = ledger.inclusion_proof(index, size)
+            assert len(proof) <= size.bit_length()
+            assert verify_inclusion(leaves[index], index, size, proof, root)
+            assert not verify_inclusion(bytes(32), index, size, proof, root)
+
+
+def test_consistency_proofs(ledger_and_leaves):
+    ledger, _ = ledger_and_leaves
+    for old in range(0, 38, 3):
+        for new in range(old, 38, 5):
+            proof = ledger.consistency_proof(old, new)
+            assert verify_consistency(old, new, ledger.root(old), ledger.root(new), proof)
+    forged = bytes(32)
+    assert not verify_consistency(5, 37, forged, ledger.root(37), ledger.consistency_proof(5, 37))
+
+
+def test_range_proofs(ledger_and_leaves):
+    ledger, leaves = ledger_and_leaves
+    root = ledger.root()
+    for start, end in [(0, 37), (0, 1), (5, 19), (36, 37), (16, 32)]:
+        proof = ledger.range_proof(start, end)
+        assert len(proof) <= 2 * (37).bit_length()
+        assert verify_range(leaves[start:end], start, 37, proof, root)
+    tampered = list(leaves[5:19])
+    tampered[3] = leaves[0]
+    assert not verify_range(tampered, 5, 37, ledger.range_proof(5, 19), root)
+
+
+def test_audit_log_feeds_the_ledger():
+    source = AuditLog()
+    source.log("clinic_a", "NON_CLINICAL", "hello", False)
+    audit_log = AuditLog(ledger=AuditLedger())
+    audit_log.log("clinic_b", "ROUTE_GENERAL", "cough", False)
+    audit_log.merge(source)
+    expected = reference_root([leaf_hash(r) for r in audit_log])
+    assert len(audit_log.ledger) == 2 and audit_log.ledger.root() == expected
+
+
+def test_reindex_reads_reopened_storage_once(tmp_path):
+    first = SpillingStorage(tmp_path, ring_size=4, segment_records=3)
+    first.extend(make_records(10))
+    first.close()
+
+    storage = SpillingStorage(tmp_path, ring_size=4, segment_records=3)
+    reads = []
+    iter_from = storage.iter_from
+    storage.iter_from = lambda position: reads.append(position) or iter_from(position)
+    audit_log = AuditLog(storage, AuditAggregates(), index=AuditIndex(), ledger=AuditLedger())
+    audit_log.reindex()
+    assert reads == [0]
+    assert audit_log.aggregates.stats()["total_messages"] == 10
+    assert len(audit_log.index) == 10
+    assert audit_log.ledger.root() == AuditLedger.from_records(make_records(10)).root()
+
+
+def test_saved_checkpoints_are_adopted_only_by_a_matching_log(tmp_path):
+    records = make_records(30)
+    earlier = AuditLedger.from_records(records[:20], checkpoint_interval=8)
+    earlier.checkpoint()
+    save_checkpoints(tmp_path / "cp.jsonl", earlier.checkpoints)
+    saved = load_checkpoints(tmp_path / "cp.jsonl")
+
+    reopened = AuditLedger.from_records(records, checkpoint_interval=8)
+    assert reopened.adopt_checkpoints(saved)
+    assert [c.size for c in reopened.checkpoints] == [8, 16, 20, 24]
+    assert reopened.checkpoints[2].created_at == saved[-1].created_at
+
+    records[3] = make_records(1)[0]
+    assert not AuditLedger.from_records(records).adopt_checkpoints(saved)
+    assert not AuditLedger.from_records(records[:10]).adopt_checkpoints(saved)
+
+
+@pytest.mark.parametrize("name", ["audit.csv", "audit.jsonl.gz", "audit.ncol"])
+def test_exported_file_verifies_against_checkpoints(tmp_path, name):
+    records = make_records(50)
+    ledger = AuditLedger.from_records(records, checkpoint_interval=16)
+    ledger.checkpoint()
+    save_checkpoints(tmp_path / "cp.jsonl", ledger.checkpoints)
+    with AuditExporter(tmp_path / name) as exporter:
+        exporter.write(records)
+
+    checkpoints = load_checkpoints(tmp_path / "cp.jsonl")
+    result = verify_records(read_export(tmp_path / name), checkpoints)
+    assert result.ok and result.checked == 4 and result.entries == 50
+
+    records[20].decision = "NON_CLINICAL"
+    result = verify_records(records, checkpoints)
+    assert not result.ok and result.suspect_range == (16, 32)
+    assert not verify_records(records[:40], checkpoints[:1] + checkpoints[3:]).ok
@@ -0,0 +1,126 @@
+"""Tests for the background SQLite audit writer."""
+
+from datetime import datetime
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
+
+from src.naijacare.audit import AuditLog, SQLiteAuditSink, read_sqlite
+from src.naijacare.models.compact import AuditRecord
+
+
+def record(i):
+    return AuditRecord(f"clinic_{i % 3}", "ROUTE_GENERAL", datetime(2026, 1, 1, 0, 0, i % 60), i,
+                       i % 5 == 0)
+
+
+def test_log_entries_survive_a_restart(tmp_path):
+    path = tmp_path / "audit.sqlite3"
+    sink = SQLiteAuditSink(path, batch_size=4, flush_interval=60)
+    audit_log = AuditLog(sink=sink)
+    for i in range(10):
+        audit_log.log("clinic_1", "ROUTE_GENERAL", "x" * i, i == 3)
+    sink.close()
+
+    restored = list(read_sqlite(path))
+    assert [r.as_dict() for r in restored] == audit_log.to_list()
+    assert sink.stats()["written"] == 10 and sink.stats()["queue_depth"] == 0
+
+
+def test_batches_by_size_and_flush(tmp_path):
+    with SQLiteAuditSink(tmp_path / "a.db", batch_size=5, flush_interval=60) as sink:
+        sink.extend(record(i) for i in range(12))
+        assert sink.flush(timeout=5)
+        stats = sink.stats()
+        assert stats["written"] == 12
+        assert stats["batches"] == 3
+        assert stats["flush_latency"]["count"] == 3
+    assert [r.message_length for r in read_sqlite(tmp_path / "a.db")] == list(range(12))
+
+
+def test_time_trigger_writes_partial_batches(tmp_path):
+    with SQLiteAuditSink(tmp_path / "a.db", batch_size=100, flush_interval=0.05) as sink:
+        sink.submit(record(1))
+        deadline = monotonic() + 5
+        while sink.stats()["written"] == 0 and monotonic() < deadline:
+            sleep(0.01)
+        assert sink.stats()["written"] == 1
+
+
+def blocked_sink(tmp_path, **kwargs):
+    sink = SQLiteAuditSink(tmp_path / "a.db", max_queue=3, batch_size=100, flush_interval=60,
+                           **kwargs)
+    # Hold the condition so the writer cannot drain while the queue fills up
+    sink._cond.acquire()
+    return sink
+
+
+def test_drop_newest_discards_incoming(tmp_path):
+    sink = blocked_sink(tmp_path, backpressure="drop_newest")
+    try:
+        accepted = [sink.submit(record(i)) for i in range(5)]
+    finally:
+        sink._cond.release()
+    assert accepted == [True, True, True, False, False]
+    sink.close()
+    assert [r.message_length for r in read_sqlite(sink.path)] == [0, 1, 2]
+    assert sink.stats()["dropped"] == 2 and sink.stats()["peak_queue_depth"] == 3
+
+
+def test_drop_oldest_keeps_latest(tmp_path):
+    sink = blocked_sink(tmp_path, backpressure="drop_oldest")
+    try:
+        for i in range(5):
+            sink.submit(record(i))
+    finally:
+        sink._cond.release()
+    assert sink.flush(timeout=5)
+    sink.close()
+    assert [r.message_length for r in read_sqlite(sink.path)] == [2, 3, 4]
+
+
+def test_block_waits_for_room_then_times_out(tmp_path):
+    sink = SQLiteAuditSink(tmp_path / "a.db", max_queue=2, batch_size=2, flush_interval=60,
+                           backpressure="block", block_timeout=0.05)
+    producer = Thread(target=sink.extend, args=([record(i) for i in range(50)],))
+    producer.start()
+    producer.join(timeout=10)
+    sink.close()
+    stats = sink.stats()
+    assert stats["written"] + stats["dropped"] == 50
+    assert stats["peak_queue_depth"] <= 2
+
+
+def test_rejects_unknown_policy_and_closed_submit(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteAuditSink(tmp_path / "a.db", backpressure="spill")
+    sink = SQLiteAuditSink(tmp_path / "b.db")
+    sink.close()
+    with pytest.raises(RuntimeError):
+        sink.submit(record(0))
+
+
+def test_bad_batch_fails_without_stopping_the_writer(tmp_path):
+    with SQLiteAuditSink(tmp_path / "a.db", batch_size=1, flush_interval=60) as sink:
+        sink.submit(AuditRecord("c", "ROUTE_GENERAL", None, 1, False))
+        sink.submit(record(2))
+        assert sink.flush(timeout=5)
+        stats = sink.stats()
+        assert (stats["failed"], stats["written"], stats["writer_alive"]) == (1, 1, True)
+        assert stats["last_error"].startswith("AttributeError")
+
+
+def test_dead_writer_fails_flush_and_drops_submits(tmp_path, monkeypatch):
+    def broken(self):
+        raise OSError("disk gone")
+
+    monkeypatch.setattr(SQLiteAuditSink, "_take_batch", broken)
+    sink = SQLiteAuditSink(tmp_path / "a.db", max_queue=1, backpressure="block")
+    sink._thread.join(timeout=5)
+    assert not sink.submit(record(0))
+    assert not sink.flush(timeout=5)
+    stats = sink.stats()
+    assert stats["writer_alive"] is False and stats["dropped"] == 1
+    assert "disk gone" in stats["last_error"]
+    sink.close()
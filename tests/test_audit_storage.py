@@ -0,0 +1,75 @@
+"""Tests for audit log storage backends."""
+
+import pytest
+
+from src.naijacare.audit import AuditLog, ColumnarStorage, SpillingStorage
+from src.naijacare.audit import columnar as columnar_module
+
+
+def fill(audit_log, count):
+    for i in range(count):
+        emergency = i % 5 == 0
+        decision = "ESCALATE_IMMEDIATELY" if emergency else "ROUTE_GENERAL"
+        audit_log.log(f"clinic_{i % 3}", decision, "x" * i, emergency)
+
+
+def test_spilling_storage_bounds_memory_and_reads_across_segments(tmp_path):
+    reference = AuditLog()
+    bounded = AuditLog(SpillingStorage(tmp_path, ring_size=10, segment_records=7))
+    fill(reference, 53)
+    fill(bounded, 53)
+
+    storage = bounded.storage
+    assert storage.in_memory < 10 + 7
+    assert storage.spilled == 42 and len(list(tmp_path.glob("*.jsonl.gz"))) == 6
+    assert len(bounded) == 53
+    assert [row.pop("timestamp") and row for row in bounded.to_list()] == [
+        row.pop("timestamp") and row for row in reference.to_list()
+    ]
+
+
+def test_spilled_segments_are_reloaded(tmp_path):
+    first = AuditLog(SpillingStorage(tmp_path, ring_size=2, segment_records=3))
+    fill(first, 8)
+    reopened = SpillingStorage(tmp_path, ring_size=2, segment_records=3)
+    assert len(reopened) == 6
+    assert [r.message_length for r in reopened] == list(range(6))
+
+
+def test_close_persists_the_in_memory_records(tmp_path):
+    first = AuditLog(SpillingStorage(tmp_path, ring_size=4, segment_records=3))
+    fill(first, 8)
+    first.storage.close()
+    first.storage.close()
+    assert first.storage.in_memory == 0 and len(first) == 8
+    reopened = SpillingStorage(tmp_path, ring_size=4, segment_records=3)
+    assert [r.message_length for r in reopened] == list(range(8))
+
+
+def test_merge_into_bounded_log(tmp_path):
+    source = AuditLog()
+    fill(source, 20)
+    bounded = AuditLog(SpillingStorage(tmp_path, ring_size=5, segment_records=5))
+    bounded.merge(source)
+    assert [r.message_length for r in bounded] == list(range(20))
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_columnar_storage_round_trips_and_aggregates(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar_module, "np", None)
+    reference = AuditLog()
+    columnar = AuditLog(ColumnarStorage())
+    fill(reference, 41)
+    fill(columnar, 41)
+    assert [row.pop("timestamp") and row for row in columnar.to_list()] == [
+        row.pop("timestamp") and row for row in reference.to_list()
+    ]
+    storage = columnar.storage
+    assert storage.emergency_count() == 9
+    assert storage.decision_counts() == {"ESCALATE_IMMEDIATELY": 9, "ROUTE_GENERAL": 32}
+    assert sorted(storage.clinic_counts().values()) == [13, 14, 14]
+    assert len(storage.clinics) == 3
+    assert storage.nbytes() < 41 * 18
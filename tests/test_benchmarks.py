@@ -0,0 +1,31 @@
+"""Smoke tests for the benchmark suite (tiny corpora, no timing assertions)."""
+
+from benchmarks.corpus import generate_consent_records, generate_messages
+from benchmarks.suite import BenchResult, find_regressions, run_suite
+from src.naijacare.routing import route_messages
+
+
+def test_corpus_red_flag_density():
+    messages = generate_messages(2000, red_flag_density=0.25, seed=1)
+    counts = route_messages([m.text for m in messages]).counts()
+    assert 0.2 < counts["ESCALATE_IMMEDIATELY"] / len(messages) < 0.3
+
+
+def test_consent_population_is_reproducible():
+    first = generate_consent_records(50, seed=3)
+    second = generate_consent_records(50, seed=3)
+    assert [r.age_years for r in first] == [r.age_years for r in second]
+
+
+def test_run_suite_reports_every_target():
+    names = [r.name for r in run_suite(messages=50, records=50)]
+    assert names == ["route_message", "route_message_with_consent", "validate_consent",
+                     "AuditLog.log"]
+
+
+def test_regression_threshold():
+    baseline = {"route_message": {"ops_per_sec": 1000.0, "p99_us": 10.0}}
+    ok = BenchResult("route_message", ops=900, seconds=1.0, p50_us=5, p99_us=11, peak_kib=1)
+    slow = BenchResult("route_message", ops=700, seconds=1.0, p50_us=5, p99_us=20, peak_kib=1)
+    assert find_regressions([ok], baseline, threshold=0.2) == []
+    assert len(find_regressions([slow], baseline, threshold=0.2)) == 2
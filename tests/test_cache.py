@@ -0,0 +1,37 @@
+"""Tests for the routing decision cache."""
+
+from src.naijacare.cache import DecisionCache
+from src.naijacare.models import Message
+from src.naijacare.routing import route_message, route_messages
+from src.naijacare.rulesets import RuleSet
+
+
+def test_cache_hits_on_normalised_text():
+    cache = DecisionCache(maxsize=4)
+    first = route_message(Message(sender="c", text="General follow-up question"), cache=cache)
+    second = route_message(Message(sender="c", text="  general FOLLOW-UP question "), cache=cache)
+
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DecisionCache(maxsize=2)
+    route_messages(["fever", "cough", "fever", "bleeding"], cache=cache)
+
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    route_messages(["cough"], cache=cache)
+    assert cache.stats()["misses"] == 4
+
+
+def test_cache_is_keyed_on_ruleset_version():
+    cache = DecisionCache()
+    msg = Message(sender="c", text="stroke")
+    assert route_message(msg, cache=cache).decision == "NON_CLINICAL"
+
+    updated = RuleSet("v2", ["stroke"], [])
+    assert route_message(msg, updated, cache=cache).decision == "ESCALATE_IMMEDIATELY"
+
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,47 @@
+"""Tests for compact hot-path representations."""
+
+import pytest
+
+from src.naijacare.audit import AuditLog
+from src.naijacare.models import AuditEntry, Message
+from src.naijacare.routing import route_message, route_message_compact, route_messages
+
+
+def test_common_outcomes_are_shared_instances():
+    assert route_message_compact("fever") is route_message_compact("cough again")
+    assert route_message_compact("hello") is route_message_compact("thanks")
+    assert route_message_compact("bleeding") is route_message_compact("more bleeding")
+
+
+def test_shared_decisions_are_immutable():
+    decision = route_message_compact("fever")
+    with pytest.raises(AttributeError):
+        decision.decision = "ESCALATE_IMMEDIATELY"
+    with pytest.raises(AttributeError):
+        del decision.flags
+    assert route_message_compact("fever").decision == "ROUTE_GENERAL"
+
+
+def test_compact_decision_converts_to_model():
+    for text in ["Patient unconscious", "fever", "hello", "had a seizur"]:
+        expected = route_message(Message(sender="clinic_001", text=text))
+        assert route_message_compact(text).to_model() == expected
+
+
+def test_batch_rows_convert_to_compact_decisions():
+    batch = route_messages(["fever", "severe bleeding"])
+    assert batch.compact(0) is route_message_compact("fever")
+    assert batch.compact(1).flags == ("bleeding", "severe")
+
+
+def test_audit_log_exposes_models_at_the_boundary():
+    audit_log = AuditLog()
+    audit_log.log("clinic_001", "ESCALATE_IMMEDIATELY", "bleeding", True)
+
+    (entry,) = audit_log.entries()
+    assert isinstance(entry, AuditEntry)
+    assert audit_log.to_list() == [entry.model_dump()]
+    assert len(audit_log) == 1
+    with pytest.raises(AttributeError):
+        audit_log.entries().append(entry)
+    assert list(audit_log.entries(lazy=True)) == [entry]
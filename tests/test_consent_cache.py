@@ -0,0 +1,71 @@
+"""Tests for memoised consent decisions."""
+
+from datetime import datetime, timedelta
+
+from src.naijacare.consent import (
+    CONSENT_VALID,
+    ConsentDecisionCache,
+    ConsentRecord,
+    ConsentStore,
+)
+from src.naijacare.consent.validator import CONSENT_EXPIRED, CONSENT_WITHDRAWN
+from src.naijacare.models import Message
+from src.naijacare.routing import route_message_with_consent
+
+SCOPES = {"data_collection", "ai_processing"}
+NOW = datetime(2026, 6, 1)
+
+
+def granted(subject_id="patient-1", at=NOW):
+    record = ConsentRecord(subject_id=subject_id, age_years=30)
+    record.grant(SCOPES, at)
+    return record
+
+
+def test_repeat_checks_are_served_from_cache():
+    cache = ConsentDecisionCache()
+    record = granted()
+    assert cache.check(record, SCOPES, NOW) == CONSENT_VALID
+    assert cache.check(record, SCOPES, NOW) == CONSENT_VALID
+    assert cache.stats()["hits"] == 1
+
+
+def test_withdraw_invalidates_immediately():
+    cache = ConsentDecisionCache()
+    record = granted()
+    cache.check(record, SCOPES, NOW)
+    record.withdraw(NOW)
+    assert cache.check(record, SCOPES, NOW) == CONSENT_WITHDRAWN
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_entry_expires_at_reconsent_deadline():
+    cache = ConsentDecisionCache()
+    record = granted()
+    assert cache.check(record, SCOPES, NOW) == CONSENT_VALID
+    later = record.reconsent_due_at + timedelta(seconds=1)
+    assert cache.check(record, SCOPES, later) == CONSENT_EXPIRED
+
+
+def test_upsert_of_replacement_record_is_revalidated():
+    cache = ConsentDecisionCache()
+    store = ConsentStore()
+    replacement = granted(at=NOW - timedelta(days=200))
+    store.upsert(granted())
+    cache.check(store.get("patient-1"), SCOPES, NOW)
+    store.upsert(replacement)
+    assert len(cache) == 0
+    assert cache.check(store.get("patient-1"), SCOPES, NOW) == CONSENT_EXPIRED
+
+
+def test_route_message_with_consent_uses_cache():
+    cache = ConsentDecisionCache()
+    record = granted(at=datetime.utcnow())
+    msg = Message(sender="clinic-1", text="Patient is bleeding heavily")
+    assert route_message_with_consent(msg, record, consent_cache=cache).decision == (
+        "ESCALATE_IMMEDIATELY"
+    )
+    record.withdraw()
+    decision = route_message_with_consent(msg, record, consent_cache=cache)
+    assert decision.decision == "NON_CLINICAL"
+    assert decision.reason == "Consent invalid: Consent has been withdrawn"
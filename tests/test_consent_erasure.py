@@ -0,0 +1,110 @@
+"""Tests for the bulk right-to-be-forgotten job."""
+
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.naijacare.consent import (
+    ConsentAuditEntry,
+    ConsentAuditLog,
+    ConsentRecord,
+    ConsentStore,
+    ErasureJob,
+    SegmentedConsentAuditLog,
+    SQLConsentStore,
+)
+from src.naijacare.models.orm import Case, Patient, RoutingDecision
+from src.naijacare.models.orm import ConsentRecord as ConsentRow
+
+SUBJECTS = [f"patient-{i}" for i in range(12)]
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    factory = sessionmaker(bind=engine, future=True)
+    SQLConsentStore(factory).create_schema()
+    with factory() as session, session.begin():
+        for subject_id in SUBJECTS:
+            patient = Patient(external_reference=subject_id, preferred_name="Ada", age_years=30)
+            case = Case(patient=patient, summary="fever for 3 days")
+            case.routing_decisions.append(RoutingDecision(outcome="ROUTE_GENERAL"))
+            session.add_all([patient, case, ConsentRow(patient=patient, details={"k": "v"})])
+    return factory
+
+
+def populated_store():
+    store = ConsentStore()
+    for subject_id in SUBJECTS:
+        record = ConsentRecord(subject_id=subject_id, age_years=30)
+        record.grant({"data_collection"}, datetime(2026, 1, 1))
+        store.upsert(record)
+    return store
+
+
+def audit_entry(subject_id):
+    return ConsentAuditEntry(subject_id, "grant", datetime(2026, 1, 1), {"clinic": "kano"})
+
+
+def test_erases_every_store_in_chunks(session_factory, tmp_path):
+    store = populated_store()
+    memory_log = ConsentAuditLog()
+    disk_log = SegmentedConsentAuditLog(tmp_path / "audit", block_records=4)
+    for subject_id in SUBJECTS + ["keep-me"]:
+        memory_log.record(audit_entry(subject_id))
+        disk_log.record(audit_entry(subject_id))
+    targets = SUBJECTS[:10]
+
+    job = ErasureJob(session_factory, store, [memory_log, disk_log], chunk_size=4)
+    report = job.run(targets)
+
+    assert (report.erased, report.chunks, report.patients) == (10, 3, 10)
+    assert report.routing_decisions == 10 and report.audit_entries == 20
+    assert report.subjects_per_sec > 0
+    with session_factory() as session:
+        names = set(session.scalars(select(Patient.external_reference)))
+        assert names.isdisjoint(targets) and {"patient-10", "patient-11"} <= names
+        assert session.scalar(select(func.count()).select_from(RoutingDecision)) == 2
+        assert session.scalar(select(func.count()).where(Case.summary.is_not(None))) == 2
+    assert store.get("patient-0") is None and store.get("patient-10") is not None
+    assert [e.subject_id for e in memory_log.entries()].count("ANONYMIZED") == 10
+    assert list(disk_log.query(subject_id="patient-3")) == []
+    assert disk_log.entries()[-1] == audit_entry("keep-me")
+    disk_log.close()
+    reopened = SegmentedConsentAuditLog(tmp_path / "audit", block_records=4)
+    assert len(reopened) == len(SUBJECTS) + 1
+
+
+def test_resumes_from_checkpoint(session_factory, tmp_path):
+    checkpoint = tmp_path / "erasure.json"
+    job = ErasureJob(session_factory, checkpoint_path=checkpoint, chunk_size=5)
+    first = job.run(SUBJECTS[:5])
+    assert first.erased == 5
+
+    checkpoint.write_text(json.dumps({**json.loads(checkpoint.read_text()), "completed": 3}))
+    again = job.run(SUBJECTS[:5])
+    assert (again.resumed_from, again.erased) == (3, 2)
+    assert job.run(SUBJECTS[:5]).erased == 0
+
+    with pytest.raises(ValueError):
+        job.run(SUBJECTS)
+
+
+def test_pending_writes_do_not_recreate_erased_subjects(session_factory):
+    store = SQLConsentStore(session_factory, batch_size=100)
+    record = ConsentRecord(subject_id="patient-0", age_years=30)
+    record.grant({"data_collection"}, datetime(2026, 1, 1))
+    store.upsert(record)
+
+    ErasureJob(session_factory).run(["patient-0"])
+    store.flush()
+    assert store.pending == 0 and store.get("patient-0") is None
+    with session_factory() as session:
+        names = set(session.scalars(select(Patient.external_reference)))
+        assert "patient-0" not in names and len(names) == len(SUBJECTS)
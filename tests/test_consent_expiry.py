@@ -0,0 +1,66 @@
+"""Tests for the re-consent expiry index and reminder job."""
+
+from datetime import datetime, timedelta
+
+from src.naijacare.consent import (
+    ConsentRecord,
+    ConsentStore,
+    ExpiryIndex,
+    ReconsentReminderJob,
+)
+from src.naijacare.consent.validator import RECONSENT_WINDOW_DAYS
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def store_with(*offsets_days):
+    """Store with one subject per offset, consented that many days before NOW."""
+    store = ConsentStore()
+    for i, offset in enumerate(offsets_days):
+        record = ConsentRecord(subject_id=f"s{i}", age_years=30)
+        record.grant({"data_collection"}, NOW - timedelta(days=offset))
+        store.upsert(record)
+    return store
+
+
+def test_due_for_reconsent_matches_full_scan():
+    store = store_with(10, 80, 85, 89, 95, 120)
+    due = store.due_for_reconsent(7, now=NOW)
+    assert [subject for subject, _ in due] == ["s5", "s4", "s3", "s2"]
+    cutoff = NOW + timedelta(days=7)
+    expected = {
+        r.subject_id for r in store._records.values() if r.reconsent_due_at <= cutoff
+    }
+    assert {subject for subject, _ in due} == expected
+    assert due[0][1] == NOW - timedelta(days=120 - RECONSENT_WINDOW_DAYS)
+
+
+def test_grant_and_withdraw_keep_index_current():
+    store = store_with(89, 89)
+    store.withdraw("s0")
+    store.grant("s1", {"ai_processing"}, NOW)
+    assert store.due_for_reconsent(7, now=NOW) == []
+    assert store.due_for_reconsent(RECONSENT_WINDOW_DAYS, now=NOW) == [
+        ("s1", NOW + timedelta(days=RECONSENT_WINDOW_DAYS))
+    ]
+
+
+def test_index_respects_time_within_cutoff_day():
+    index = ExpiryIndex()
+    index.update("early", datetime(2026, 6, 8, 9))
+    index.update("late", datetime(2026, 6, 8, 18))
+    assert [s for s, _ in index.due_by(datetime(2026, 6, 8, 12))] == ["early"]
+    index.remove("early")
+    index.update("late", None)
+    assert len(index) == 0 and index._days == []
+
+
+def test_reminder_job_sends_once_per_deadline():
+    store = store_with(85, 30)
+    sent = []
+    job = ReconsentReminderJob(store, lambda subject, deadline: sent.append(subject))
+    assert job.run_once(NOW) == ["s0"]
+    assert job.run_once(NOW + timedelta(days=1)) == []
+    store.grant("s0", {"data_collection"}, NOW - timedelta(days=80))
+    assert job.run_once(NOW + timedelta(days=1)) == ["s0"]
+    assert sent == ["s0", "s0"]
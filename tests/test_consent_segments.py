@@ -0,0 +1,132 @@
+"""Tests for the segmented on-disk consent audit log."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from src.naijacare.consent import (
+    ConsentAuditEntry,
+    ConsentAuditLog,
+    SegmentedConsentAuditLog,
+    segments,
+)
+
+START = datetime(2026, 1, 1)
+
+
+def make_entries(count, subjects=20):
+    return [
+        ConsentAuditEntry(
+            subject_id=f"patient-{i % subjects}",
+            action="grant" if i % 3 else "withdraw",
+            timestamp=START + timedelta(minutes=i),
+            details={"seq": str(i)},
+        )
+        for i in range(count)
+    ]
+
+
+def test_entries_round_trip_across_segments(tmp_path):
+    entries = make_entries(500)
+    with SegmentedConsentAuditLog(tmp_path, segment_bytes=4096, block_records=16) as log:
+        for entry in entries:
+            log.record(entry)
+        assert log.segment_count > 1
+        assert log.entries() == entries
+    reopened = SegmentedConsentAuditLog(tmp_path, segment_bytes=4096, block_records=16)
+    assert len(reopened) == 500
+    assert list(reopened.entries(lazy=True)) == entries
+
+
+def test_subject_and_time_range_queries(tmp_path):
+    entries = make_entries(300)
+    log = SegmentedConsentAuditLog(tmp_path, segment_bytes=4096, block_records=8)
+    for entry in entries:
+        log.record(entry)
+    assert list(log.query(subject_id="patient-7")) == [
+        e for e in entries if e.subject_id == "patient-7"
+    ]
+    start, end = START + timedelta(minutes=100), START + timedelta(minutes=140)
+    assert list(log.query(subject_id="patient-3", start=start, end=end)) == [
+        e for e in entries if e.subject_id == "patient-3" and start <= e.timestamp <= end
+    ]
+    assert list(log.query(subject_id="nobody")) == []
+    log.close()
+
+
+
+def test_aware_timestamps_are_stored_and_queried_as_utc(tmp_path):
+    lagos = timezone(timedelta(hours=1))
+    log = SegmentedConsentAuditLog(tmp_path)
+    nine_lagos = datetime(2026, 1, 1, 9, tzinfo=lagos)
+    log.record(ConsentAuditEntry("patient-1", "grant", nine_lagos, {}))
+    log.record(ConsentAuditEntry("patient-1", "withdraw", datetime(2026, 1, 1, 9), {}))
+    assert [e.timestamp for e in log.entries()] == [
+        datetime(2026, 1, 1, 8),
+        datetime(2026, 1, 1, 9),
+    ]
+    window = log.query(start=nine_lagos, end=datetime(2026, 1, 1, 9, 30, tzinfo=lagos))
+    assert [e.action for e in window] == ["grant"]
+
+
+
+class PausingFields:
+    """Stands in for the record header struct; parks the redacting thread just
+    before it sets ``FLAG_REDACTED``, after the subject and details are blanked."""
+
+    def __init__(self, fields):
+        self._fields = fields
+        self.size = fields.size
+        self.paused = threading.Event()
+        self.resume = threading.Event()
+
+    def __getattr__(self, name):
+        return getattr(self._fields, name)
+
+    def pack_into(self, *args):
+        self.paused.set()
+        self.resume.wait(5)
+        self._fields.pack_into(*args)
+
+
+def test_queries_never_see_a_half_redacted_record(tmp_path, monkeypatch):
+    log = SegmentedConsentAuditLog(tmp_path, block_records=1)
+    for i in range(2):
+        log.record(ConsentAuditEntry(f"patient-{i}", "grant", START, {"note": "x" * 40}))
+    fields = PausingFields(segments._FIELDS)
+    monkeypatch.setattr(segments, "_FIELDS", fields)
+    # The query has planned its blocks and is part-way through when redact starts.
+    results = log.query()
+    first = next(results)
+    redactor = threading.Thread(target=log.redact, args=(["patient-1"],))
+    redactor.start()
+    assert fields.paused.wait(5)
+    rest = []
+    reader = threading.Thread(target=lambda: rest.extend(results))
+    reader.start()
+    reader.join(0.2)
+    fields.resume.set()
+    redactor.join()
+    reader.join()
+    assert first.subject_id == "patient-0"
+    assert [(e.subject_id, e.details) for e in rest] == [("ANONYMIZED", {})]
+
+def test_torn_tail_is_truncated_on_open(tmp_path):
+    log = SegmentedConsentAuditLog(tmp_path)
+    for entry in make_entries(3):
+        log.record(entry)
+    log.close()
+    segment = next(tmp_path.glob("segment-*.log"))
+    segment.write_bytes(segment.read_bytes()[:-5])
+    reopened = SegmentedConsentAuditLog(tmp_path)
+    assert reopened.entries() == make_entries(2)
+    reopened.record(make_entries(3)[2])
+    assert reopened.entries() == make_entries(3)
+    reopened.close()
+
+
+def test_in_memory_log_lazy_entries():
+    log = ConsentAuditLog()
+    for entry in make_entries(3):
+        log.record(entry)
+    assert not isinstance(log.entries(lazy=True), list)
+    assert list(log.entries(lazy=True)) == log.entries()
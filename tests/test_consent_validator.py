@@ -4,10 +4,14 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from benchmarks.corpus import generate_consent_records
 from src.naijacare.consent import (
+    CONSENT_REASONS,
+    ConsentColumns,
     ConsentRecord,
     ConsentValidationError,
     validate_consent,
+    validate_consent_many,
 )
 
 
@@ -42,3 +46,38 @@ def test_minor_requires_guardian():
 
     with pytest.raises(ConsentValidationError):
         validate_consent(record, {"data_collection"})
+
+
+def _scalar_reason(record, scopes, now):
+    try:
+        validate_consent(record, scopes, now=now)
+    except ConsentValidationError as exc:
+        return str(exc)
+    return None
+
+
+def _parity_records(now):
+    records = generate_consent_records(500, invalid_fraction=0.5, now=now, seed=3)
+    unconsented = ConsentRecord(subject_id="never", age_years=40)
+    boundary = ConsentRecord(subject_id="boundary", age_years=40)
+    boundary.grant({"data_collection"}, now - timedelta(days=90))
+    past_boundary = ConsentRecord(subject_id="past", age_years=40)
+    past_boundary.grant({"data_collection"}, now - timedelta(days=90, microseconds=1))
+    return records + [unconsented, boundary, past_boundary]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "scopes", [{"data_collection"}, {"data_collection", "ai_processing"}, {"bogus"}]
+)
+def test_validate_consent_many_matches_scalar(use_numpy, scopes):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    now = datetime(2026, 6, 1)
+    records = _parity_records(now)
+    codes = validate_consent_many(
+        ConsentColumns.from_records(records), scopes, now=now, use_numpy=use_numpy
+    )
+    assert [CONSENT_REASONS[code] for code in codes] == [
+        _scalar_reason(record, scopes, now) for record in records
+    ]
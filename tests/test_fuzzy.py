@@ -0,0 +1,57 @@
+"""Tests for misspelling-tolerant keyword matching."""
+
+from src.naijacare.fuzzy import DeletionIndex, edit_distance
+from src.naijacare.models import Message
+from src.naijacare.routing import route_message, route_messages
+from src.naijacare.rulesets import BUILTIN_RULESET, RuleSet
+
+FUZZY = RuleSet(
+    "fuzzy",
+    BUILTIN_RULESET.red_flags,
+    BUILTIN_RULESET.general_keywords,
+    fuzzy_max_distance=1,
+)
+
+
+def test_edit_distance_is_bounded():
+    assert edit_distance("seizure", "siezure", 1) == 1
+    assert edit_distance("bleeding", "bleding", 2) == 1
+    assert edit_distance("bleeding", "pain", 1) == 2
+
+
+def test_deletion_index_respects_max_distance():
+    index = DeletionIndex(["unconscious"], max_distance=1)
+    assert index.lookup("unconcious") == ((0, 1),)
+    assert index.lookup("unconsous") == ()
+    assert DeletionIndex(["unconscious"], max_distance=2).lookup("unconsous") == ((0, 2),)
+
+
+def test_misspelled_red_flag_escalates_and_reports_match():
+    msg = Message(sender="clinic_001", text="Patient had a seizur, now unconcious")
+    decision = route_message(msg, FUZZY)
+    assert decision.decision == "ESCALATE_IMMEDIATELY"
+    assert decision.flags == ["unconscious", "seizure"]
+    assert {(m.keyword, m.matched) for m in decision.fuzzy_matches} == {
+        ("unconscious", "unconcious"),
+        ("seizure", "seizur"),
+    }
+
+
+def test_short_words_are_not_matched_fuzzily():
+    decision = route_message(Message(sender="clinic_001", text="Never mind, wrong number"), FUZZY)
+    assert decision.decision == "NON_CLINICAL"
+
+
+def test_ordinary_words_near_red_flags_do_not_escalate():
+    text = "Goat breeding season, a sever storm cut the power"
+    assert route_message(Message(sender="clinic_001", text=text)).decision == "NON_CLINICAL"
+    decision = route_message(Message(sender="clinic_001", text="sever headache"), FUZZY)
+    assert "severe" not in decision.flags and decision.fuzzy_matches == []
+
+
+def test_fuzzy_matching_is_off_by_default():
+    exact_only = RuleSet("exact", ["bleeding"], [])
+    assert exact_only.fuzzy is None
+    batch = route_messages(["bleding"], ruleset=exact_only)
+    assert batch.decision_name(0) == "NON_CLINICAL"
+    assert batch.fuzzy(0) == []
@@ -0,0 +1,110 @@
+"""Tests for the asyncio ingestion service."""
+
+import asyncio
+import threading
+
+from src.naijacare.audit import AuditLog
+from src.naijacare.cache import DecisionCache
+from src.naijacare.ingestion import PRIORITY, ROUTINE, IngestionService, ThreadedIngestion
+from src.naijacare.models import Message
+from src.naijacare.routing import has_red_flag
+
+
+def test_emergency_skips_routine_backlog():
+    async def scenario():
+        service = IngestionService(priority_workers=1, routine_workers=1, audit_log=AuditLog())
+        await service.start()
+        finished = []
+
+        async def send(text):
+            decision = await service.submit(Message(sender="clinic_001", text=text))
+            finished.append(decision.decision)
+
+        routine = [asyncio.ensure_future(send("fever follow-up")) for _ in range(50)]
+        await asyncio.sleep(0)
+        emergency = asyncio.ensure_future(send("patient unconscious"))
+        await asyncio.gather(*routine, emergency)
+        await service.stop()
+        return service, finished
+
+    service, finished = asyncio.run(scenario())
+
+    assert finished.index("ESCALATE_IMMEDIATELY") < 5
+    metrics = service.metrics()
+    assert metrics["lanes"][PRIORITY]["completed"] == 1
+    assert metrics["lanes"][ROUTINE]["completed"] == 50
+    assert len(service.audit_log.entries()) == 51
+
+
+
+class StallingAuditLog:
+    """Audit log whose routine writes hang until released (a full sink, a slow disk)."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.decisions = []
+
+    def log(self, clinic_id, decision, message_text, has_emergency):
+        if not has_emergency:
+            self.release.wait(5)
+        self.decisions.append(decision)
+
+
+def test_stalled_routine_audit_does_not_hold_up_emergencies():
+    async def scenario():
+        audit_log = StallingAuditLog()
+        service = IngestionService(priority_workers=1, routine_workers=2, audit_log=audit_log)
+        await service.start()
+        routine = [
+            asyncio.ensure_future(service.submit(Message(sender="clinic_001", text="fever")))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        emergency = await asyncio.wait_for(
+            service.submit(Message(sender="clinic_001", text="patient unconscious")), 2
+        )
+        audit_log.release.set()
+        await asyncio.gather(*routine)
+        await service.stop()
+        return audit_log, emergency
+
+    audit_log, emergency = asyncio.run(scenario())
+    assert emergency.decision == "ESCALATE_IMMEDIATELY"
+    assert audit_log.decisions[0] == "ESCALATE_IMMEDIATELY"
+    assert len(audit_log.decisions) == 3
+
+def test_threaded_ingestion_routes_synchronously():
+    runner = ThreadedIngestion(IngestionService())
+    runner.start()
+    try:
+        decision = runner.route(Message(sender="clinic_001", text="seizure"), timeout=5)
+        assert decision.flags == ["seizure"]
+        assert runner.metrics()["queue_depth"] == {PRIORITY: 0, ROUTINE: 0}
+    finally:
+        runner.stop()
+
+
+def test_workers_route_with_the_cache():
+    async def scenario():
+        cache = DecisionCache(16)
+        service = IngestionService(priority_workers=1, routine_workers=1, cache=cache)
+        await service.start()
+        decisions = [
+            await service.submit(Message(sender="clinic_001", text=text))
+            for text in ("mild cough", "Mild cough", "severe bleeding")
+        ]
+        await service.stop()
+        return cache, decisions
+
+    cache, decisions = asyncio.run(scenario())
+    assert [d.decision for d in decisions] == [
+        "ROUTE_GENERAL",
+        "ROUTE_GENERAL",
+        "ESCALATE_IMMEDIATELY",
+    ]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_has_red_flag_triage():
+    assert has_red_flag("Patient is UNCONSCIOUS")
+    assert not has_red_flag("fever follow-up")
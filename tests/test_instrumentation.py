@@ -0,0 +1,50 @@
+"""Tests for per-stage timing instrumentation."""
+
+import pytest
+
+from src.naijacare import instrumentation
+from src.naijacare.audit import AuditLog
+from src.naijacare.consent import ConsentRecord
+from src.naijacare.instrumentation import Histogram
+from src.naijacare.models import Message
+from src.naijacare.routing import route_message_with_consent
+
+
+@pytest.fixture
+def recorder():
+    rec = instrumentation.enable()
+    yield rec
+    instrumentation.disable()
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram(bounds_us=(1, 10, 100))
+    for ns in (500, 5_000, 5_000, 50_000, 500_000):
+        histogram.observe(ns)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.percentile(50) == 10
+    assert histogram.snapshot()["max_us"] == 500
+
+
+def test_stages_are_recorded_when_enabled(recorder):
+    consent = ConsentRecord(subject_id="patient-1", age_years=30)
+    consent.grant({"data_collection", "ai_processing"})
+    route_message_with_consent(Message(sender="clinic_001", text="fever"), consent)
+    AuditLog().log("clinic_001", "ROUTE_GENERAL", "fever", False)
+
+    snapshot = recorder.snapshot()
+    assert set(snapshot) == {
+        "routing.consent_validation",
+        "routing.keyword_matching",
+        "routing.decision_build",
+        "audit.hash",
+        "audit.entry_build",
+        "audit.append",
+    }
+    assert all(stage["count"] == 1 for stage in snapshot.values())
+
+
+def test_disabled_by_default():
+    assert instrumentation.recorder.enabled is False
+    AuditLog().log("clinic_001", "NON_CLINICAL", "hello", False)
+    assert instrumentation.recorder.snapshot() == {}
@@ -0,0 +1,28 @@
+"""Tests for the compiled keyword matcher."""
+
+import random
+
+from src.naijacare.matcher import KeywordMatcher
+from src.naijacare.models import Message
+from src.naijacare.routing import RED_FLAGS, route_message
+
+
+def test_finds_overlapping_keywords():
+    matcher = KeywordMatcher(["he", "she", "his", "hers"])
+    assert matcher.find("ushers") == ["he", "she", "hers"]
+
+
+def test_matches_naive_substring_scan():
+    rng = random.Random(7)
+    keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(40)]
+    matcher = KeywordMatcher(keywords)
+    for _ in range(200):
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        assert matcher.find(text) == [k for k in keywords if k in text]
+
+
+def test_route_message_reports_flags_in_declaration_order():
+    msg = Message(sender="clinic_001", text="Severe bleeding, patient unresponsive")
+    decision = route_message(msg)
+    assert decision.decision == "ESCALATE_IMMEDIATELY"
+    assert decision.flags == [f for f in RED_FLAGS if f in msg.text.lower()]
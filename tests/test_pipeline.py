@@ -0,0 +1,65 @@
+"""Tests for the streaming JSONL pipeline."""
+
+import io
+import json
+
+import pytest
+
+from src.naijacare.audit import AuditLog
+from src.naijacare.pipeline import IngestError, iter_message_chunks, run_pipeline
+
+
+def jsonl(rows):
+    return io.BytesIO("".join(json.dumps(r) + "\n" for r in rows).encode())
+
+
+def test_chunks_are_bounded_and_skip_blank_lines():
+    source = io.BytesIO(b'{"sender": "a", "text": "fever"}\n\n{"sender": "b", "text": "hi"}\n'
+                        b'{"sender": "c", "text": "seizure"}\n')
+    chunks = list(iter_message_chunks(source, chunk_size=2))
+    assert [[m.sender for m in chunk] for chunk in chunks] == [["a"], ["b", "c"]]
+
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_chunk_size_must_be_positive(chunk_size):
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(iter_message_chunks(io.BytesIO(b'{"sender": "a", "text": "fever"}\n'), chunk_size))
+
+def test_invalid_line_reports_line_number():
+    source = io.BytesIO(b'{"sender": "a", "text": "fever"}\n{"sender": "b"}\n')
+    with pytest.raises(IngestError, match="Line 2"):
+        list(iter_message_chunks(source, chunk_size=10))
+
+
+def test_two_objects_on_one_line_are_rejected():
+    source = io.BytesIO(b'{"sender": "a", "text": "fever"}\n\n'
+                        b'{"sender": "b", "text": "hi"},{"sender": "c", "text": "ok"}\n')
+    with pytest.raises(IngestError, match="Line 3"):
+        list(iter_message_chunks(source, chunk_size=10))
+
+
+
+@pytest.mark.parametrize("lines", [
+    [b'{"sender":"a","text":"x"},{"sender":"b","text":"y","z":[1', b'2]}'],
+    [b'{"sender":"a","text":"fev', b'er"}'],
+])
+def test_values_spliced_across_lines_are_rejected(lines):
+    with pytest.raises(IngestError, match="Line 1"):
+        list(iter_message_chunks(io.BytesIO(b"\n".join(lines) + b"\n"), chunk_size=10))
+
+def test_pipeline_routes_audits_and_sinks_in_order():
+    rows = [{"sender": f"clinic_{i}", "text": t} for i, t in enumerate(["bleeding", "cough", "ok"])]
+    audit_log = AuditLog()
+    seen = []
+
+    count = run_pipeline(
+        jsonl(rows),
+        lambda messages, batch: seen.extend(batch.decision_name(i) for i in range(len(batch))),
+        audit_log,
+        chunk_size=2,
+    )
+
+    assert count == 3
+    assert seen == ["ESCALATE_IMMEDIATELY", "ROUTE_GENERAL", "NON_CLINICAL"]
+    assert [e.decision for e in audit_log.entries()] == seen
@@ -0,0 +1,22 @@
+"""Tests for multi-process replay."""
+
+from src.naijacare.models import Message
+from src.naijacare.replay import replay_parallel
+from src.naijacare.routing import route_message
+
+
+def test_parallel_replay_preserves_input_order():
+    messages = [
+        Message(sender=f"clinic_{i % 3}", text=text)
+        for i, text in enumerate(["Severe bleeding", "fever", "hello", "seizure now", "cough"] * 4)
+    ]
+    result = replay_parallel(messages, workers=2, chunk_size=3)
+
+    decisions = [batch.decision(i) for batch, i in result.iter_rows()]
+    assert decisions == [route_message(m) for m in messages]
+
+    entries = result.audit_log.entries()
+    assert [e.decision for e in entries] == [d.decision for d in decisions]
+    assert [e.message_length for e in entries] == [len(m.text) for m in messages]
+    assert result.stats.messages == len(messages)
+    assert all(0.0 <= share for share in result.stats.utilisation().values())
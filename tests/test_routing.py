@@ -2,7 +2,7 @@
 
 import pytest
 from src.naijacare.models import Message
-from src.naijacare.routing import route_message
+from src.naijacare.routing import route_message, route_messages
 
 
 def test_emergency_escalation():
@@ -25,3 +25,23 @@ def test_non_clinical():
     msg = Message(sender="clinic_001", text="Hello, testing system")
     decision = route_message(msg)
     assert decision.decision == "NON_CLINICAL"
+
+
+def test_batch_routing_matches_route_message():
+    """Test that the columnar batch API agrees with per-message routing."""
+    texts = [
+        "Patient unconscious after fall",
+        "Patient has fever and weakness",
+        "Hello, testing system",
+        "Severe bleeding",
+    ]
+    batch = route_messages(texts, ["clinic_001"] * len(texts))
+    assert len(batch) == len(texts)
+    for i, text in enumerate(texts):
+        assert batch.decision(i) == route_message(Message(sender="clinic_001", text=text))
+    assert batch.counts() == {"ESCALATE_IMMEDIATELY": 2, "ROUTE_GENERAL": 1, "NON_CLINICAL": 1}
+
+
+def test_batch_routing_rejects_misaligned_senders():
+    with pytest.raises(ValueError):
+        route_messages(["a", "b"], ["clinic_001"])
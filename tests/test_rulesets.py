@@ -0,0 +1,71 @@
+"""Tests for versioned rule sets."""
+
+import json
+
+import pytest
+
+from src.naijacare.consent import ConsentRecord
+from src.naijacare.models import Message
+from src.naijacare.routing import route_message, route_message_with_consent
+from src.naijacare.rulesets import (
+    BUILTIN_RULESET,
+    RuleSetError,
+    activate_ruleset,
+    get_active_ruleset,
+    load_ruleset,
+    reload_ruleset,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_builtin_rules():
+    yield
+    activate_ruleset(BUILTIN_RULESET)
+
+
+def write_rules(path, **overrides):
+    data = {"version": "v2", "red_flags": ["stroke"], "general_keywords": ["rash"]}
+    data.update(overrides)
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_reload_swaps_rules_and_records_version(tmp_path):
+    msg = Message(sender="clinic_001", text="Possible stroke")
+    assert route_message(msg).decision == "NON_CLINICAL"
+
+    reload_ruleset(write_rules(tmp_path / "rules.json"))
+
+    decision = route_message(msg)
+    assert decision.decision == "ESCALATE_IMMEDIATELY"
+    assert decision.flags == ["stroke"]
+    assert decision.ruleset_version == "v2"
+
+
+def test_invalid_rule_file_keeps_active_rules(tmp_path):
+    path = write_rules(tmp_path / "rules.json", red_flags="stroke")
+    with pytest.raises(RuleSetError):
+        reload_ruleset(path)
+    assert get_active_ruleset() is BUILTIN_RULESET
+
+
+@pytest.mark.parametrize("content", ["[]", '"v2"', "3"])
+def test_non_object_rule_file_is_rejected(tmp_path, content):
+    path = tmp_path / "rules.json"
+    path.write_text(content)
+    with pytest.raises(RuleSetError):
+        reload_ruleset(path)
+    assert get_active_ruleset() is BUILTIN_RULESET
+
+
+def test_consent_refusal_carries_ruleset_version():
+    consent = ConsentRecord(subject_id="p-1", age_years=30)
+    decision = route_message_with_consent(Message(sender="clinic_001", text="fever"), consent)
+    assert decision.reason.startswith("Consent invalid")
+    assert decision.ruleset_version == BUILTIN_RULESET.version
+
+
+def test_ruleset_is_immutable(tmp_path):
+    ruleset = load_ruleset(write_rules(tmp_path / "rules.json"))
+    with pytest.raises(AttributeError):
+        ruleset.version = "v3"
@@ -0,0 +1,98 @@
+"""Tests for the SQL-backed consent store."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.naijacare.consent import ConsentRecord, SQLConsentStore
+from src.naijacare.models.orm import ConsentRecord as ConsentRow
+from src.naijacare.models.orm import Patient
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    factory = sessionmaker(bind=engine, future=True)
+    SQLConsentStore(factory).create_schema()
+    return factory
+
+
+def make_record(subject_id, **kwargs):
+    record = ConsentRecord(subject_id=subject_id, age_years=30, **kwargs)
+    record.grant({"data_collection", "ai_processing"}, datetime(2026, 1, 1))
+    return record
+
+
+def count_rows(factory):
+    with factory() as session:
+        return session.scalar(select(func.count()).select_from(ConsentRow))
+
+
+def test_upserts_are_batched_and_survive_restart(session_factory):
+    store = SQLConsentStore(session_factory, batch_size=3)
+    store.upsert(make_record("patient-1", metadata={"clinic": "sokoto"}))
+    store.upsert(make_record("patient-2"))
+    assert store.pending == 2
+    assert count_rows(session_factory) == 0
+
+    store.upsert(make_record("patient-3"))
+    assert store.pending == 0
+    assert count_rows(session_factory) == 3
+
+    reloaded = SQLConsentStore(session_factory).get("patient-1")
+    assert reloaded.granted_scopes == {"data_collection", "ai_processing"}
+    assert reloaded.last_reconsent_at == datetime(2026, 1, 1)
+    assert reloaded.metadata == {"clinic": "sokoto"}
+
+
+def test_withdraw_flushes_synchronously(session_factory):
+    store = SQLConsentStore(session_factory, batch_size=100)
+    store.upsert(make_record("patient-1"))
+    store.withdraw("patient-1", datetime(2026, 2, 1))
+
+    other = SQLConsentStore(session_factory)
+    assert other.get("patient-1").withdrawn_at == datetime(2026, 2, 1)
+
+
+def test_reads_are_served_from_cache(session_factory):
+    store = SQLConsentStore(session_factory, cache_size=1)
+    store.upsert(make_record("patient-1"))
+    store.flush()
+    assert store.get("patient-1") is store.get("patient-1")
+    assert store.get("missing") is None
+
+
+def test_expiry_index_is_built_from_tables(session_factory):
+    writer = SQLConsentStore(session_factory)
+    writer.upsert(make_record("patient-1"))
+    writer.upsert(make_record("patient-2"))
+    writer.flush()
+    store = SQLConsentStore(session_factory)
+    due = store.due_for_reconsent(7, now=datetime(2026, 3, 30))
+    assert [subject for subject, _ in due] == ["patient-1", "patient-2"]
+    store.withdraw("patient-1")
+    assert [s for s, _ in store.due_for_reconsent(7, now=datetime(2026, 3, 30))] == [
+        "patient-2"
+    ]
+
+
+def test_writes_for_soft_deleted_subjects_are_dropped(session_factory):
+    store = SQLConsentStore(session_factory, batch_size=100)
+    store.upsert(make_record("patient-1"))
+    store.flush()
+    with session_factory() as session, session.begin():
+        session.execute(update(Patient).values(deleted_at=datetime(2026, 2, 1)))
+
+    store.upsert(make_record("patient-1", metadata={"late": "write"}))
+    store.upsert(make_record("patient-2"))
+    store.flush()
+    assert store.pending == 0 and store.get("patient-1") is None
+    with session_factory() as session:
+        rows = session.execute(select(Patient.external_reference, Patient.deleted_at)).all()
+        assert sorted(ref for ref, deleted_at in rows if deleted_at is None) == ["patient-2"]
+        assert len(rows) == 2
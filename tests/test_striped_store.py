@@ -0,0 +1,166 @@
+"""Concurrency tests for the lock-striped consent store."""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+from benchmarks.bench_striped import run as run_benchmark
+from src.naijacare.consent import ConsentRecord, StripedConsentStore
+from src.naijacare.consent.tracker import add_change_listener
+from src.naijacare.consent.validator import (
+    CONSENT_MISSING,
+    CONSENT_VALID,
+    CONSENT_WITHDRAWN,
+)
+
+NOW = datetime(2026, 6, 1)
+SCOPES = {"data_collection"}
+SUBJECTS = [f"patient-{i}" for i in range(50)]
+
+
+def make_store():
+    store = StripedConsentStore(shards=8)
+    for subject_id in SUBJECTS:
+        record = ConsentRecord(subject_id=subject_id, age_years=30, metadata={"n": "0"})
+        record.grant(SCOPES, NOW)
+        store.upsert(record)
+    return store
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_updates_are_not_lost():
+    store = make_store()
+
+    def bump(record):
+        record.metadata["n"] = str(int(record.metadata["n"]) + 1)
+
+    def worker(i):
+        for j in range(1000):
+            store.update(SUBJECTS[(i * 7 + j) % len(SUBJECTS)], bump)
+
+    run_threads(8, worker)
+    assert sum(int(store.get(s).metadata["n"]) for s in SUBJECTS) == 8000
+
+
+def test_checks_never_see_partial_state():
+    store = make_store()
+    stop = threading.Event()
+    seen = set()
+    torn = []
+
+    def toggle(record):
+        # Two-field change: a torn read would show withdrawn and re-granted mixed up.
+        if record.withdrawn_at is None:
+            record.withdrawn_at = NOW
+            record.granted_scopes.clear()
+        else:
+            record.withdrawn_at = None
+            record.granted_scopes.update(SCOPES)
+
+    def writer(i):
+        for j in range(2000):
+            store.update(SUBJECTS[j % len(SUBJECTS)], toggle)
+        stop.set()
+
+    def reader(i):
+        while not stop.is_set():
+            for subject_id in SUBJECTS:
+                seen.add(store.check(subject_id, SCOPES, NOW))
+                snapshot = store.get(subject_id)
+                if (snapshot.withdrawn_at is None) != bool(snapshot.granted_scopes):
+                    torn.append(subject_id)
+
+    run_threads(4, lambda i: writer(i) if i == 0 else reader(i))
+    assert seen <= {CONSENT_VALID, CONSENT_WITHDRAWN}
+    assert torn == []
+
+
+def test_snapshots_and_reconsent_queries():
+    store = make_store()
+    snapshot = store.get("patient-1")
+    snapshot.withdraw(NOW)
+    assert store.check("patient-1", SCOPES, NOW) == CONSENT_VALID
+    assert store.check("nobody", SCOPES, NOW) == CONSENT_MISSING
+    store.grant("patient-2", SCOPES, NOW + timedelta(days=5))
+    due = store.due_for_reconsent(0, now=NOW + timedelta(days=91))
+    assert len(due) == 49 and "patient-2" not in {s for s, _ in due}
+    assert [d for _, d in due] == sorted(d for _, d in due)
+
+
+class ChangeCounter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+
+    def __call__(self, subject_id):
+        with self.lock:
+            self.counts[subject_id] += 1
+
+
+def test_update_notifies_listeners_once():
+    store = make_store()
+    counter = ChangeCounter()
+    add_change_listener(counter.__call__)
+    store.grant("patient-1", SCOPES, NOW)
+    store.withdraw("patient-2", NOW)
+    store.update("patient-3", lambda record: None)
+    assert counter.counts == {"patient-1": 1, "patient-2": 1, "patient-3": 1}
+
+
+def test_mixed_workload_stress():
+    store = StripedConsentStore(shards=4)
+    for subject_id in SUBJECTS:
+        store.upsert(ConsentRecord(subject_id=subject_id, age_years=30, metadata={"n": "0"}))
+    counter = ChangeCounter()
+    add_change_listener(counter.__call__)
+    mutations = Counter()
+    mutations_lock = threading.Lock()
+
+    def bump(record):
+        record.metadata["n"] = str(int(record.metadata["n"]) + 1)
+
+    def worker(i):
+        done = Counter()
+        for j in range(500):
+            subject_id = SUBJECTS[(i * 13 + j * 7) % len(SUBJECTS)]
+            op = (i + j) % 4
+            if op == 0:
+                store.grant(subject_id, SCOPES, NOW + timedelta(minutes=j))
+            elif op == 1:
+                store.withdraw(subject_id, NOW)
+            elif op == 2:
+                store.update(subject_id, bump)
+            else:
+                assert store.check(subject_id, SCOPES, NOW) in {
+                    CONSENT_MISSING, CONSENT_VALID, CONSENT_WITHDRAWN
+                }
+                continue
+            done[subject_id] += 1
+        with mutations_lock:
+            mutations.update(done)
+
+    run_threads(16, worker)
+    assert len(store) == len(SUBJECTS)
+    assert counter.counts == mutations
+    bumps = sum(int(store.get(s).metadata["n"]) for s in SUBJECTS)
+    assert bumps == 16 * 500 // 4
+    due = dict(store.due_for_reconsent(10_000, now=NOW))
+    expected = {s: store.get(s).reconsent_due_at for s in SUBJECTS}
+    assert due == {s: d for s, d in expected.items() if d is not None}
+
+
+def test_throughput_benchmark_runs_under_contention():
+    subject_ids = SUBJECTS[:5]
+    for shards in (1, 8):
+        store = StripedConsentStore(shards)
+        for subject_id in subject_ids:
+            store.upsert(ConsentRecord(subject_id=subject_id, age_years=30))
+        assert run_benchmark(store, subject_ids, threads=8, ops_per_thread=200) > 0
+        assert all(store.get(s).consented_at is not None for s in subject_ids)